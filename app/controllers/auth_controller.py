@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.errors import OverloadedError
+from app.db.session import get_async_db, get_db
 from app.schemas.auth import DevTokenRequest, DevTokenResponse, LoginRequest, LoginResponse
 from app.services.auth_service import issue_dev_token, login_with_id_pw
 
@@ -14,9 +16,13 @@ router = APIRouter(prefix="/auth", tags=["인증"])
     summary="아이디/비밀번호 로그인",
     description="사용자 아이디와 비밀번호를 검증한 뒤 Bearer JWT를 발급합니다.",
     response_description="로그인 성공/실패 결과",
+    responses={503: {"description": "비밀번호 검증 대기열이 가득 참"}},
 )
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
-    return login_with_id_pw(db=db, user_id=payload.id, password=payload.pw)
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)) -> LoginResponse:
+    try:
+        return await login_with_id_pw(db=db, user_id=payload.id, password=payload.pw)
+    except OverloadedError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
 
 
 @router.post(
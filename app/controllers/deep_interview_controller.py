@@ -40,13 +40,13 @@ insight_router = APIRouter(prefix="/v1/deep-interview", tags=["심층인터뷰"]
     response_description="세션 생성 결과와 첫 질문",
     responses={404: {"description": "프로젝트를 찾을 수 없음"}},
 )
-def start_deep_interview_endpoint(
+async def start_deep_interview_endpoint(
     payload: DeepInterviewStartRequest,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> DeepInterviewStartResponse:
     try:
-        return start_deep_interview(db=db, user_id=user_id, payload=payload)
+        return await start_deep_interview(db=db, user_id=user_id, payload=payload)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -59,13 +59,13 @@ def start_deep_interview_endpoint(
     response_description="다음 질문 또는 완료 상태",
     responses={404: {"description": "세션을 찾을 수 없음"}},
 )
-def answer_deep_interview_endpoint(
+async def answer_deep_interview_endpoint(
     payload: DeepInterviewAnswerRequest,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> DeepInterviewAnswerResponse:
     try:
-        return submit_deep_interview_answer(
+        return await submit_deep_interview_answer(
             db=db,
             user_id=user_id,
             session_id=payload.sessionId,
@@ -105,13 +105,13 @@ def get_deep_interview_session_endpoint(
     response_description="개선 가이드 섹션",
     responses={404: {"description": "세션을 찾을 수 없음"}},
 )
-def generate_guide_endpoint(
+async def generate_guide_endpoint(
     payload: DeepInterviewGuideRequest,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> DeepInterviewGuideResponse:
     try:
-        return generate_deep_interview_guide(
+        return await generate_deep_interview_guide(
             db=db,
             user_id=user_id,
             session_id=payload.sessionId,
@@ -128,12 +128,12 @@ def generate_guide_endpoint(
     response_description="심층 인터뷰 인사이트 문서",
     responses={404: {"description": "세션을 찾을 수 없음"}},
 )
-def get_insight_doc_endpoint(
+async def get_insight_doc_endpoint(
     session_id: UUID,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> InsightDocResponse:
     try:
-        return get_deep_interview_insight_doc(db=db, user_id=user_id, session_id=session_id)
+        return await get_deep_interview_insight_doc(db=db, user_id=user_id, session_id=session_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
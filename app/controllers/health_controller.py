@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
-from app.schemas.health import HealthResponse
-from app.services.health_service import get_health
+from app.schemas.health import HealthResponse, MetricsResponse
+from app.services.health_service import get_health, get_metrics
 
 router = APIRouter(tags=["health"])
 
@@ -17,3 +17,15 @@ router = APIRouter(tags=["health"])
 def health() -> HealthResponse:
     # Controller stays thin: delegate to service
     return get_health()
+
+
+@router.get(
+    "/metrics",
+    response_model=MetricsResponse,
+    tags=["헬스체크"],
+    summary="프로세스 메트릭",
+    description="현재 프로세스에서 수집한 카운터와 관측값 요약을 조회합니다.",
+    response_description="메트릭 스냅샷",
+)
+def metrics() -> MetricsResponse:
+    return get_metrics()
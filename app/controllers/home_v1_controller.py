@@ -1,28 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import CurrentUserId
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.schemas.home import HomeResponse
-from app.services.home_service import get_home_data
+from app.services.home_service import get_home_snapshot
 
 router = APIRouter(prefix="/v1", tags=["홈"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get(
     "/home",
     response_model=HomeResponse,
     summary="홈 화면 데이터 조회",
     description="사용자 카드, 프로젝트 목록, 오늘의 루틴을 한 번에 조회합니다.",
     response_description="홈 화면 렌더링 데이터",
-    responses={401: {"description": "인증 실패"}},
+    responses={
+        304: {"description": "If-None-Match와 ETag가 일치함"},
+        401: {"description": "인증 실패"},
+    },
 )
-def get_home_endpoint(
-    db: Session = Depends(get_db),
+async def get_home_endpoint(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
-) -> HomeResponse:
+) -> HomeResponse | Response:
     try:
-        return get_home_data(db=db, user_id=user_id)
+        snapshot = await get_home_snapshot(db=db, user_id=user_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return snapshot.response
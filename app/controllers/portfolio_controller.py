@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+import uuid
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 
 from app.core.auth import CurrentUserId
@@ -8,6 +10,7 @@ from app.services.portfolio_service import (
     delete_portfolio,
     get_portfolio,
     list_portfolios,
+    request_portfolio_sync,
     upload_portfolio,
 )
 
@@ -27,6 +30,7 @@ async def upload_portfolio_endpoint(
     ),
     source_url: str | None = Form(None, description="노션/블로그 URL (notion/blog인 경우 필수)"),
     pdf_file: UploadFile | None = File(None, description="PDF 파일 (pdf인 경우 필수)"),
+    project_id: uuid.UUID | None = Form(None, description="귀속할 프로젝트 ID"),
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> PortfolioResponse:
@@ -43,13 +47,17 @@ async def upload_portfolio_endpoint(
     if source_type_enum == PortfolioSourceType.PDF and not pdf_file:
         raise HTTPException(status_code=400, detail="PDF file is required")
 
-    return await upload_portfolio(
-        db=db,
-        user_id=user_id,
-        source_type=source_type_enum,
-        source_url=source_url,
-        pdf_file=pdf_file,
-    )
+    try:
+        return await upload_portfolio(
+            db=db,
+            user_id=user_id,
+            source_type=source_type_enum,
+            source_url=source_url,
+            pdf_file=pdf_file,
+            project_id=project_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get(
@@ -74,21 +82,56 @@ async def get_portfolio_endpoint(
     "/",
     response_model=PortfolioListResponse,
     summary="포트폴리오 목록 조회",
-    description="사용자 포트폴리오 목록을 조회하며 project_id 필터를 지원합니다.",
+    description=(
+        "사용자 포트폴리오 목록을 조회하며 project_id 필터를 지원합니다. "
+        "next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다."
+    ),
     response_description="포트폴리오 목록",
 )
 async def list_portfolios_endpoint(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = None,
+    offset: int = Query(default=0, ge=0),
+    with_total: bool = True,
+    project_id: uuid.UUID | None = None,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> PortfolioListResponse:
-    return await list_portfolios(
-        db=db,
-        user_id=user_id,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        return await list_portfolios(
+            db=db,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            project_id=project_id,
+            cursor=cursor,
+            with_total=with_total,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post(
+    "/{portfolio_id}/sync",
+    summary="포트폴리오 재수집",
+    description=(
+        "노션/블로그 포트폴리오 본문 재수집을 큐에 등록합니다. "
+        "노션은 마지막 수집 이후 수정된 페이지만 다시 가져옵니다."
+    ),
+    response_description="재수집 등록 결과",
+)
+async def sync_portfolio_endpoint(
+    portfolio_id: int,
+    db: Session = Depends(get_db),
+    user_id: int = CurrentUserId,
+):
+    try:
+        queued = await request_portfolio_sync(db=db, portfolio_id=portfolio_id, user_id=user_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if not queued:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    return {"message": "Portfolio sync queued"}
 
 
 @router.delete(
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import CurrentUserId
 from app.core.errors import NotFoundError
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.schemas.project import (
     ProjectCreateRequest,
     ProjectListResponse,
@@ -29,28 +29,43 @@ router = APIRouter(prefix="/v2/projects", tags=["프로젝트 코어(v2)"])
     description="프로젝트 코어 API로 프로젝트를 생성합니다.",
     response_description="생성된 프로젝트 데이터",
 )
-def create_project_endpoint(
+async def create_project_endpoint(
     payload: ProjectCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> ProjectResponse:
-    return create_user_project(db=db, user_id=user_id, payload=payload)
+    return await create_user_project(db=db, user_id=user_id, payload=payload)
 
 
 @router.get(
     "",
     response_model=ProjectListResponse,
     summary="(v2) 프로젝트 목록",
-    description="프로젝트 코어 API로 사용자 프로젝트 목록을 조회합니다.",
+    description=(
+        "프로젝트 코어 API로 사용자 프로젝트 목록을 조회합니다. "
+        "next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다."
+    ),
     response_description="프로젝트 목록",
 )
-def list_projects_endpoint(
-    limit: int = 50,
-    offset: int = 0,
-    db: Session = Depends(get_db),
+async def list_projects_endpoint(
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = None,
+    offset: int = Query(default=0, ge=0),
+    with_total: bool = True,
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> ProjectListResponse:
-    return list_user_projects(db=db, user_id=user_id, limit=limit, offset=offset)
+    try:
+        return await list_user_projects(
+            db=db,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            with_total=with_total,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get(
@@ -60,13 +75,13 @@ def list_projects_endpoint(
     description="프로젝트 코어 API로 프로젝트 단건을 조회합니다.",
     response_description="프로젝트 단건 데이터",
 )
-def get_project_endpoint(
+async def get_project_endpoint(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> ProjectResponse:
     try:
-        return get_user_project(db=db, user_id=user_id, project_id=project_id)
+        return await get_user_project(db=db, user_id=user_id, project_id=project_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -78,14 +93,14 @@ def get_project_endpoint(
     description="프로젝트 코어 API로 프로젝트 상태/진행률/기본 정보를 수정합니다.",
     response_description="수정된 프로젝트 데이터",
 )
-def patch_project_endpoint(
+async def patch_project_endpoint(
     project_id: UUID,
     payload: ProjectUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> ProjectResponse:
     try:
-        return patch_user_project(
+        return await patch_user_project(
             db=db,
             user_id=user_id,
             project_id=project_id,
@@ -1,11 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.auth import CurrentUserId
 from app.core.errors import NotFoundError
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.schemas.projects_v1 import (
     PortfolioCreateRequest,
     PortfolioCreateResponse,
@@ -17,13 +18,13 @@ from app.schemas.projects_v1 import (
     RoutineToggleRequest,
     RoutineToggleResponse,
 )
-from app.services.portfolio_crawl_service import crawl_blog_portfolios_background
+from app.services.crawl_job_service import enqueue_portfolio_crawl
 from app.services.projects_v1_service import (
     create_portfolio_item_v1,
     create_project_v1,
     get_project_dashboard,
     patch_project_portfolio,
-    pick_blog_portfolio_ids,
+    pick_crawlable_portfolio_ids,
     toggle_routine_item,
 )
 
@@ -45,22 +46,16 @@ routine_router = APIRouter(prefix="/v1", tags=["루틴"])
 )
 def create_project_endpoint(
     payload: ProjectCreateV1Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> ProjectCreateV1Response:
     response = create_project_v1(db=db, user_id=user_id, payload=payload)
-    blog_portfolio_ids = pick_blog_portfolio_ids(
+    crawl_portfolio_ids = pick_crawlable_portfolio_ids(
         db=db,
         user_id=user_id,
         portfolio_ids=response.portfolioIds,
     )
-    if blog_portfolio_ids:
-        background_tasks.add_task(
-            crawl_blog_portfolios_background,
-            user_id,
-            blog_portfolio_ids,
-        )
+    enqueue_portfolio_crawl(db=db, user_id=user_id, portfolio_ids=crawl_portfolio_ids)
     return response
 
 
@@ -72,13 +67,13 @@ def create_project_endpoint(
     response_description="프로젝트 상세 대시보드 데이터",
     responses={404: {"description": "프로젝트를 찾을 수 없음"}},
 )
-def get_project_dashboard_endpoint(
+async def get_project_dashboard_endpoint(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> ProjectDashboardResponse:
     try:
-        return get_project_dashboard(db=db, user_id=user_id, project_id=project_id)
+        return await get_project_dashboard(db=db, user_id=user_id, project_id=project_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
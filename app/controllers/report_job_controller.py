@@ -0,0 +1,87 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.auth import CurrentUserId
+from app.core.errors import NotFoundError
+from app.db.session import get_db
+from app.schemas.report_job import ReportJobCreateRequest, ReportJobResponse
+from app.services.report_job_service import (
+    enqueue_report_job,
+    get_report_job,
+    stream_report_job_events,
+)
+
+router = APIRouter(prefix="/v1/report-jobs", tags=["리포트작업"])
+
+
+@router.post(
+    "",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="리포트 생성 작업 등록",
+    description=(
+        "시뮬레이션 결과/심층 인터뷰 가이드/인사이트/세션 분석 생성을 백그라운드 작업으로 "
+        "등록하고 작업 ID를 즉시 반환합니다. 결과는 폴링 또는 SSE로 받습니다."
+    ),
+    response_description="등록된 작업 정보",
+    responses={404: {"description": "세션을 찾을 수 없음"}},
+)
+def create_report_job_endpoint(
+    payload: ReportJobCreateRequest,
+    db: Session = Depends(get_db),
+    user_id: int = CurrentUserId,
+) -> ReportJobResponse:
+    try:
+        return enqueue_report_job(
+            db=db,
+            user_id=user_id,
+            job_type=payload.jobType,
+            session_id=payload.sessionId,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ReportJobResponse,
+    summary="리포트 작업 상태 조회",
+    description="작업 상태를 조회합니다. 완료되면 result에 리포트 데이터가 포함됩니다.",
+    response_description="작업 상태 및 결과",
+    responses={404: {"description": "작업을 찾을 수 없음"}},
+)
+def get_report_job_endpoint(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    user_id: int = CurrentUserId,
+) -> ReportJobResponse:
+    try:
+        return get_report_job(db=db, user_id=user_id, job_id=job_id)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@router.get(
+    "/{job_id}/events",
+    summary="리포트 작업 상태 스트림",
+    description="작업 상태가 바뀔 때마다 SSE(status 이벤트)로 전송하고 완료/실패 시 종료합니다.",
+    response_description="text/event-stream",
+    responses={404: {"description": "작업을 찾을 수 없음"}},
+)
+def stream_report_job_endpoint(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    user_id: int = CurrentUserId,
+) -> StreamingResponse:
+    try:
+        get_report_job(db=db, user_id=user_id, job_id=job_id)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return StreamingResponse(
+        stream_report_job_events(user_id=user_id, job_id=job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
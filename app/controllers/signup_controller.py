@@ -1,9 +1,10 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.core.errors import OverloadedError
+from app.db.session import get_async_db
 from app.schemas.auth import SignupRequest, SignupResponse
 from app.services.signup_service import SignupService
 
@@ -17,11 +18,14 @@ logger = logging.getLogger(__name__)
     summary="회원가입",
     description="새 사용자 계정을 생성합니다.",
     response_description="회원가입 결과",
+    responses={503: {"description": "비밀번호 해시 대기열이 가득 참"}},
 )
-def signup(req: SignupRequest, db: Session = Depends(get_db)):
+async def signup(req: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     service = SignupService(db)
     try:
-        return service.signup(req)
+        return await service.signup(req)
+    except OverloadedError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
     except ValueError as exc:
         logger.warning("Signup validation failed: %s", exc)
         raise HTTPException(status_code=422, detail=str(exc)) from exc
@@ -1,11 +1,13 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.auth import CurrentUserId
 from app.core.errors import NotFoundError
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.schemas.simulation_v1 import (
     SimulationPreviewResponse,
     SimulationResultResponse,
@@ -20,6 +22,7 @@ from app.services.simulation_v1_service import (
     get_simulation_preview,
     get_simulation_result_v1,
     get_simulation_session_v1,
+    open_simulation_turn_stream,
     start_simulation_v1,
 )
 
@@ -45,14 +48,14 @@ def get_simulation_preview_endpoint(project_id: UUID) -> SimulationPreviewRespon
     response_description="생성된 시뮬레이션 세션 정보",
     responses={404: {"description": "프로젝트를 찾을 수 없음"}},
 )
-def start_simulation_v1_endpoint(
+async def start_simulation_v1_endpoint(
     project_id: UUID,
     payload: SimulationV1StartRequest,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> SimulationV1StartResponse:
     try:
-        return start_simulation_v1(
+        return await start_simulation_v1(
             db=db,
             user_id=user_id,
             project_id=project_id,
@@ -89,14 +92,44 @@ def get_simulation_session_v1_endpoint(
     response_description="추가된 메시지 및 종료 여부",
     responses={404: {"description": "세션을 찾을 수 없음"}},
 )
-def append_simulation_turn_v1_endpoint(
+async def append_simulation_turn_v1_endpoint(
     session_id: UUID,
     payload: SimulationTurnRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = CurrentUserId,
 ) -> SimulationTurnResponse:
     try:
-        return append_simulation_turn_v1(
+        return await append_simulation_turn_v1(
+            db=db,
+            user_id=user_id,
+            session_id=session_id,
+            text=payload.text,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post(
+    "/simulations/sessions/{session_id}/turns/stream",
+    summary="시뮬레이션 턴 진행 (스트리밍)",
+    description=(
+        "사용자 메시지를 저장하고 NPC 메시지를 생성되는 즉시 SSE로 전송합니다. "
+        "각 NPC 메시지는 message 이벤트로, 저장이 끝난 최종 응답은 done 이벤트"
+        "(턴 진행 응답과 동일한 형식)로 전달됩니다."
+    ),
+    response_description="text/event-stream",
+    responses={404: {"description": "세션을 찾을 수 없음"}},
+)
+async def stream_simulation_turn_v1_endpoint(
+    session_id: UUID,
+    payload: SimulationTurnRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int = CurrentUserId,
+) -> StreamingResponse:
+    try:
+        events = await open_simulation_turn_stream(
             db=db,
             user_id=user_id,
             session_id=session_id,
@@ -106,6 +139,11 @@ def append_simulation_turn_v1_endpoint(
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -116,13 +154,13 @@ def append_simulation_turn_v1_endpoint(
     response_description="시뮬레이션 결과 데이터",
     responses={404: {"description": "세션을 찾을 수 없음"}},
 )
-def get_simulation_result_v1_endpoint(
+async def get_simulation_result_v1_endpoint(
     session_id: UUID,
     db: Session = Depends(get_db),
     user_id: int = CurrentUserId,
 ) -> SimulationResultResponse:
     try:
-        return get_simulation_result_v1(db=db, user_id=user_id, session_id=session_id)
+        return await get_simulation_result_v1(db=db, user_id=user_id, session_id=session_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -1,10 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
-from app.db.repositories.user_repository import get_user_by_user_id
-from app.db.session import get_db
+from app.db.repositories.user_repository import aget_user_by_user_id
+from app.db.session import get_async_session_local
 
 try:
     import jwt as pyjwt
@@ -16,11 +16,35 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency in local e
 
 
 _bearer_scheme = HTTPBearer(auto_error=False)
+_user_pk_cache: TTLCache[str, int] | None = None
 
 
-def get_current_user_id(
+def _get_user_pk_cache() -> TTLCache[str, int]:
+    global _user_pk_cache
+    if _user_pk_cache is None:
+        settings = get_settings()
+        _user_pk_cache = TTLCache(
+            max_entries=settings.auth_user_cache_max_entries,
+            ttl_sec=settings.auth_user_cache_ttl_sec,
+        )
+    return _user_pk_cache
+
+
+async def _resolve_user_pk(subject: str) -> int | None:
+    cache = _get_user_pk_cache()
+    user_pk = cache.get(subject)
+    if user_pk is not None:
+        return user_pk
+    async with get_async_session_local()() as db:
+        user = await aget_user_by_user_id(db=db, user_id=subject)
+    if user is None:
+        return None
+    cache.set(subject, user.id)
+    return user.id
+
+
+async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
-    db: Session = Depends(get_db),
 ) -> int:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise HTTPException(
@@ -59,13 +83,17 @@ def get_current_user_id(
             detail="Invalid token subject",
         )
 
-    user = get_user_by_user_id(db=db, user_id=subject)
-    if user is None:
+    claimed_pk = payload.get("uid")
+    if isinstance(claimed_pk, int):
+        return claimed_pk
+
+    user_pk = await _resolve_user_pk(subject)
+    if user_pk is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    return user.id
+    return user_pk
 
 
 CurrentUserId = Depends(get_current_user_id)
@@ -0,0 +1,47 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """Thread-safe in-process LRU cache whose entries expire after ``ttl_sec``."""
+
+    def __init__(self, max_entries: int, ttl_sec: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_sec = ttl_sec
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl_sec: float | None = None) -> None:
+        expires_at = time.monotonic() + (self._ttl_sec if ttl_sec is None else ttl_sec)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -25,15 +25,73 @@ class Settings(BaseSettings):
     supabase_db_password: str | None = Field(default=None, alias="SUPABASE_DB_PASSWORD")
 
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_sec: int = Field(default=1800, alias="DB_POOL_RECYCLE_SEC")
+    db_pool_timeout_sec: float = Field(default=30.0, alias="DB_POOL_TIMEOUT_SEC")
+    db_pool_pre_ping: bool = Field(default=False, alias="DB_POOL_PRE_PING")
+    db_prepare_threshold: int | None = Field(default=5, alias="DB_PREPARE_THRESHOLD")
+    db_transaction_pooling: bool | None = Field(default=None, alias="DB_TRANSACTION_POOLING")
 
     gemini_api_key: str | None = Field(default=None, alias="GEMINI_API_KEY")
     gemini_model: str = Field(default="models/gemini-2.5-flash", alias="GEMINI_MODEL")
+    gemini_timeout_sec: float = Field(default=30.0, alias="GEMINI_TIMEOUT_SEC")
+    gemini_connect_timeout_sec: float = Field(default=5.0, alias="GEMINI_CONNECT_TIMEOUT_SEC")
+    gemini_max_connections: int = Field(default=20, alias="GEMINI_MAX_CONNECTIONS")
+    gemini_max_keepalive_connections: int = Field(
+        default=10, alias="GEMINI_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    gemini_keepalive_expiry_sec: float = Field(default=60.0, alias="GEMINI_KEEPALIVE_EXPIRY_SEC")
+
+    llm_cache_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    llm_cache_max_entries: int = Field(default=512, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_sec: int = Field(default=86400, alias="LLM_CACHE_TTL_SEC")
+    llm_cache_db_enabled: bool = Field(default=False, alias="LLM_CACHE_DB_ENABLED")
+
+    project_context_cache_max_entries: int = Field(
+        default=256, alias="PROJECT_CONTEXT_CACHE_MAX_ENTRIES"
+    )
+    project_context_cache_ttl_sec: int = Field(default=300, alias="PROJECT_CONTEXT_CACHE_TTL_SEC")
+    home_snapshot_max_entries: int = Field(default=1024, alias="HOME_SNAPSHOT_MAX_ENTRIES")
+    home_snapshot_ttl_sec: int = Field(default=60, alias="HOME_SNAPSHOT_TTL_SEC")
+
+    report_job_workers: int = Field(default=2, alias="REPORT_JOB_WORKERS")
+    report_job_poll_interval_sec: float = Field(default=2.0, alias="REPORT_JOB_POLL_INTERVAL_SEC")
+    report_job_max_attempts: int = Field(default=2, alias="REPORT_JOB_MAX_ATTEMPTS")
+    report_job_lease_sec: int = Field(default=300, alias="REPORT_JOB_LEASE_SEC")
+
+    crawl_max_concurrency: int = Field(default=8, alias="CRAWL_MAX_CONCURRENCY")
+    crawl_per_host_concurrency: int = Field(default=2, alias="CRAWL_PER_HOST_CONCURRENCY")
+    crawl_timeout_sec: float = Field(default=20.0, alias="CRAWL_TIMEOUT_SEC")
+    crawl_max_connections: int = Field(default=20, alias="CRAWL_MAX_CONNECTIONS")
+    crawl_max_bytes: int = Field(default=2_000_000, alias="CRAWL_MAX_BYTES")
+    html_extract_backend: str = Field(default="auto", alias="HTML_EXTRACT_BACKEND")
+    crawl_job_batch_size: int = Field(default=8, alias="CRAWL_JOB_BATCH_SIZE")
+    crawl_job_poll_interval_sec: float = Field(default=2.0, alias="CRAWL_JOB_POLL_INTERVAL_SEC")
+    crawl_job_max_attempts: int = Field(default=3, alias="CRAWL_JOB_MAX_ATTEMPTS")
+    crawl_job_lease_sec: int = Field(default=300, alias="CRAWL_JOB_LEASE_SEC")
+    crawl_job_retry_base_sec: int = Field(default=30, alias="CRAWL_JOB_RETRY_BASE_SEC")
+    pdf_extract_workers: int = Field(default=2, alias="PDF_EXTRACT_WORKERS")
+    pdf_extract_max_pools: int = Field(default=2, alias="PDF_EXTRACT_MAX_POOLS")
+    pdf_max_bytes: int = Field(default=20_000_000, alias="PDF_MAX_BYTES")
+    pdf_max_pages: int = Field(default=50, alias="PDF_MAX_PAGES")
+    pdf_page_timeout_sec: float = Field(default=10.0, alias="PDF_PAGE_TIMEOUT_SEC")
+    notion_api_key: str | None = Field(default=None, alias="NOTION_API_KEY")
+    notion_api_base_url: str = Field(default="https://api.notion.com", alias="NOTION_API_BASE_URL")
+    notion_timeout_sec: float = Field(default=20.0, alias="NOTION_TIMEOUT_SEC")
+    notion_max_concurrency: int = Field(default=3, alias="NOTION_MAX_CONCURRENCY")
+    notion_max_pages: int = Field(default=50, alias="NOTION_MAX_PAGES")
 
     jwt_secret_key: str = Field(default="dev-secret-change-me", alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
     jwt_access_token_expire_minutes: int = Field(
         default=60, alias="JWT_ACCESS_TOKEN_EXPIRE_MINUTES"
     )
+    auth_user_cache_max_entries: int = Field(default=10000, alias="AUTH_USER_CACHE_MAX_ENTRIES")
+    auth_user_cache_ttl_sec: int = Field(default=300, alias="AUTH_USER_CACHE_TTL_SEC")
+    password_hash_rounds: int = Field(default=29000, alias="PASSWORD_HASH_ROUNDS")
+    password_hash_workers: int = Field(default=2, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_pending: int = Field(default=32, alias="PASSWORD_HASH_MAX_PENDING")
 
     @field_validator("gemini_api_key", mode="before")
     @classmethod
@@ -0,0 +1,56 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+_lock = threading.Lock()
+_counters: dict[str, float] = {}
+_summaries: dict[str, dict[str, float]] = {}
+_gauges: dict[str, Callable[[], float]] = {}
+
+
+def _metric_key(name: str, labels: dict[str, Any]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={labels[key]}" for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+def increment(name: str, value: float = 1, **labels: Any) -> None:
+    key = _metric_key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    key = _metric_key(name, labels)
+    with _lock:
+        summary = _summaries.get(key)
+        if summary is None:
+            _summaries[key] = {"count": 1, "sum": value, "max": value, "last": value}
+            return
+        summary["count"] += 1
+        summary["sum"] += value
+        summary["max"] = max(summary["max"], value)
+        summary["last"] = value
+
+
+def register_gauge(name: str, read: Callable[[], float], **labels: Any) -> None:
+    with _lock:
+        _gauges[_metric_key(name, labels)] = read
+
+
+def snapshot() -> dict[str, Any]:
+    with _lock:
+        gauges = dict(_gauges)
+        data = {
+            "counters": dict(_counters),
+            "summaries": {key: dict(value) for key, value in _summaries.items()},
+        }
+    data["gauges"] = {key: float(read()) for key, read in gauges.items()}
+    return data
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _summaries.clear()
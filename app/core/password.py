@@ -1,31 +1,91 @@
+import asyncio
 import hashlib
 import hmac
-from typing import cast
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Any, cast
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.errors import OverloadedError
 
 try:
     from passlib.context import CryptContext
 except ModuleNotFoundError:  # pragma: no cover - optional dependency in local env.
     CryptContext = None
 
-_pwd_context = (
-    CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto") if CryptContext is not None else None
-)
+_executor: ProcessPoolExecutor | None = None
+_pending = 0
+
+
+@cache
+def _get_pwd_context() -> Any:
+    if CryptContext is None:
+        return None
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=get_settings().password_hash_rounds,
+    )
 
 
 def hash_password(password: str) -> str:
-    if _pwd_context is not None:
-        return cast(str, _pwd_context.hash(password))
+    pwd_context = _get_pwd_context()
+    if pwd_context is not None:
+        return cast(str, pwd_context.hash(password))
     digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
     return f"sha256${digest}"
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
-    if _pwd_context is not None:
+    pwd_context = _get_pwd_context()
+    if pwd_context is not None:
         try:
-            return cast(bool, _pwd_context.verify(password, hashed_password))
+            return cast(bool, pwd_context.verify(password, hashed_password))
         except Exception:
             return False
     if not hashed_password.startswith("sha256$"):
         return False
     digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
     return hmac.compare_digest(hashed_password, f"sha256${digest}")
+
+
+def _get_executor() -> ProcessPoolExecutor | None:
+    global _executor
+    workers = get_settings().password_hash_workers
+    if _executor is None and workers > 0:
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        metrics.register_gauge("password_hash_pending", lambda: _pending)
+    return _executor
+
+
+async def _offload[T](func: Callable[..., T], *args: Any) -> T:
+    global _pending
+    if _pending >= get_settings().password_hash_max_pending:
+        metrics.increment("password_hash_rejected")
+        raise OverloadedError("Password hashing queue is full")
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), func, *args)
+    finally:
+        _pending -= 1
+
+
+async def ahash_password(password: str) -> str:
+    return await _offload(hash_password, password)
+
+
+async def averify_password(password: str, hashed_password: str) -> bool:
+    return await _offload(verify_password, password, hashed_password)
+
+
+def close_password_hasher() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
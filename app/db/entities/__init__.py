@@ -1,3 +1,5 @@
+from app.db.entities.crawl_job import CrawlJob
+from app.db.entities.llm_cache import LLMResponseCache
 from app.db.entities.portfolio import Portfolio
 from app.db.entities.portfolio_analysis import PortfolioAnalysis
 from app.db.entities.project import (
@@ -9,17 +11,21 @@ from app.db.entities.project import (
     ResumeParagraph,
     RoutineItem,
 )
+from app.db.entities.report_job import ReportJob
 from app.db.entities.session_v2 import SessionTurn, UnifiedSession
 from app.db.entities.simulation import SimulationLog, SimulationSession
 from app.db.entities.user import User
 
 __all__ = [
+    "CrawlJob",
+    "LLMResponseCache",
     "PortfolioItem",
     "Portfolio",
     "PortfolioAnalysis",
     "Project",
     "ProjectJobPosting",
     "ProjectPortfolio",
+    "ReportJob",
     "Resume",
     "ResumeParagraph",
     "RoutineItem",
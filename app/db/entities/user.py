@@ -16,6 +16,8 @@ class User(Base):
     target_role: Mapped[str | None] = mapped_column(String(120), nullable=True)
     coach_status: Mapped[str] = mapped_column(String(20), nullable=False, default="COACHING")
     avatar_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Plaintext Notion integration token; never serialize it back to clients.
+    notion_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
@@ -0,0 +1,82 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+@dataclass
+class Page[T]:
+    items: list[T]
+    total: int | None
+    next_cursor: str | None
+
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor[K](cursor: str, id_type: Callable[[str], K]) -> tuple[datetime, K]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), id_type(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+@dataclass(frozen=True)
+class Keyset:
+    created_at_column: InstrumentedAttribute[Any]
+    id_column: InstrumentedAttribute[Any]
+    limit: int
+    after: tuple[datetime, Any] | None = None
+    offset: int = 0
+    with_total: bool = True
+
+    @classmethod
+    def from_cursor(
+        cls,
+        created_at_column: InstrumentedAttribute[Any],
+        id_column: InstrumentedAttribute[Any],
+        id_type: Callable[[str], Any],
+        limit: int,
+        cursor: str | None,
+        offset: int = 0,
+        with_total: bool = True,
+    ) -> "Keyset":
+        after = decode_cursor(cursor, id_type) if cursor else None
+        return cls(created_at_column, id_column, limit, after, offset, with_total)
+
+    @property
+    def counted(self) -> bool:
+        return self.with_total and self.after is None
+
+    def apply(self, stmt: Select) -> Select:
+        if self.after is not None:
+            stmt = stmt.where(tuple_(self.created_at_column, self.id_column) < tuple_(*self.after))
+        elif self.offset:
+            stmt = stmt.offset(self.offset)
+        if self.counted:
+            stmt = stmt.add_columns(func.count().over().label("total"))
+        order = (self.created_at_column.desc(), self.id_column.desc())
+        return stmt.order_by(*order).limit(self.limit + 1)
+
+    def page[T](self, rows: Sequence[Any]) -> Page[T]:
+        items: list[T] = [row[0] for row in rows[: self.limit]]
+        total: int | None = None
+        if self.counted:
+            total = int(rows[0][1]) if rows else (0 if not self.offset else None)
+        next_cursor = None
+        if len(rows) > self.limit and items:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                getattr(last, self.created_at_column.key), getattr(last, self.id_column.key)
+            )
+        return Page(items=items, total=total, next_cursor=next_cursor)
@@ -1,4 +1,5 @@
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.entities.user import User
@@ -16,15 +17,15 @@ def find_user_by_id(db: Session, user_id: str) -> User | None:
 
 
 class SignupRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def find_by_user_id(self, user_id: str) -> User | None:
+    async def find_by_user_id(self, user_id: str) -> User | None:
         stmt = select(User).where(User.user_id == user_id)
-        return self.db.execute(stmt).scalars().first()
+        return (await self.db.execute(stmt)).scalars().first()
 
-    def create_user(self, user: User) -> User:
+    async def create_user(self, user: User) -> User:
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         return user
@@ -0,0 +1,145 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Select, and_, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.entities.crawl_job import CrawlJob
+
+# A portfolio that already has a queued or running job is skipped: the partial unique index
+# ux_crawl_jobs_active_portfolio allows one active job per portfolio.
+_ENQUEUE_STMT = (
+    insert(CrawlJob)
+    .on_conflict_do_nothing(
+        index_elements=[CrawlJob.portfolio_id],
+        index_where=text("status in ('QUEUED', 'RUNNING')"),
+    )
+    .returning(CrawlJob.id)
+)
+
+
+def enqueue_crawl_jobs(db: Session, user_id: int, portfolio_ids: list[int]) -> int:
+    if not portfolio_ids:
+        return 0
+    created = db.scalars(
+        _ENQUEUE_STMT,
+        [
+            {"id": uuid.uuid4(), "user_id": user_id, "portfolio_id": portfolio_id}
+            for portfolio_id in dict.fromkeys(portfolio_ids)
+        ],
+    ).all()
+    db.commit()
+    return len(created)
+
+
+def _claimable_stmt(now: datetime, limit: int, max_attempts: int) -> Select[CrawlJob]:
+    return (
+        select(CrawlJob)
+        .where(
+            or_(
+                and_(CrawlJob.status == "QUEUED", CrawlJob.next_run_at <= now),
+                and_(
+                    CrawlJob.status == "RUNNING",
+                    CrawlJob.lease_expires_at < now,
+                    CrawlJob.attempts < max_attempts,
+                ),
+            )
+        )
+        .order_by(CrawlJob.next_run_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+async def aclaim_crawl_jobs(
+    db: AsyncSession,
+    worker_id: str,
+    limit: int,
+    lease_sec: int,
+    max_attempts: int,
+) -> list[CrawlJob]:
+    now = datetime.now(tz=UTC)
+    jobs = list((await db.execute(_claimable_stmt(now, limit, max_attempts))).scalars().all())
+    for job in jobs:
+        job.status = "RUNNING"
+        job.attempts += 1
+        job.locked_by = worker_id
+        job.lease_expires_at = now + timedelta(seconds=lease_sec)
+    await db.commit()
+    return jobs
+
+
+async def afail_expired_crawl_jobs(db: AsyncSession, max_attempts: int) -> int:
+    now = datetime.now(tz=UTC)
+    stmt = (
+        update(CrawlJob)
+        .where(
+            CrawlJob.status == "RUNNING",
+            CrawlJob.lease_expires_at < now,
+            CrawlJob.attempts >= max_attempts,
+        )
+        .values(
+            status="FAILED",
+            error="lease expired on the last attempt",
+            lease_expires_at=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = cast(CursorResult[Any], await db.execute(stmt))
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+async def arenew_crawl_job_leases(
+    db: AsyncSession,
+    job_ids: list[uuid.UUID],
+    worker_id: str,
+    lease_sec: int,
+) -> int:
+    stmt = (
+        update(CrawlJob)
+        .where(
+            CrawlJob.id.in_(job_ids),
+            CrawlJob.status == "RUNNING",
+            CrawlJob.locked_by == worker_id,
+        )
+        .values(lease_expires_at=datetime.now(tz=UTC) + timedelta(seconds=lease_sec))
+        .execution_options(synchronize_session=False)
+    )
+    result = cast(CursorResult[Any], await db.execute(stmt))
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+async def acomplete_crawl_job(db: AsyncSession, job: CrawlJob) -> CrawlJob:
+    job.status = "SUCCEEDED"
+    job.error = None
+    job.lease_expires_at = None
+    job.finished_at = datetime.now(tz=UTC)
+    db.add(job)
+    await db.commit()
+    return job
+
+
+async def afail_crawl_job(
+    db: AsyncSession,
+    job: CrawlJob,
+    reason: str,
+    retry_after_sec: int | None,
+) -> CrawlJob:
+    now = datetime.now(tz=UTC)
+    job.error = reason[:500]
+    job.lease_expires_at = None
+    if retry_after_sec is None:
+        job.status = "FAILED"
+        job.finished_at = now
+    else:
+        job.status = "QUEUED"
+        job.next_run_at = now + timedelta(seconds=retry_after_sec)
+    db.add(job)
+    await db.commit()
+    return job
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.entities.llm_cache import LLMResponseCache
+
+
+def get_cached_response(db: Session, cache_key: str, now: datetime) -> str | None:
+    stmt = select(LLMResponseCache.response_text).where(
+        LLMResponseCache.cache_key == cache_key,
+        LLMResponseCache.expires_at > now,
+    )
+    return db.execute(stmt).scalar()
+
+
+def upsert_cached_response(
+    db: Session,
+    cache_key: str,
+    model: str,
+    response_text: str,
+    expires_at: datetime,
+) -> None:
+    stmt = insert(LLMResponseCache).values(
+        cache_key=cache_key,
+        model=model,
+        response_text=response_text,
+        expires_at=expires_at,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LLMResponseCache.cache_key],
+        set_={"response_text": stmt.excluded.response_text, "expires_at": stmt.excluded.expires_at},
+    )
+    db.execute(stmt)
+    db.commit()
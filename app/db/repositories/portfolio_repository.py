@@ -1,10 +1,12 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.entities.portfolio import Portfolio
+from app.db.pagination import Keyset, Page
 
 
 def create_portfolio(
@@ -57,6 +59,24 @@ def get_portfolios_by_user(
     return list(db.execute(stmt).scalars().all())
 
 
+def page_portfolios_by_user(
+    db: Session,
+    user_id: int,
+    limit: int = 50,
+    cursor: str | None = None,
+    offset: int = 0,
+    with_total: bool = True,
+    project_id: uuid.UUID | None = None,
+) -> Page[Portfolio]:
+    keyset = Keyset.from_cursor(
+        Portfolio.created_at, Portfolio.id, int, limit, cursor, offset, with_total
+    )
+    stmt = select(Portfolio).where(Portfolio.user_id == user_id)
+    if project_id is not None:
+        stmt = stmt.where(Portfolio.project_id == project_id)
+    return keyset.page(db.execute(keyset.apply(stmt)).all())
+
+
 def count_portfolios_by_user(db: Session, user_id: int, project_id: uuid.UUID | None = None) -> int:
     stmt = select(func.count(Portfolio.id)).where(Portfolio.user_id == user_id)
     if project_id is not None:
@@ -74,6 +94,32 @@ def delete_portfolio(db: Session, portfolio_id: int, user_id: int) -> bool:
     return True
 
 
+def _portfolios_by_ids_stmt(user_id: int, portfolio_ids: list[int]) -> Select[Portfolio]:
+    return (
+        select(Portfolio)
+        .where(Portfolio.user_id == user_id, Portfolio.id.in_(portfolio_ids))
+        .order_by(Portfolio.id.asc())
+    )
+
+
+def _apply_extracted_text(
+    portfolio: Portfolio, extracted_text: str, meta_patch: dict | None
+) -> None:
+    meta = dict(portfolio.meta or {})
+    if meta_patch:
+        meta.update(meta_patch)
+    portfolio.extracted_text = extracted_text
+    portfolio.meta = meta
+
+
+def _apply_crawl_failure(portfolio: Portfolio, reason: str) -> None:
+    meta = dict(portfolio.meta or {})
+    meta["crawlStatus"] = "FAILED"
+    meta["crawlError"] = reason[:500]
+    meta["crawlUpdatedAt"] = datetime.now(tz=UTC).isoformat()
+    portfolio.meta = meta
+
+
 def get_portfolios_by_ids(
     db: Session,
     user_id: int,
@@ -81,12 +127,7 @@ def get_portfolios_by_ids(
 ) -> list[Portfolio]:
     if not portfolio_ids:
         return []
-    stmt = (
-        select(Portfolio)
-        .where(Portfolio.user_id == user_id, Portfolio.id.in_(portfolio_ids))
-        .order_by(Portfolio.id.asc())
-    )
-    return list(db.execute(stmt).scalars().all())
+    return list(db.execute(_portfolios_by_ids_stmt(user_id, portfolio_ids)).scalars().all())
 
 
 def update_portfolio_extracted_text(
@@ -95,11 +136,7 @@ def update_portfolio_extracted_text(
     extracted_text: str,
     meta_patch: dict | None = None,
 ) -> Portfolio:
-    meta = portfolio.meta or {}
-    if meta_patch:
-        meta.update(meta_patch)
-    portfolio.extracted_text = extracted_text
-    portfolio.meta = meta
+    _apply_extracted_text(portfolio, extracted_text, meta_patch)
     db.add(portfolio)
     db.commit()
     db.refresh(portfolio)
@@ -111,12 +148,44 @@ def mark_portfolio_crawl_failed(
     portfolio: Portfolio,
     reason: str,
 ) -> Portfolio:
-    meta = portfolio.meta or {}
-    meta["crawlStatus"] = "FAILED"
-    meta["crawlError"] = reason[:500]
-    meta["crawlUpdatedAt"] = datetime.now(tz=UTC).isoformat()
-    portfolio.meta = meta
+    _apply_crawl_failure(portfolio, reason)
     db.add(portfolio)
     db.commit()
     db.refresh(portfolio)
     return portfolio
+
+
+async def aget_portfolios_by_ids(
+    db: AsyncSession,
+    user_id: int,
+    portfolio_ids: list[int],
+) -> list[Portfolio]:
+    if not portfolio_ids:
+        return []
+    result = await db.execute(_portfolios_by_ids_stmt(user_id, portfolio_ids))
+    return list(result.scalars().all())
+
+
+async def aupdate_portfolio_extracted_text(
+    db: AsyncSession,
+    portfolio: Portfolio,
+    extracted_text: str,
+    meta_patch: dict | None = None,
+) -> Portfolio:
+    _apply_extracted_text(portfolio, extracted_text, meta_patch)
+    db.add(portfolio)
+    await db.commit()
+    await db.refresh(portfolio)
+    return portfolio
+
+
+async def amark_portfolio_crawl_failed(
+    db: AsyncSession,
+    portfolio: Portfolio,
+    reason: str,
+) -> Portfolio:
+    _apply_crawl_failure(portfolio, reason)
+    db.add(portfolio)
+    await db.commit()
+    await db.refresh(portfolio)
+    return portfolio
@@ -0,0 +1,124 @@
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, Select, and_, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.entities.project import PortfolioItem, Project, ProjectPortfolio, Resume
+from app.db.entities.session_v2 import UnifiedSession
+
+
+@dataclass
+class ProjectDashboardSnapshot:
+    project: Project
+    resume_id: uuid.UUID | None
+    resume_title: str | None
+    resume_status: str | None
+    resume_updated_at: datetime | None
+    mock_session_id: uuid.UUID | None
+    mock_status: str | None
+    mock_result_json: dict[str, Any] | None
+    mock_count: int
+    sim_status: str | None
+    portfolios: list[tuple[ProjectPortfolio, PortfolioItem]] = field(default_factory=list)
+
+
+def _latest_session_lateral(user_id: int, session_type: str, name: str):
+    return (
+        select(
+            UnifiedSession.id,
+            UnifiedSession.status,
+            UnifiedSession.result_json,
+            func.count().over().label("session_count"),
+        )
+        .where(
+            UnifiedSession.user_id == user_id,
+            UnifiedSession.project_id == Project.id,
+            UnifiedSession.session_type == session_type,
+        )
+        .order_by(UnifiedSession.created_at.desc())
+        .limit(1)
+        .lateral(name)
+    )
+
+
+def _dashboard_stmt(project_id: uuid.UUID, user_id: int) -> Select:
+    resume = (
+        select(Resume.id, Resume.title, Resume.status, Resume.updated_at)
+        .where(Resume.project_id == Project.id, Resume.user_id == user_id)
+        .order_by(Resume.updated_at.desc())
+        .limit(1)
+        .lateral("latest_resume")
+    )
+    mock = _latest_session_lateral(user_id, "MOCK_INTERVIEW", "latest_mock")
+    sim = _latest_session_lateral(user_id, "JOB_SIMULATION", "latest_sim")
+    return (
+        select(
+            Project,
+            resume.c.id,
+            resume.c.title,
+            resume.c.status,
+            resume.c.updated_at,
+            mock.c.id,
+            mock.c.status,
+            mock.c.result_json,
+            func.coalesce(mock.c.session_count, 0),
+            sim.c.status,
+            ProjectPortfolio,
+            PortfolioItem,
+        )
+        .select_from(Project)
+        .outerjoin(resume, true())
+        .outerjoin(mock, true())
+        .outerjoin(sim, true())
+        .outerjoin(ProjectPortfolio, ProjectPortfolio.project_id == Project.id)
+        .outerjoin(
+            PortfolioItem,
+            and_(
+                PortfolioItem.id == ProjectPortfolio.portfolio_item_id,
+                PortfolioItem.user_id == user_id,
+            ),
+        )
+        .where(Project.id == project_id, Project.user_id == user_id)
+        .order_by(ProjectPortfolio.created_at.asc())
+    )
+
+
+def _snapshot_from_rows(rows: Sequence[Row]) -> ProjectDashboardSnapshot | None:
+    if not rows:
+        return None
+    first = rows[0]
+    return ProjectDashboardSnapshot(
+        project=first[0],
+        resume_id=first[1],
+        resume_title=first[2],
+        resume_status=first[3],
+        resume_updated_at=first[4],
+        mock_session_id=first[5],
+        mock_status=first[6],
+        mock_result_json=first[7],
+        mock_count=int(first[8]),
+        sim_status=first[9],
+        portfolios=[(row[10], row[11]) for row in rows if row[11] is not None],
+    )
+
+
+def get_project_dashboard_snapshot(
+    db: Session,
+    project_id: uuid.UUID,
+    user_id: int,
+) -> ProjectDashboardSnapshot | None:
+    return _snapshot_from_rows(db.execute(_dashboard_stmt(project_id, user_id)).all())
+
+
+async def aget_project_dashboard_snapshot(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    user_id: int,
+) -> ProjectDashboardSnapshot | None:
+    rows = (await db.execute(_dashboard_stmt(project_id, user_id))).all()
+    return _snapshot_from_rows(rows)
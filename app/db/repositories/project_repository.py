@@ -1,21 +1,22 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.entities.project import Project
+from app.db.pagination import Keyset, Page
 
 
-def create_project(
-    db: Session,
+def _new_project(
     user_id: int,
     company_name: str,
     role_title: str,
     started_at,
     deadline_at,
 ) -> Project:
-    project = Project(
+    return Project(
         user_id=user_id,
         company_name=company_name,
         role_title=role_title,
@@ -25,6 +26,41 @@ def create_project(
         progress_percent=0,
         last_activity_at=datetime.now(tz=UTC),
     )
+
+
+def _project_stmt(project_id: uuid.UUID, user_id: int) -> Select[Project]:
+    return select(Project).where(Project.id == project_id, Project.user_id == user_id)
+
+
+def _projects_by_user_stmt(user_id: int, limit: int, offset: int) -> Select[Project]:
+    return (
+        select(Project)
+        .where(Project.user_id == user_id)
+        .order_by(Project.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def _projects_keyset(limit: int, cursor: str | None, offset: int, with_total: bool) -> Keyset:
+    return Keyset.from_cursor(
+        Project.created_at, Project.id, uuid.UUID, limit, cursor, offset, with_total
+    )
+
+
+def _count_projects_stmt(user_id: int) -> Select[int]:
+    return select(func.count(Project.id)).where(Project.user_id == user_id)
+
+
+def create_project(
+    db: Session,
+    user_id: int,
+    company_name: str,
+    role_title: str,
+    started_at,
+    deadline_at,
+) -> Project:
+    project = _new_project(user_id, company_name, role_title, started_at, deadline_at)
     db.add(project)
     db.commit()
     db.refresh(project)
@@ -32,8 +68,7 @@ def create_project(
 
 
 def get_project_by_id(db: Session, project_id: uuid.UUID, user_id: int) -> Project | None:
-    stmt = select(Project).where(Project.id == project_id, Project.user_id == user_id)
-    return db.execute(stmt).scalars().first()
+    return db.execute(_project_stmt(project_id, user_id)).scalars().first()
 
 
 def list_projects_by_user(
@@ -42,19 +77,24 @@ def list_projects_by_user(
     limit: int = 50,
     offset: int = 0,
 ) -> list[Project]:
-    stmt = (
-        select(Project)
-        .where(Project.user_id == user_id)
-        .order_by(Project.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
-    return list(db.execute(stmt).scalars().all())
+    return list(db.execute(_projects_by_user_stmt(user_id, limit, offset)).scalars().all())
+
+
+def page_projects_by_user(
+    db: Session,
+    user_id: int,
+    limit: int = 50,
+    cursor: str | None = None,
+    offset: int = 0,
+    with_total: bool = True,
+) -> Page[Project]:
+    keyset = _projects_keyset(limit, cursor, offset, with_total)
+    stmt = keyset.apply(select(Project).where(Project.user_id == user_id))
+    return keyset.page(db.execute(stmt).all())
 
 
 def count_projects_by_user(db: Session, user_id: int) -> int:
-    stmt = select(func.count(Project.id)).where(Project.user_id == user_id)
-    return int(db.execute(stmt).scalar_one())
+    return int(db.execute(_count_projects_stmt(user_id)).scalar_one())
 
 
 def get_latest_project_by_user(db: Session, user_id: int) -> Project | None:
@@ -73,3 +113,55 @@ def update_project(db: Session, project: Project) -> Project:
     db.commit()
     db.refresh(project)
     return project
+
+
+async def acreate_project(
+    db: AsyncSession,
+    user_id: int,
+    company_name: str,
+    role_title: str,
+    started_at,
+    deadline_at,
+) -> Project:
+    project = _new_project(user_id, company_name, role_title, started_at, deadline_at)
+    db.add(project)
+    await db.commit()
+    await db.refresh(project)
+    return project
+
+
+async def aget_project_by_id(
+    db: AsyncSession, project_id: uuid.UUID, user_id: int
+) -> Project | None:
+    return (await db.execute(_project_stmt(project_id, user_id))).scalars().first()
+
+
+async def alist_projects_by_user(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[Project]:
+    result = await db.execute(_projects_by_user_stmt(user_id, limit, offset))
+    return list(result.scalars().all())
+
+
+async def apage_projects_by_user(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 50,
+    cursor: str | None = None,
+    offset: int = 0,
+    with_total: bool = True,
+) -> Page[Project]:
+    keyset = _projects_keyset(limit, cursor, offset, with_total)
+    stmt = keyset.apply(select(Project).where(Project.user_id == user_id))
+    return keyset.page((await db.execute(stmt)).all())
+
+
+async def aupdate_project(db: AsyncSession, project: Project) -> Project:
+    project.last_activity_at = datetime.now(tz=UTC)
+    db.add(project)
+    await db.commit()
+    await db.refresh(project)
+    return project
@@ -0,0 +1,132 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Select, and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.db.entities.report_job import ReportJob
+
+
+def create_report_job(
+    db: Session,
+    user_id: int,
+    session_id: uuid.UUID,
+    job_type: str,
+) -> ReportJob:
+    job = ReportJob(
+        user_id=user_id,
+        session_id=session_id,
+        job_type=job_type,
+        status="QUEUED",
+        attempts=0,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_report_job_by_id(db: Session, job_id: uuid.UUID, user_id: int) -> ReportJob | None:
+    stmt = select(ReportJob).where(ReportJob.id == job_id, ReportJob.user_id == user_id)
+    return db.execute(stmt).scalars().first()
+
+
+# A RUNNING job whose lease ran out lost its worker (crash, hang past the lease) and is
+# claimed again, but only while it has attempts left; fail_expired_report_jobs ends the rest.
+def _claimable_stmt(now: datetime, max_attempts: int) -> Select[ReportJob]:
+    return (
+        select(ReportJob)
+        .where(
+            or_(
+                ReportJob.status == "QUEUED",
+                and_(
+                    ReportJob.status == "RUNNING",
+                    ReportJob.lease_expires_at < now,
+                    ReportJob.attempts < max_attempts,
+                ),
+            )
+        )
+        .order_by(ReportJob.created_at.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def claim_next_report_job(
+    db: Session, worker_id: str, lease_sec: int, max_attempts: int
+) -> ReportJob | None:
+    now = datetime.now(tz=UTC)
+    job = db.execute(_claimable_stmt(now, max_attempts)).scalars().first()
+    if job is None:
+        db.rollback()
+        return None
+    job.status = "RUNNING"
+    job.attempts += 1
+    job.started_at = now
+    job.locked_by = worker_id
+    job.lease_expires_at = now + timedelta(seconds=lease_sec)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def renew_report_job_lease(db: Session, job_id: uuid.UUID, worker_id: str, lease_sec: int) -> bool:
+    stmt = (
+        update(ReportJob)
+        .where(
+            ReportJob.id == job_id,
+            ReportJob.status == "RUNNING",
+            ReportJob.locked_by == worker_id,
+        )
+        .values(lease_expires_at=datetime.now(tz=UTC) + timedelta(seconds=lease_sec))
+        .execution_options(synchronize_session=False)
+    )
+    result = cast(CursorResult[Any], db.execute(stmt))
+    db.commit()
+    return bool(result.rowcount)
+
+
+def complete_report_job(db: Session, job: ReportJob, result_json: dict) -> ReportJob:
+    job.status = "SUCCEEDED"
+    job.result_json = result_json
+    job.error = None
+    job.lease_expires_at = None
+    job.finished_at = datetime.now(tz=UTC)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def fail_report_job(db: Session, job: ReportJob, reason: str, retry: bool) -> ReportJob:
+    job.status = "QUEUED" if retry else "FAILED"
+    job.error = reason[:500]
+    job.lease_expires_at = None
+    job.finished_at = None if retry else datetime.now(tz=UTC)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def fail_expired_report_jobs(db: Session, max_attempts: int) -> int:
+    now = datetime.now(tz=UTC)
+    stmt = (
+        update(ReportJob)
+        .where(
+            ReportJob.status == "RUNNING",
+            ReportJob.lease_expires_at < now,
+            ReportJob.attempts >= max_attempts,
+        )
+        .values(
+            status="FAILED",
+            error="lease expired on the last attempt",
+            lease_expires_at=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = cast(CursorResult[Any], db.execute(stmt))
+    db.commit()
+    return int(result.rowcount or 0)
@@ -1,23 +1,27 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.entities.project import RoutineItem
 
 
+def _routine_items_stmt(user_id: int, routine_date: date) -> Select[RoutineItem]:
+    return (
+        select(RoutineItem)
+        .where(RoutineItem.user_id == user_id, RoutineItem.routine_date == routine_date)
+        .order_by(RoutineItem.created_at.asc())
+    )
+
+
 def list_routine_items_by_user_date(
     db: Session,
     user_id: int,
     routine_date: date,
 ) -> list[RoutineItem]:
-    stmt = (
-        select(RoutineItem)
-        .where(RoutineItem.user_id == user_id, RoutineItem.routine_date == routine_date)
-        .order_by(RoutineItem.created_at.asc())
-    )
-    return list(db.execute(stmt).scalars().all())
+    return list(db.execute(_routine_items_stmt(user_id, routine_date)).scalars().all())
 
 
 def get_routine_item(
@@ -42,3 +46,12 @@ def update_routine_checked(
     db.commit()
     db.refresh(routine)
     return routine
+
+
+async def alist_routine_items_by_user_date(
+    db: AsyncSession,
+    user_id: int,
+    routine_date: date,
+) -> list[RoutineItem]:
+    result = await db.execute(_routine_items_stmt(user_id, routine_date))
+    return list(result.scalars().all())
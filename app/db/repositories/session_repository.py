@@ -1,10 +1,177 @@
 import uuid
 from datetime import UTC, datetime
+from typing import Any, Literal, overload
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, Update, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.entities.session_v2 import SessionTurn, UnifiedSession
+from app.db.session import async_unit_of_work, in_unit_of_work, unit_of_work
+
+_TURN_FIELDS = (
+    "role",
+    "speaker",
+    "prompt",
+    "user_answer",
+    "message",
+    "intent",
+    "feedback",
+    "score",
+    "score_delta",
+    "meta",
+)
+
+_TRANSCRIPT_COLUMNS = (
+    SessionTurn.role,
+    SessionTurn.speaker,
+    SessionTurn.message,
+    SessionTurn.user_answer,
+    SessionTurn.prompt,
+)
+
+_INSERT_TURNS_STMT = insert(SessionTurn).returning(SessionTurn, sort_by_parameter_order=True)
+
+_TRANSCRIPT_WINDOW = 40
+_TRANSCRIPT_SUMMARY_CHARS = 2000
+_TRANSCRIPT_SUMMARY_LINE_CHARS = 80
+
+
+def _save(db: Session, instance: Any) -> None:
+    db.add(instance)
+    if in_unit_of_work(db):
+        db.flush()
+        return
+    db.commit()
+    db.refresh(instance)
+
+
+async def _asave(db: AsyncSession, instance: Any) -> None:
+    db.add(instance)
+    if in_unit_of_work(db):
+        await db.flush()
+        return
+    await db.commit()
+    await db.refresh(instance)
+
+
+def _transcript_entry(turn: Any) -> dict[str, str]:
+    return {
+        "role": turn.role,
+        "speaker": turn.speaker or turn.role,
+        "text": turn.message or turn.user_answer or turn.prompt or "",
+    }
+
+
+def _append_transcript(session: UnifiedSession, turns: list[Any]) -> None:
+    transcript = session.transcript or {}
+    window = list(transcript.get("window") or [])
+    summary = str(transcript.get("summary") or "")
+    user_turns = int(transcript.get("userTurns") or 0)
+
+    for turn in turns:
+        entry = _transcript_entry(turn)
+        window.append(entry)
+        if entry["role"] == "user" and entry["text"]:
+            user_turns += 1
+
+    overflow = window[: max(0, len(window) - _TRANSCRIPT_WINDOW)]
+    if overflow:
+        window = window[len(overflow) :]
+        dropped = "\n".join(
+            f"[{entry['speaker']}] {entry['text'][:_TRANSCRIPT_SUMMARY_LINE_CHARS]}"
+            for entry in overflow
+        )
+        summary = f"{summary}\n{dropped}".strip()[-_TRANSCRIPT_SUMMARY_CHARS:]
+
+    session.transcript = {
+        "window": window,
+        "summary": summary,
+        "turnCount": int(transcript.get("turnCount") or 0) + len(turns),
+        "userTurns": user_turns,
+    }
+
+
+def _session_stmt(session_id: uuid.UUID, user_id: int) -> Select[UnifiedSession]:
+    return select(UnifiedSession).where(
+        UnifiedSession.id == session_id, UnifiedSession.user_id == user_id
+    )
+
+
+def _transcript_lock_stmt(session_id: uuid.UUID) -> Select[Any]:
+    return (
+        select(UnifiedSession.transcript).where(UnifiedSession.id == session_id).with_for_update()
+    )
+
+
+def _reserve_stmt(session_id: uuid.UUID, count: int) -> Update:
+    return (
+        update(UnifiedSession)
+        .where(UnifiedSession.id == session_id)
+        .values(last_turn_index=UnifiedSession.last_turn_index + count)
+        .returning(UnifiedSession.last_turn_index)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _turns_stmt(
+    session_id: uuid.UUID,
+    limit: int | None,
+    desc: bool,
+    transcript_only: bool,
+) -> Select[Any]:
+    order_column = SessionTurn.turn_index.desc() if desc else SessionTurn.turn_index.asc()
+    columns = _TRANSCRIPT_COLUMNS if transcript_only else (SessionTurn,)
+    stmt = select(*columns).where(SessionTurn.session_id == session_id).order_by(order_column)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def _new_turn(session: UnifiedSession, turn_index: int, **fields: Any) -> SessionTurn:
+    return SessionTurn(
+        session_id=session.id,
+        project_id=session.project_id,
+        user_id=session.user_id,
+        turn_index=turn_index,
+        **fields,
+    )
+
+
+def _turn_rows(
+    session: UnifiedSession, turns: list[dict[str, Any]], first_index: int
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "session_id": session.id,
+            "project_id": session.project_id,
+            "user_id": session.user_id,
+            "turn_index": first_index + offset,
+            **{field: turn.get(field) for field in _TURN_FIELDS},
+        }
+        for offset, turn in enumerate(turns)
+    ]
+
+
+# Concurrent turns on one session append to the same JSON document, so every append re-reads
+# it under the row lock; the lock is held until the turn's commit writes the new transcript.
+def _lock_transcript(db: Session, session: UnifiedSession) -> None:
+    transcript = db.execute(_transcript_lock_stmt(session.id)).scalar_one()
+    set_committed_value(session, "transcript", transcript)
+
+
+async def _alock_transcript(db: AsyncSession, session: UnifiedSession) -> None:
+    transcript = (await db.execute(_transcript_lock_stmt(session.id))).scalar_one()
+    set_committed_value(session, "transcript", transcript)
+
+
+def get_session_transcript(db: Session, session: UnifiedSession) -> dict[str, Any]:
+    if session.transcript is None:
+        rows = list_turns_by_session(db=db, session_id=session.id, desc=False, transcript_only=True)
+        _append_transcript(session, rows)
+    return session.transcript or {}
 
 
 def create_session(
@@ -24,18 +191,14 @@ def create_session(
         current_index=1,
         started_at=datetime.now(tz=UTC),
         meta=meta,
+        transcript={},
     )
-    db.add(session)
-    db.commit()
-    db.refresh(session)
+    _save(db, session)
     return session
 
 
 def get_session_by_id(db: Session, session_id: uuid.UUID, user_id: int) -> UnifiedSession | None:
-    stmt = select(UnifiedSession).where(
-        UnifiedSession.id == session_id, UnifiedSession.user_id == user_id
-    )
-    return db.execute(stmt).scalars().first()
+    return db.execute(_session_stmt(session_id, user_id)).scalars().first()
 
 
 def create_turn(
@@ -53,11 +216,9 @@ def create_turn(
     meta: dict | None,
     turn_index: int,
 ) -> SessionTurn:
-    turn = SessionTurn(
-        session_id=session.id,
-        project_id=session.project_id,
-        user_id=session.user_id,
-        turn_index=turn_index,
+    turn = _new_turn(
+        session,
+        turn_index,
         role=role,
         speaker=speaker,
         prompt=prompt,
@@ -69,35 +230,191 @@ def create_turn(
         score_delta=score_delta,
         meta=meta,
     )
-    db.add(turn)
-    db.commit()
-    db.refresh(turn)
+    _lock_transcript(db, session)
+    get_session_transcript(db=db, session=session)
+    _append_transcript(session, [turn])
+    _save(db, turn)
     return turn
 
 
-def get_next_turn_index(db: Session, session_id: uuid.UUID) -> int:
-    stmt = select(func.max(SessionTurn.turn_index)).where(SessionTurn.session_id == session_id)
-    last_turn = db.execute(stmt).scalar()
-    return int(last_turn or 0) + 1
+def create_turns(
+    db: Session,
+    session: UnifiedSession,
+    turns: list[dict[str, Any]],
+) -> list[SessionTurn]:
+    if not turns:
+        return []
+    with unit_of_work(db):
+        _lock_transcript(db, session)
+        get_session_transcript(db=db, session=session)
+        first_index = reserve_turn_indexes(db=db, session=session, count=len(turns))
+        rows = _turn_rows(session, turns, first_index)
+        created = list(db.scalars(_INSERT_TURNS_STMT, rows).all())
+        _append_transcript(session, created)
+        db.flush()
+        return created
+
+
+def reserve_turn_indexes(db: Session, session: UnifiedSession, count: int = 1) -> int:
+    last_index = int(db.execute(_reserve_stmt(session.id, count)).scalar_one())
+    set_committed_value(session, "last_turn_index", last_index)
+    if not in_unit_of_work(db):
+        db.commit()
+    return last_index - count + 1
 
 
+@overload
 def list_turns_by_session(
     db: Session,
     session_id: uuid.UUID,
     limit: int | None = None,
     desc: bool = False,
-) -> list[SessionTurn]:
-    order_column = SessionTurn.turn_index.desc() if desc else SessionTurn.turn_index.asc()
-    stmt = select(SessionTurn).where(SessionTurn.session_id == session_id).order_by(order_column)
-    if limit is not None:
-        stmt = stmt.limit(limit)
+    transcript_only: Literal[False] = False,
+) -> list[SessionTurn]: ...
+
+
+@overload
+def list_turns_by_session(
+    db: Session,
+    session_id: uuid.UUID,
+    limit: int | None = None,
+    desc: bool = False,
+    *,
+    transcript_only: Literal[True],
+) -> list[Row[Any]]: ...
+
+
+def list_turns_by_session(
+    db: Session,
+    session_id: uuid.UUID,
+    limit: int | None = None,
+    desc: bool = False,
+    transcript_only: bool = False,
+) -> list[SessionTurn] | list[Row[Any]]:
+    stmt = _turns_stmt(session_id, limit, desc, transcript_only)
+    if transcript_only:
+        return list(db.execute(stmt).all())
     return list(db.execute(stmt).scalars().all())
 
 
 def update_session(db: Session, session: UnifiedSession) -> UnifiedSession:
-    db.add(session)
-    db.commit()
-    db.refresh(session)
+    _save(db, session)
+    return session
+
+
+async def aget_session_by_id(
+    db: AsyncSession, session_id: uuid.UUID, user_id: int
+) -> UnifiedSession | None:
+    return (await db.execute(_session_stmt(session_id, user_id))).scalars().first()
+
+
+async def aget_session_transcript(db: AsyncSession, session: UnifiedSession) -> dict[str, Any]:
+    if session.transcript is None:
+        rows = await alist_turns_by_session(
+            db=db, session_id=session.id, desc=False, transcript_only=True
+        )
+        _append_transcript(session, rows)
+    return session.transcript or {}
+
+
+async def acreate_turn(
+    db: AsyncSession,
+    session: UnifiedSession,
+    role: str,
+    speaker: str | None,
+    prompt: str | None,
+    user_answer: str | None,
+    message: str | None,
+    intent: str | None,
+    feedback: str | None,
+    score: float | None,
+    score_delta: dict | None,
+    meta: dict | None,
+    turn_index: int,
+) -> SessionTurn:
+    turn = _new_turn(
+        session,
+        turn_index,
+        role=role,
+        speaker=speaker,
+        prompt=prompt,
+        user_answer=user_answer,
+        message=message,
+        intent=intent,
+        feedback=feedback,
+        score=score,
+        score_delta=score_delta,
+        meta=meta,
+    )
+    await _alock_transcript(db, session)
+    await aget_session_transcript(db=db, session=session)
+    _append_transcript(session, [turn])
+    await _asave(db, turn)
+    return turn
+
+
+async def acreate_turns(
+    db: AsyncSession,
+    session: UnifiedSession,
+    turns: list[dict[str, Any]],
+) -> list[SessionTurn]:
+    if not turns:
+        return []
+    async with async_unit_of_work(db):
+        await _alock_transcript(db, session)
+        await aget_session_transcript(db=db, session=session)
+        first_index = await areserve_turn_indexes(db=db, session=session, count=len(turns))
+        rows = _turn_rows(session, turns, first_index)
+        created = list((await db.scalars(_INSERT_TURNS_STMT, rows)).all())
+        _append_transcript(session, created)
+        await db.flush()
+        return created
+
+
+async def areserve_turn_indexes(db: AsyncSession, session: UnifiedSession, count: int = 1) -> int:
+    last_index = int((await db.execute(_reserve_stmt(session.id, count))).scalar_one())
+    set_committed_value(session, "last_turn_index", last_index)
+    if not in_unit_of_work(db):
+        await db.commit()
+    return last_index - count + 1
+
+
+@overload
+async def alist_turns_by_session(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    limit: int | None = None,
+    desc: bool = False,
+    transcript_only: Literal[False] = False,
+) -> list[SessionTurn]: ...
+
+
+@overload
+async def alist_turns_by_session(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    limit: int | None = None,
+    desc: bool = False,
+    *,
+    transcript_only: Literal[True],
+) -> list[Row[Any]]: ...
+
+
+async def alist_turns_by_session(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    limit: int | None = None,
+    desc: bool = False,
+    transcript_only: bool = False,
+) -> list[SessionTurn] | list[Row[Any]]:
+    result = await db.execute(_turns_stmt(session_id, limit, desc, transcript_only))
+    if transcript_only:
+        return list(result.all())
+    return list(result.scalars().all())
+
+
+async def aupdate_session(db: AsyncSession, session: UnifiedSession) -> UnifiedSession:
+    await _asave(db, session)
     return session
 
 
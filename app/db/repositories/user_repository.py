@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.db.entities.user import User
@@ -9,7 +10,26 @@ def get_user_by_pk(db: Session, user_pk: int) -> User | None:
     return db.execute(stmt).scalars().first()
 
 
+async def aget_user_by_pk(db: AsyncSession, user_pk: int) -> User | None:
+    stmt = select(User).where(User.id == user_pk)
+    return (await db.execute(stmt)).scalars().first()
+
+
 def get_user_by_user_id(db: Session, user_id: str) -> User | None:
     stmt = select(User).where(User.user_id == user_id)
     return db.execute(stmt).scalars().first()
 
+
+async def aget_user_by_user_id(db: AsyncSession, user_id: str) -> User | None:
+    stmt = select(User).where(User.user_id == user_id)
+    return (await db.execute(stmt)).scalars().first()
+
+
+def update_user_notion_key(db: Session, user_pk: int, notion_api_key: str) -> None:
+    db.execute(update(User).where(User.id == user_pk).values(notion_api_key=notion_api_key))
+    db.commit()
+
+
+async def aget_user_notion_key(db: AsyncSession, user_pk: int) -> str | None:
+    stmt = select(User.notion_api_key).where(User.id == user_pk)
+    return (await db.execute(stmt)).scalar_one_or_none()
@@ -1,9 +1,20 @@
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
 from urllib.parse import quote_plus
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, exc, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
 
+from app.core import metrics
 from app.core.config import get_settings
 
 
@@ -14,6 +25,8 @@ class Base(DeclarativeBase):
 settings = get_settings()
 _engine: Engine | None = None
 _session_local: sessionmaker[Session] | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_local: async_sessionmaker[AsyncSession] | None = None
 
 
 def _resolve_database_url() -> str:
@@ -43,10 +56,66 @@ def _resolve_database_url() -> str:
     raise RuntimeError("DB config is missing. Set DATABASE_URL or SUPABASE_DB_* values in .env.")
 
 
+TRANSACTION_POOLER_PORT = 6543
+
+
+class _MeteredQueuePool(QueuePool):
+    metrics_label = "sync"
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.increment("db_pool_checkout_timeouts", pool=self.metrics_label)
+            raise
+        metrics.observe(
+            "db_pool_checkout_wait_ms",
+            (time.perf_counter() - started) * 1000,
+            pool=self.metrics_label,
+        )
+        return connection
+
+
+class _MeteredAsyncQueuePool(_MeteredQueuePool, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def _uses_transaction_pooler(url: str) -> bool:
+    if settings.db_transaction_pooling is not None:
+        return settings.db_transaction_pooling
+    return make_url(url).port == TRANSACTION_POOLER_PORT
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    prepare_threshold = settings.db_prepare_threshold
+    if _uses_transaction_pooler(url):
+        prepare_threshold = None
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle_sec,
+        "pool_timeout": settings.db_pool_timeout_sec,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {"prepare_threshold": prepare_threshold},
+    }
+
+
+def _register_pool_gauges(pool: Pool, label: str) -> None:
+    # engine.pool is typed as the Pool base; only QueuePool exposes the checkout counters.
+    if not isinstance(pool, QueuePool):
+        return
+    metrics.register_gauge("db_pool_in_use", pool.checkedout, pool=label)
+    metrics.register_gauge("db_pool_idle", pool.checkedin, pool=label)
+    metrics.register_gauge("db_pool_overflow", lambda: max(0, pool.overflow()), pool=label)
+
+
 def get_engine() -> Engine:
     global _engine
     if _engine is None:
-        _engine = create_engine(_resolve_database_url(), pool_pre_ping=True)
+        url = _resolve_database_url()
+        _engine = create_engine(url, poolclass=_MeteredQueuePool, **_engine_options(url))
+        _register_pool_gauges(_engine.pool, _MeteredQueuePool.metrics_label)
     return _engine
 
 
@@ -70,5 +139,89 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        url = _resolve_database_url()
+        _async_engine = create_async_engine(
+            url, poolclass=_MeteredAsyncQueuePool, **_engine_options(url)
+        )
+        _register_pool_gauges(_async_engine.pool, _MeteredAsyncQueuePool.metrics_label)
+    return _async_engine
+
+
+def get_async_session_local() -> async_sessionmaker[AsyncSession]:
+    global _async_session_local
+    if _async_session_local is None:
+        _async_session_local = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_local
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_session_local()() as db:
+        yield db
+
+
+async def close_async_engine() -> None:
+    global _async_engine, _async_session_local
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_local = None
+
+
+_UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def in_unit_of_work(db: Session | AsyncSession) -> bool:
+    return bool(db.info.get(_UNIT_OF_WORK_KEY))
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Group repository writes into one transaction committed when the block exits.
+
+    Repositories only flush inside the block, and loaded objects are not expired by the
+    final commit so responses can be built from them without reloading.
+    """
+    if in_unit_of_work(db):
+        yield db
+        return
+
+    expire_on_commit = db.expire_on_commit
+    db.info[_UNIT_OF_WORK_KEY] = True
+    db.expire_on_commit = False
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop(_UNIT_OF_WORK_KEY, None)
+        db.expire_on_commit = expire_on_commit
+
+
+@asynccontextmanager
+async def async_unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    if in_unit_of_work(db):
+        yield db
+        return
+
+    db.info[_UNIT_OF_WORK_KEY] = True
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        db.info.pop(_UNIT_OF_WORK_KEY, None)
+
+
 engine = get_engine
 SessionLocal = get_session_local
@@ -1,11 +1,37 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 import app.db.entities as _entities  # noqa: F401
-from app.db.session import Base, get_engine
+from app.core.password import close_password_hasher
+from app.db.session import Base, close_async_engine, get_engine
 from app.router import router
+from app.services.crawler import close_crawler
+from app.services.llm_gateway import close_llm_gateway, start_llm_gateway
+from app.services.pdf_extract import close_pdf_extractor
+from app.services.report_job_service import start_report_workers, stop_report_workers
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    Base.metadata.create_all(bind=get_engine())
+    await start_llm_gateway()
+    await start_report_workers()
+    try:
+        yield
+    finally:
+        await stop_report_workers()
+        await close_llm_gateway()
+        await close_crawler()
+        await close_async_engine()
+        close_password_hasher()
+        close_pdf_extractor()
+
 
 app = FastAPI(
     title="Backend",
+    lifespan=lifespan,
     openapi_tags=[
         {"name": "헬스체크", "description": "서버 상태 확인 API"},
         {"name": "인증", "description": "로그인/회원가입/JWT 발급 API"},
@@ -15,11 +41,7 @@ app = FastAPI(
         {"name": "자소서", "description": "자소서 문단 작성 및 코치 API"},
         {"name": "심층인터뷰", "description": "심층 인터뷰 진행/가이드/인사이트 API"},
         {"name": "직무시뮬레이션", "description": "직무 시뮬레이션(v1 화면형) API"},
+        {"name": "리포트작업", "description": "결과/가이드/인사이트 생성 백그라운드 작업 API"},
     ],
 )
 app.include_router(router)
-
-
-@app.on_event("startup")
-def init_db() -> None:
-    Base.metadata.create_all(bind=get_engine())
@@ -9,6 +9,7 @@ from app.controllers.health_controller import router as health_router
 from app.controllers.home_v1_controller import router as home_v1_router
 from app.controllers.projects_v1_controller import router as projects_v1_router
 from app.controllers.projects_v1_controller import routine_router as routine_v1_router
+from app.controllers.report_job_controller import router as report_job_router
 from app.controllers.resume_v1_controller import router as resume_v1_router
 from app.controllers.signup_controller import router as signup_router
 from app.controllers.simulation_v1_controller import router as simulation_v1_router
@@ -23,4 +24,5 @@ router.include_router(resume_v1_router)
 router.include_router(deep_interview_router)
 router.include_router(deep_interview_insight_router)
 router.include_router(simulation_v1_router)
+router.include_router(report_job_router)
 router.include_router(signup_router)
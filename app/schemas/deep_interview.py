@@ -8,6 +8,13 @@ class DeepInterviewQuestion(BaseModel):
     prompt: str
 
 
+class DeepInterviewQuestionDraft(BaseModel):
+    question: str
+    intent: str | None = None
+    should_stop: bool = False
+    coverage: list[str] = Field(default_factory=list)
+
+
 class DeepInterviewStartRequest(BaseModel):
     projectId: UUID
 
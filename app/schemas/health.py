@@ -3,3 +3,9 @@ from pydantic import BaseModel
 
 class HealthResponse(BaseModel):
     ok: bool
+
+
+class MetricsResponse(BaseModel):
+    counters: dict[str, float]
+    summaries: dict[str, dict[str, float]]
+    gauges: dict[str, float]
@@ -24,6 +24,11 @@ class PortfolioQuestionsRequest(BaseModel):
     stop_requested: bool = False
 
 
+class PortfolioQuestionDraft(BaseModel):
+    question: str | None = None
+    message: str | None = None
+
+
 class PortfolioQuestionsResponse(BaseModel):
     portfolio_id: int
     message: str | None = None
@@ -50,4 +55,5 @@ class PortfolioResponse(BaseModel):
 
 class PortfolioListResponse(BaseModel):
     items: list[PortfolioResponse]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = None
@@ -43,4 +43,5 @@ class ProjectResponse(BaseModel):
 
 class ProjectListResponse(BaseModel):
     items: list[ProjectResponse]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = None
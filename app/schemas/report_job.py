@@ -0,0 +1,40 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ReportJobType(StrEnum):
+    SIMULATION_RESULT = "SIMULATION_RESULT"
+    DEEP_INTERVIEW_GUIDE = "DEEP_INTERVIEW_GUIDE"
+    DEEP_INTERVIEW_INSIGHT = "DEEP_INTERVIEW_INSIGHT"
+    SESSION_ANALYSIS = "SESSION_ANALYSIS"
+
+
+class ReportJobStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class ReportJobCreateRequest(BaseModel):
+    jobType: ReportJobType
+    sessionId: UUID
+
+
+class ReportJobResponse(BaseModel):
+    jobId: UUID
+    jobType: ReportJobType
+    sessionId: UUID
+    status: ReportJobStatus
+    attempts: int
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    createdAt: datetime
+    startedAt: datetime | None = None
+    finishedAt: datetime | None = None
+    statusUrl: str
+    eventsUrl: str
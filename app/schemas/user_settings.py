@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class UserSettingsCreate(BaseModel):
@@ -8,4 +8,4 @@ class UserSettingsCreate(BaseModel):
 class UserSettingsResponse(BaseModel):
     success: bool
     user_id: int
-    notion_api_key: str
+    notion_api_key: str = Field(description="저장된 키의 마스킹 값 (마지막 4자리만 노출)")
@@ -1,10 +1,12 @@
 from datetime import UTC, datetime, timedelta
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.password import verify_password
+from app.core.password import averify_password
 from app.db.repositories.auth_repository import find_user_by_id
+from app.db.repositories.user_repository import aget_user_by_user_id
 from app.schemas.auth import DevTokenResponse, LoginResponse
 
 try:
@@ -13,7 +15,7 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency on local e
     pyjwt = None
 
 
-def _create_access_token(user_id: str) -> tuple[str, int]:
+def _create_access_token(user_id: str, user_pk: int) -> tuple[str, int]:
     if pyjwt is None:
         raise RuntimeError(
             "PyJWT module is missing. Install `pyjwt` to enable login token issuance."
@@ -23,16 +25,21 @@ def _create_access_token(user_id: str) -> tuple[str, int]:
     now = datetime.now(tz=UTC)
     expires_delta = timedelta(minutes=settings.jwt_access_token_expire_minutes)
     expire_at = now + expires_delta
-    payload = {"sub": user_id, "iat": int(now.timestamp()), "exp": int(expire_at.timestamp())}
+    payload = {
+        "sub": user_id,
+        "uid": user_pk,
+        "iat": int(now.timestamp()),
+        "exp": int(expire_at.timestamp()),
+    }
     token = pyjwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return token, int(expires_delta.total_seconds())
 
 
-def login_with_id_pw(db: Session, user_id: str, password: str) -> LoginResponse:
-    user = find_user_by_id(db=db, user_id=user_id)
-    if not user or not verify_password(password, user.password):
+async def login_with_id_pw(db: AsyncSession, user_id: str, password: str) -> LoginResponse:
+    user = await aget_user_by_user_id(db=db, user_id=user_id)
+    if not user or not await averify_password(password, user.password):
         return LoginResponse(success=False, message="Invalid id or password")
-    access_token, expires_in = _create_access_token(user.user_id)
+    access_token, expires_in = _create_access_token(user.user_id, user.id)
     return LoginResponse(
         success=True,
         message="Login success",
@@ -48,7 +55,7 @@ def issue_dev_token(db: Session, user_id: str) -> DevTokenResponse:
     if user is None:
         raise ValueError("User not found")
 
-    access_token, expires_in = _create_access_token(user.user_id)
+    access_token, expires_in = _create_access_token(user.user_id, user.id)
     return DevTokenResponse(
         success=True,
         message="Dev token issued",
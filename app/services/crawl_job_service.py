@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.db.entities.crawl_job import CrawlJob
+from app.db.repositories.crawl_job_repository import (
+    aclaim_crawl_jobs,
+    acomplete_crawl_job,
+    afail_crawl_job,
+    afail_expired_crawl_jobs,
+    arenew_crawl_job_leases,
+    enqueue_crawl_jobs,
+)
+from app.db.session import get_async_session_local
+from app.services.notion_sync_service import sync_notion_portfolios
+from app.services.portfolio_crawl_service import crawl_blog_portfolios
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_portfolio_crawl(db: Session, user_id: int, portfolio_ids: list[int]) -> int:
+    return enqueue_crawl_jobs(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
+
+
+def _retry_after_sec(attempts: int) -> int | None:
+    settings = get_settings()
+    if attempts >= settings.crawl_job_max_attempts:
+        return None
+    return int(settings.crawl_job_retry_base_sec * 2 ** (attempts - 1))
+
+
+# Extends the lease of jobs still being crawled so a slow batch is not reclaimed by another
+# worker; uses its own session because the crawl holds the main one.
+async def _heartbeat(job_ids: list[uuid.UUID], worker_id: str) -> None:
+    lease_sec = get_settings().crawl_job_lease_sec
+    while True:
+        await asyncio.sleep(max(1.0, lease_sec / 3))
+        try:
+            async with get_async_session_local()() as db:
+                await arenew_crawl_job_leases(
+                    db=db, job_ids=job_ids, worker_id=worker_id, lease_sec=lease_sec
+                )
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to renew crawl job leases")
+
+
+async def _run_user_jobs(user_id: int, jobs: list[CrawlJob], worker_id: str) -> None:
+    heartbeat = asyncio.create_task(_heartbeat([job.id for job in jobs], worker_id))
+    try:
+        await _crawl_user_jobs(user_id, jobs)
+    finally:
+        heartbeat.cancel()
+
+
+async def _crawl_user_jobs(user_id: int, jobs: list[CrawlJob]) -> None:
+    async with get_async_session_local()() as db:
+        portfolio_ids = [job.portfolio_id for job in jobs]
+        failures: dict[int, str]
+        try:
+            failures = await crawl_blog_portfolios(
+                db=db, user_id=user_id, portfolio_ids=portfolio_ids
+            )
+            failures.update(
+                await sync_notion_portfolios(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Crawl jobs for user %s failed", user_id)
+            await db.rollback()
+            failures = dict.fromkeys(portfolio_ids, str(exc) or exc.__class__.__name__)
+
+        for job in jobs:
+            reason = failures.get(job.portfolio_id)
+            if reason is None:
+                await acomplete_crawl_job(db=db, job=job)
+                metrics.increment("crawl_jobs", result="succeeded")
+                continue
+            retry_after = _retry_after_sec(job.attempts)
+            await afail_crawl_job(db=db, job=job, reason=reason, retry_after_sec=retry_after)
+            metrics.increment("crawl_jobs", result="failed" if retry_after is None else "retried")
+
+
+async def run_crawl_batch(worker_id: str) -> int:
+    settings = get_settings()
+    async with get_async_session_local()() as db:
+        # Jobs whose worker died on the last allowed attempt are failed, not reclaimed forever.
+        expired = await afail_expired_crawl_jobs(
+            db=db, max_attempts=settings.crawl_job_max_attempts
+        )
+        if expired:
+            metrics.increment("crawl_jobs", expired, result="failed")
+        jobs = await aclaim_crawl_jobs(
+            db=db,
+            worker_id=worker_id,
+            limit=settings.crawl_job_batch_size,
+            lease_sec=settings.crawl_job_lease_sec,
+            max_attempts=settings.crawl_job_max_attempts,
+        )
+    by_user: defaultdict[int, list[CrawlJob]] = defaultdict(list)
+    for job in jobs:
+        by_user[job.user_id].append(job)
+    await asyncio.gather(
+        *(_run_user_jobs(user_id, group, worker_id) for user_id, group in by_user.items())
+    )
+    return len(jobs)
+
+
+async def run_crawl_worker(worker_id: str, stop: asyncio.Event) -> None:
+    poll_interval = get_settings().crawl_job_poll_interval_sec
+    while not stop.is_set():
+        try:
+            claimed = await run_crawl_batch(worker_id)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to claim crawl jobs")
+            claimed = 0
+        if claimed:
+            continue
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+        except TimeoutError:
+            pass
@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core import metrics
+from app.core.config import get_settings
+
+CRAWLER_USER_AGENT = "Mozilla/5.0 (compatible; GDGHackertonBot/1.0)"
+
+
+@dataclass
+class _HostSlot:
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+_client: httpx.AsyncClient | None = None
+_global_slots: asyncio.Semaphore | None = None
+_host_slots: dict[str, _HostSlot] | None = None
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    not_modified: bool
+    text: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def get_crawl_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()
+        _client = httpx.AsyncClient(
+            timeout=settings.crawl_timeout_sec,
+            follow_redirects=True,
+            headers={"User-Agent": CRAWLER_USER_AGENT},
+            limits=httpx.Limits(max_connections=settings.crawl_max_connections),
+        )
+    return _client
+
+
+async def close_crawler() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _slots() -> tuple[asyncio.Semaphore, dict[str, _HostSlot]]:
+    global _global_slots, _host_slots
+    if _global_slots is None or _host_slots is None:
+        _global_slots = asyncio.Semaphore(get_settings().crawl_max_concurrency)
+        _host_slots = {}
+    return _global_slots, _host_slots
+
+
+# A host keeps its semaphore only while fetches for it are running or waiting, so the map
+# stays as small as the crawl in flight instead of growing with every host ever seen.
+@asynccontextmanager
+async def _host_slot(host: str, host_slots: dict[str, _HostSlot]) -> AsyncIterator[None]:
+    slot = host_slots.get(host)
+    if slot is None:
+        slot = _HostSlot(asyncio.Semaphore(get_settings().crawl_per_host_concurrency))
+        host_slots[host] = slot
+    slot.users += 1
+    try:
+        async with slot.semaphore:
+            yield
+    finally:
+        slot.users -= 1
+        if slot.users == 0 and host_slots.get(host) is slot:
+            del host_slots[host]
+
+
+async def _read_capped(response: httpx.Response, max_bytes: int) -> bytes:
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            metrics.increment("crawl_truncated_pages")
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+async def fetch_page(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> FetchResult:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    host = (urlparse(url).hostname or "").lower()
+    global_slots, host_slots = _slots()
+    async with _host_slot(host, host_slots), global_slots:
+        async with get_crawl_http_client().stream("GET", url, headers=headers) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                metrics.increment("crawl_pages", result="not_modified")
+                return FetchResult(not_modified=True, etag=etag, last_modified=last_modified)
+            response.raise_for_status()
+            body = await _read_capped(response, get_settings().crawl_max_bytes)
+
+    metrics.increment("crawl_pages", result="fetched")
+    return FetchResult(
+        not_modified=False,
+        text=body.decode(response.encoding or "utf-8", errors="replace"),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -6,23 +8,24 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.errors import NotFoundError
-from app.db.repositories.job_posting_repository import get_latest_job_posting_by_project
-from app.db.repositories.portfolio_repository import get_portfolios_by_user
-from app.db.repositories.project_portfolio_repository import list_project_portfolios
+from app.db.entities.session_v2 import UnifiedSession
 from app.db.repositories.project_repository import get_project_by_id
 from app.db.repositories.session_repository import (
     create_session,
     create_turn,
-    get_next_turn_index,
     get_session_by_id,
+    get_session_transcript,
     list_turns_by_session,
+    reserve_turn_indexes,
     update_session,
 )
+from app.db.session import unit_of_work
 from app.schemas.deep_interview import (
     DeepInterviewAnswerResponse,
     DeepInterviewGuideResponse,
     DeepInterviewProgress,
     DeepInterviewQuestion,
+    DeepInterviewQuestionDraft,
     DeepInterviewSessionResponse,
     DeepInterviewStartRequest,
     DeepInterviewStartResponse,
@@ -31,8 +34,11 @@ from app.schemas.deep_interview import (
 )
 from app.schemas.session import SessionRole
 from app.services.gemini_client import GeminiClient
+from app.services.project_context_service import get_project_context_header
+from app.services.prompt_builder import PromptBuilder
 
 MAX_QUESTIONS = 6
+CONTEXT_BUDGET_TOKENS = 3000
 
 DEEP_QUESTION_SYSTEM_PROMPT = """당신은 채용 코치이며,
 사용자의 프로젝트 이해도를 검증하는 심층 인터뷰어다.
@@ -87,61 +93,37 @@ def _build_context(
     db: Session,
     user_id: int,
     project_id: uuid.UUID,
-    turns: list[Any],
+    transcript: dict[str, Any],
 ) -> str:
-    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
-    posting = get_latest_job_posting_by_project(db=db, project_id=project_id, user_id=user_id)
-    links = list_project_portfolios(db=db, project_id=project_id, user_id=user_id)
-    portfolios = get_portfolios_by_user(
-        db=db,
-        user_id=user_id,
-        limit=20,
-        offset=0,
-        project_id=project_id,
+    lines: list[str] = []
+    for entry in transcript.get("window") or []:
+        if entry["role"] == SessionRole.AI.value:
+            lines.append(f"Q: {entry['text']}")
+        elif entry["role"] == SessionRole.USER.value:
+            lines.append(f"A: {entry['text']}")
+    builder = PromptBuilder("deep_interview", CONTEXT_BUDGET_TOKENS)
+    builder.add(
+        get_project_context_header(db=db, user_id=user_id, project_id=project_id),
+        priority=1,
     )
-
-    lines = [
-        f"지원 회사: {project.company_name if project else '미지정'}",
-        f"지원 직무: {project.role_title if project else '미지정'}",
-        f"공고 텍스트 일부: {(posting.text[:500] if posting and posting.text else '없음')}",
-        "연결된 포트폴리오 이력:",
-    ]
-    for link, portfolio_item in links[:5]:
-        lines.append(
-            f"- {portfolio_item.title} / role={link.role_type} / rep={link.is_representative}"
-        )
-    lines.append("프로젝트 귀속 포트폴리오:")
-    for portfolio in portfolios:
-        text = (portfolio.extracted_text or "").strip()
-        text_preview = text[:1200] if text else "(크롤링 텍스트 없음)"
-        lines.append(
-            "- "
-            f"type={portfolio.source_type}, rep={portfolio.is_representative}, "
-            f"url={portfolio.source_url or ''}, "
-            f"description={((portfolio.meta or {}).get('representativeDescription') or '')}, "
-            f"text={text_preview}"
-        )
-    lines.append("최근 대화:")
-    for turn in turns[-12:]:
-        if turn.role == SessionRole.AI.value:
-            lines.append(f"Q: {turn.prompt or turn.message or ''}")
-        elif turn.role == SessionRole.USER.value:
-            lines.append(f"A: {turn.user_answer or turn.message or ''}")
-    return "\n".join(lines)
+    builder.add_turns(lines, title="최근 대화:", summary=transcript.get("summary"))
+    return builder.build()
 
 
-def _generate_question_with_ai(
+async def _generate_question_with_ai(
     context: str,
     asked_count: int,
-) -> dict[str, Any]:
+) -> DeepInterviewQuestionDraft:
     gemini = GeminiClient()
-    return gemini.generate_json(
+    return await gemini.generate_json(
         system_prompt=DEEP_QUESTION_SYSTEM_PROMPT,
         user_prompt=(
             f"{context}\n\n"
             f"현재 질문 수: {asked_count}\n"
             "사용자가 프로젝트를 깊게 이해했는지 검증할 다음 질문 1개를 생성해라."
         ),
+        schema=DeepInterviewQuestionDraft,
+        call_site="deep_interview.question",
     )
 
 
@@ -174,7 +156,7 @@ def _build_rule_guide(answers: list[str]) -> list[GuideSection]:
     ]
 
 
-def _refine_guide_with_ai(
+async def _refine_guide_with_ai(
     sections: list[GuideSection],
     context: str,
 ) -> list[GuideSection]:
@@ -183,21 +165,14 @@ def _refine_guide_with_ai(
         return sections
     try:
         gemini = GeminiClient()
-        payload = gemini.generate_json(
+        payload = await gemini.generate_json(
             system_prompt=DEEP_GUIDE_SYSTEM_PROMPT,
-            user_prompt=f"{context}\n\n현재 초안: { [s.model_dump() for s in sections] }",
+            user_prompt=f"{context}\n\n현재 초안: {[s.model_dump() for s in sections]}",
+            schema=DeepInterviewGuideResponse,
+            call_site="deep_interview.guide",
+            cache=True,
         )
-        rows = payload.get("guideSections")
-        if not isinstance(rows, list) or not rows:
-            return sections
-        return [
-            GuideSection(
-                type=str(row.get("type", "GENERAL")),
-                title=str(row.get("title", "개선 포인트")),
-                items=[str(item) for item in row.get("items", [])],
-            )
-            for row in rows
-        ]
+        return payload.guideSections or sections
     except Exception:
         return sections
 
@@ -238,16 +213,43 @@ def _build_insight(answers: list[str]) -> InsightDocResponse:
     )
 
 
-def start_deep_interview(
-    db: Session,
-    user_id: int,
-    payload: DeepInterviewStartRequest,
-) -> DeepInterviewStartResponse:
+# Sync SQLAlchemy work runs in worker threads via asyncio.to_thread so that only the
+# Gemini await stays on the event loop.
+def _get_interview_session(db: Session, user_id: int, session_id: uuid.UUID) -> UnifiedSession:
+    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
+    if session is None or session.session_type != "DEEP_INTERVIEW":
+        raise NotFoundError("Deep interview session not found")
+    return session
+
+
+def _session_context(db: Session, user_id: int, session: UnifiedSession) -> str:
+    return _build_context(
+        db=db,
+        user_id=user_id,
+        project_id=session.project_id,
+        transcript=get_session_transcript(db=db, session=session),
+    )
+
+
+def _patch_session_meta(db: Session, session: UnifiedSession, patch: dict[str, Any]) -> None:
+    session.meta = {**(session.meta or {}), **patch}
+    update_session(db=db, session=session)
+
+
+def _store_result(db: Session, session: UnifiedSession, key: str, value: Any) -> None:
+    result_json = dict(session.result_json or {})
+    result_json[key] = value
+    session.result_json = result_json
+    update_session(db=db, session=session)
+
+
+def _open_interview(
+    db: Session, user_id: int, payload: DeepInterviewStartRequest
+) -> UnifiedSession:
     project = get_project_by_id(db=db, project_id=payload.projectId, user_id=user_id)
     if project is None:
         raise NotFoundError("Project not found")
-
-    session = create_session(
+    return create_session(
         db=db,
         project_id=payload.projectId,
         user_id=user_id,
@@ -259,38 +261,16 @@ def start_deep_interview(
         },
     )
 
-    question = _fallback_question(1)
-    intent = "프로젝트 핵심 의사결정 검증"
-    settings = get_settings()
-    if settings.gemini_api_key:
-        try:
-            generated = _generate_question_with_ai(
-                context=_build_context(
-                    db=db,
-                    user_id=user_id,
-                    project_id=payload.projectId,
-                    turns=[],
-                ),
-                asked_count=0,
-            )
-            question = DeepInterviewQuestion(
-                questionId="q_1",
-                prompt=str(generated.get("question", question.prompt)),
-            )
-            intent = str(generated.get("intent") or intent)
-            meta = dict(session.meta or {})
-            coverage = generated.get("coverage")
-            if isinstance(coverage, list):
-                meta["coverage"] = [str(item) for item in coverage]
-            session.meta = meta
-            update_session(db=db, session=session)
-        except Exception as exc:
-            meta = dict(session.meta or {})
-            meta["questionGeneration"] = "fallback"
-            meta["lastAiError"] = str(exc)[:500]
-            session.meta = meta
-            update_session(db=db, session=session)
 
+def _ask_first_question(
+    db: Session,
+    session: UnifiedSession,
+    question: DeepInterviewQuestion,
+    intent: str,
+    meta_patch: dict[str, Any] | None,
+) -> uuid.UUID:
+    if meta_patch is not None:
+        _patch_session_meta(db, session, meta_patch)
     create_turn(
         db=db,
         session=session,
@@ -304,95 +284,115 @@ def start_deep_interview(
         score=None,
         score_delta=None,
         meta={"questionId": question.questionId},
-        turn_index=1,
+        turn_index=reserve_turn_indexes(db=db, session=session),
+    )
+    return session.id
+
+
+async def start_deep_interview(
+    db: Session,
+    user_id: int,
+    payload: DeepInterviewStartRequest,
+) -> DeepInterviewStartResponse:
+    session = await asyncio.to_thread(_open_interview, db, user_id, payload)
+
+    question = _fallback_question(1)
+    intent = "프로젝트 핵심 의사결정 검증"
+    meta_patch: dict[str, Any] | None = None
+    settings = get_settings()
+    if settings.gemini_api_key:
+        try:
+            context = await asyncio.to_thread(_build_context, db, user_id, payload.projectId, {})
+            generated = await _generate_question_with_ai(context=context, asked_count=0)
+            question = DeepInterviewQuestion(
+                questionId="q_1",
+                prompt=generated.question or question.prompt,
+            )
+            intent = generated.intent or intent
+            meta_patch = {"coverage": generated.coverage} if generated.coverage else {}
+        except Exception as exc:
+            meta_patch = {"questionGeneration": "fallback", "lastAiError": str(exc)[:500]}
+
+    session_id = await asyncio.to_thread(
+        _ask_first_question, db, session, question, intent, meta_patch
     )
     return DeepInterviewStartResponse(
-        sessionId=session.id,
+        sessionId=session_id,
         totalQuestions=MAX_QUESTIONS,
         currentIndex=1,
         firstQuestion=question,
     )
 
 
-def submit_deep_interview_answer(
-    db: Session,
-    user_id: int,
-    session_id: uuid.UUID,
-    question_id: str,
-    answer: str,
-) -> DeepInterviewAnswerResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
-    if session is None or session.session_type != "DEEP_INTERVIEW":
-        raise NotFoundError("Deep interview session not found")
+@dataclass
+class _AnswerState:
+    session: UnifiedSession
+    current: int
+    max_questions: int
+    coverage: list[str]
+
 
+def _record_answer(
+    db: Session, user_id: int, session_id: uuid.UUID, question_id: str, answer: str
+) -> _AnswerState:
+    session = _get_interview_session(db, user_id, session_id)
     current = session.current_index
-    turn_index = get_next_turn_index(db=db, session_id=session.id)
-    create_turn(
-        db=db,
+    with unit_of_work(db):
+        create_turn(
+            db=db,
+            session=session,
+            role=SessionRole.USER.value,
+            speaker="사용자",
+            prompt=f"questionId={question_id}",
+            user_answer=answer,
+            message=answer,
+            intent=None,
+            feedback=None,
+            score=None,
+            score_delta=None,
+            meta={"questionId": question_id},
+            turn_index=reserve_turn_indexes(db=db, session=session),
+        )
+    return _AnswerState(
         session=session,
-        role=SessionRole.USER.value,
-        speaker="사용자",
-        prompt=f"questionId={question_id}",
-        user_answer=answer,
-        message=answer,
-        intent=None,
-        feedback=None,
-        score=None,
-        score_delta=None,
-        meta={"questionId": question_id},
-        turn_index=turn_index,
+        current=current,
+        max_questions=session.total_items or MAX_QUESTIONS,
+        coverage=list((session.meta or {}).get("coverage") or []),
     )
 
-    max_questions = session.total_items or MAX_QUESTIONS
-    should_stop = current >= max_questions
-    next_question = _fallback_question(current + 1)
-    next_intent = "답변 심화 검증"
-    coverage = list((session.meta or {}).get("coverage") or [])
 
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-    settings = get_settings()
-    if settings.gemini_api_key and not should_stop:
-        try:
-            generated = _generate_question_with_ai(
-                context=_build_context(
-                    db=db,
-                    user_id=user_id,
-                    project_id=session.project_id,
-                    turns=turns,
-                ),
-                asked_count=current,
-            )
-            next_question = DeepInterviewQuestion(
-                questionId=f"q_{current + 1}",
-                prompt=str(generated.get("question", next_question.prompt)),
-            )
-            next_intent = str(generated.get("intent") or next_intent)
-            should_stop = bool(generated.get("should_stop")) or should_stop
-            if isinstance(generated.get("coverage"), list):
-                coverage = [str(item) for item in generated.get("coverage")]
-        except Exception as exc:
-            meta = dict(session.meta or {})
-            meta["questionGeneration"] = "fallback"
-            meta["lastAiError"] = str(exc)[:500]
-            session.meta = meta
-            update_session(db=db, session=session)
+def _answer_context(db: Session, user_id: int, session: UnifiedSession) -> str:
+    return _build_context(
+        db=db,
+        user_id=user_id,
+        project_id=session.project_id,
+        transcript=session.transcript or {},
+    )
 
-    if not should_stop:
-        next_index = current + 1
+
+def _ask_next_question(
+    db: Session,
+    session: UnifiedSession,
+    question: DeepInterviewQuestion,
+    intent: str,
+    next_index: int,
+    coverage: list[str],
+) -> None:
+    with unit_of_work(db):
         create_turn(
             db=db,
             session=session,
             role=SessionRole.AI.value,
             speaker="AI 인터뷰어",
-            prompt=next_question.prompt,
+            prompt=question.prompt,
             user_answer=None,
-            message=next_question.prompt,
-            intent=next_intent,
+            message=question.prompt,
+            intent=intent,
             feedback=None,
             score=None,
             score_delta=None,
-            meta={"questionId": next_question.questionId},
-            turn_index=turn_index + 1,
+            meta={"questionId": question.questionId},
+            turn_index=reserve_turn_indexes(db=db, session=session),
         )
         session.current_index = next_index
         meta = dict(session.meta or {})
@@ -400,12 +400,10 @@ def submit_deep_interview_answer(
         meta["coverage"] = coverage
         session.meta = meta
         update_session(db=db, session=session)
-        return DeepInterviewAnswerResponse(
-            nextQuestion=next_question,
-            progress=DeepInterviewProgress(current=next_index, total=max_questions),
-            completed=False,
-        )
 
+
+def _complete_interview(db: Session, session: UnifiedSession, coverage: list[str]) -> None:
+    turns = list_turns_by_session(db=db, session_id=session.id, desc=False, transcript_only=True)
     answers = _collect_answers(turns)
     session.status = "COMPLETED"
     session.ended_at = datetime.now(tz=UTC)
@@ -417,6 +415,56 @@ def submit_deep_interview_answer(
         "coverage": coverage,
     }
     update_session(db=db, session=session)
+
+
+async def submit_deep_interview_answer(
+    db: Session,
+    user_id: int,
+    session_id: uuid.UUID,
+    question_id: str,
+    answer: str,
+) -> DeepInterviewAnswerResponse:
+    state = await asyncio.to_thread(_record_answer, db, user_id, session_id, question_id, answer)
+    session = state.session
+    current = state.current
+    should_stop = current >= state.max_questions
+    next_question = _fallback_question(current + 1)
+    next_intent = "답변 심화 검증"
+    coverage = state.coverage
+
+    settings = get_settings()
+    if settings.gemini_api_key and not should_stop:
+        try:
+            context = await asyncio.to_thread(_answer_context, db, user_id, session)
+            generated = await _generate_question_with_ai(context=context, asked_count=current)
+            next_question = DeepInterviewQuestion(
+                questionId=f"q_{current + 1}",
+                prompt=generated.question or next_question.prompt,
+            )
+            next_intent = generated.intent or next_intent
+            should_stop = generated.should_stop or should_stop
+            if generated.coverage:
+                coverage = generated.coverage
+        except Exception as exc:
+            await asyncio.to_thread(
+                _patch_session_meta,
+                db,
+                session,
+                {"questionGeneration": "fallback", "lastAiError": str(exc)[:500]},
+            )
+
+    if not should_stop:
+        next_index = current + 1
+        await asyncio.to_thread(
+            _ask_next_question, db, session, next_question, next_intent, next_index, coverage
+        )
+        return DeepInterviewAnswerResponse(
+            nextQuestion=next_question,
+            progress=DeepInterviewProgress(current=next_index, total=state.max_questions),
+            completed=False,
+        )
+
+    await asyncio.to_thread(_complete_interview, db, session, coverage)
     return DeepInterviewAnswerResponse(completed=True, nextStep="IMPROVEMENT_GUIDE")
 
 
@@ -425,9 +473,7 @@ def get_deep_interview_session(
     user_id: int,
     session_id: uuid.UUID,
 ) -> DeepInterviewSessionResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
-    if session is None or session.session_type != "DEEP_INTERVIEW":
-        raise NotFoundError("Deep interview session not found")
+    session = _get_interview_session(db, user_id, session_id)
 
     current_question: DeepInterviewQuestion | None = None
     if session.status != "COMPLETED":
@@ -440,76 +486,65 @@ def get_deep_interview_session(
     )
 
 
-def generate_deep_interview_guide(
+def _load_answers(
+    db: Session, user_id: int, session_id: uuid.UUID
+) -> tuple[UnifiedSession, list[str]]:
+    session = _get_interview_session(db, user_id, session_id)
+    turns = list_turns_by_session(db=db, session_id=session.id, desc=False, transcript_only=True)
+    return session, _collect_answers(turns)
+
+
+def _load_guide_inputs(
+    db: Session, user_id: int, session_id: uuid.UUID
+) -> tuple[UnifiedSession, list[str], str]:
+    session, answers = _load_answers(db, user_id, session_id)
+    return session, answers, _session_context(db, user_id, session)
+
+
+async def generate_deep_interview_guide(
     db: Session,
     user_id: int,
     session_id: uuid.UUID,
 ) -> DeepInterviewGuideResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
-    if session is None or session.session_type != "DEEP_INTERVIEW":
-        raise NotFoundError("Deep interview session not found")
-
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-    answers = _collect_answers(turns)
-    context = _build_context(db=db, user_id=user_id, project_id=session.project_id, turns=turns)
+    session, answers, context = await asyncio.to_thread(_load_guide_inputs, db, user_id, session_id)
     guide_sections = _build_rule_guide(answers)
-    guide_sections = _refine_guide_with_ai(guide_sections, context=context)
-
-    result_json = dict(session.result_json or {})
-    result_json["guideSections"] = [section.model_dump() for section in guide_sections]
-    session.result_json = result_json
-    update_session(db=db, session=session)
+    guide_sections = await _refine_guide_with_ai(guide_sections, context=context)
+
+    await asyncio.to_thread(
+        _store_result,
+        db,
+        session,
+        "guideSections",
+        [section.model_dump() for section in guide_sections],
+    )
     return DeepInterviewGuideResponse(guideSections=guide_sections)
 
 
-def get_deep_interview_insight_doc(
+async def get_deep_interview_insight_doc(
     db: Session,
     user_id: int,
     session_id: uuid.UUID,
 ) -> InsightDocResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
-    if session is None or session.session_type != "DEEP_INTERVIEW":
-        raise NotFoundError("Deep interview session not found")
-
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-    answers = _collect_answers(turns)
+    session, answers = await asyncio.to_thread(_load_answers, db, user_id, session_id)
     insight = _build_insight(answers)
     settings = get_settings()
     if settings.gemini_api_key:
         try:
             gemini = GeminiClient()
-            context = _build_context(
-                db=db,
-                user_id=user_id,
-                project_id=session.project_id,
-                turns=turns,
-            )
-            payload = gemini.generate_json(
+            context = await asyncio.to_thread(_session_context, db, user_id, session)
+            insight = await gemini.generate_json(
                 system_prompt=(
                     "너는 자소서 코치다. 대필 없이 분석문서만 작성한다. "
                     "JSON 키는 summary/strengthPoints/weakPoints/"
                     "evidenceQuotes/actionChecklist 고정."
                 ),
                 user_prompt=f"{context}\n\n현재 초안: {insight.model_dump()}",
-            )
-            insight = InsightDocResponse(
-                summary=str(payload.get("summary", insight.summary)),
-                strengthPoints=[
-                    str(x) for x in payload.get("strengthPoints", insight.strengthPoints)
-                ],
-                weakPoints=[str(x) for x in payload.get("weakPoints", insight.weakPoints)],
-                evidenceQuotes=[
-                    str(x) for x in payload.get("evidenceQuotes", insight.evidenceQuotes)
-                ],
-                actionChecklist=[
-                    str(x) for x in payload.get("actionChecklist", insight.actionChecklist)
-                ],
+                schema=InsightDocResponse,
+                call_site="deep_interview.insight",
+                cache=True,
             )
         except Exception:
             pass
 
-    result_json = dict(session.result_json or {})
-    result_json["insightDoc"] = insight.model_dump()
-    session.result_json = result_json
-    update_session(db=db, session=session)
+    await asyncio.to_thread(_store_result, db, session, "insightDoc", insight.model_dump())
     return insight
@@ -1,36 +1,81 @@
 import json
-from typing import Any, cast
+from functools import cache
+from typing import Any, overload
 
-import httpx
+from pydantic import BaseModel
 
+from app.core import metrics
 from app.core.config import get_settings
+from app.services.json_stream import repair_truncated_json
+from app.services.llm_cache import (
+    aget_cached_text,
+    astore_cached_text,
+    build_cache_key,
+    get_cached_text,
+    store_cached_text,
+)
+from app.services.llm_gateway import generate_text, generate_text_sync
 
+_SCHEMA_KEYS = ("type", "properties", "items", "required", "enum", "description", "nullable")
 
-def _extract_text(response: Any) -> str:
-    if getattr(response, "text", None):
-        return str(response.text)
 
-    candidates = getattr(response, "candidates", None) or []
-    if candidates:
-        content = getattr(candidates[0], "content", None)
-        parts = getattr(content, "parts", None) or []
-        if parts and getattr(parts[0], "text", None):
-            return str(parts[0].text)
+def _to_gemini_schema(node: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+    if "$ref" in node:
+        return _to_gemini_schema(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+    variants = node.get("anyOf")
+    if variants:
+        concrete = [variant for variant in variants if variant.get("type") != "null"]
+        converted = _to_gemini_schema({**node, **concrete[0], "anyOf": None}, defs)
+        if len(concrete) < len(variants):
+            converted["nullable"] = True
+        return converted
 
-    raise ValueError("Gemini response did not contain text")
+    schema = {key: node[key] for key in _SCHEMA_KEYS if node.get(key) is not None}
+    if "type" in schema:
+        schema["type"] = str(schema["type"]).upper()
+    if "properties" in schema:
+        schema["properties"] = {
+            name: _to_gemini_schema(child, defs) for name, child in schema["properties"].items()
+        }
+    if "items" in schema:
+        schema["items"] = _to_gemini_schema(schema["items"], defs)
+    return schema
 
 
-def _parse_json(text: str) -> dict[str, Any]:
+@cache
+def response_schema(model: type[BaseModel]) -> dict[str, Any]:
+    json_schema = model.model_json_schema()
+    return _to_gemini_schema(json_schema, json_schema.get("$defs", {}))
+
+
+def _load(text: str, schema: type[BaseModel] | None) -> Any:
+    if schema is not None:
+        return schema.model_validate_json(text)
+    parsed = json.loads(text)
+    if not isinstance(parsed, dict):
+        raise ValueError("Gemini JSON 응답이 객체가 아닙니다.")
+    return parsed
+
+
+def _parse_json(text: str, schema: type[BaseModel] | None, call_site: str) -> tuple[Any, str]:
     try:
-        parsed = json.loads(text)
-        return cast(dict[str, Any], parsed)
-    except json.JSONDecodeError:
-        start = text.find("{")
-        end = text.rfind("}")
-        if start == -1 or end == -1 or end <= start:
+        return _load(text, schema), text
+    except ValueError:
+        metrics.increment("llm_json_parse_failures", call_site=call_site)
+        repaired = repair_truncated_json(text)
+        if repaired == text:
             raise
-        parsed = json.loads(text[start : end + 1])
-        return cast(dict[str, Any], parsed)
+    parsed = _load(repaired, schema)
+    metrics.increment("llm_json_repaired", call_site=call_site)
+    return parsed, repaired
+
+
+def _cache_mode(schema: type[BaseModel] | None) -> str:
+    return "json" if schema is None else f"json:{schema.__module__}.{schema.__qualname__}"
+
+
+def _compose(system_prompt: str, user_prompt: str) -> str:
+    return f"{system_prompt}\n\n{user_prompt}" if system_prompt else user_prompt
 
 
 class GeminiClient:
@@ -40,46 +85,103 @@ class GeminiClient:
             raise RuntimeError("GEMINI_API_KEY is missing")
         self._api_key = settings.gemini_api_key
         self._model = settings.gemini_model
-        self._client: Any | None = None
-        try:
-            from google import genai
-
-            self._client = genai.Client(api_key=self._api_key)
-        except ModuleNotFoundError:
-            self._client = None
-
-    def _generate_with_http(self, prompt: str) -> str:
-        if self._model.startswith("models/"):
-            model_name = self._model.split("/", 1)[1]
-        else:
-            model_name = self._model
-        url = f"https://generativelanguage.googleapis.com/v1/models/{model_name}:generateContent"
-        params = {"key": self._api_key}
-        payload: dict[str, Any] = {"contents": [{"parts": [{"text": prompt}]}]}
-        with httpx.Client(timeout=30) as client:
-            response = client.post(url, params=params, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        try:
-            return str(data["candidates"][0]["content"]["parts"][0]["text"])
-        except (KeyError, IndexError, TypeError) as exc:
-            raise RuntimeError("Gemini HTTP response parse failed") from exc
-
-    def generate_json(self, system_prompt: str, user_prompt: str) -> dict[str, Any]:
-        prompt = f"{system_prompt}\n\n{user_prompt}"
-        if self._client is not None:
-            try:
-                response = self._client.models.generate_content(
-                    model=self._model,
-                    contents=prompt,
-                    config={"response_mime_type": "application/json"},
-                )
-            except TypeError:
-                response = self._client.models.generate_content(
-                    model=self._model,
-                    contents=prompt,
-                )
-            text = _extract_text(response)
-        else:
-            text = self._generate_with_http(prompt)
-        return _parse_json(text)
+
+    @overload
+    async def generate_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: None = None,
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def generate_json[T: BaseModel](
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[T],
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> T: ...
+
+    async def generate_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel] | None = None,
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> Any:
+        # Opt-in only: conversational call sites must not replay a stored reply, so just the
+        # deterministic ones (reports, insight docs) pass cache=True.
+        cache_key = None
+        if cache:
+            cache_key = build_cache_key(
+                self._model, system_prompt, user_prompt, _cache_mode(schema)
+            )
+            cached = await aget_cached_text(cache_key)
+            if cached is not None:
+                return _parse_json(cached, schema, call_site)[0]
+
+        text = await generate_text(
+            _compose(system_prompt, user_prompt),
+            model=self._model,
+            api_key=self._api_key,
+            json_mode=True,
+            response_schema=response_schema(schema) if schema is not None else None,
+        )
+        parsed, text = _parse_json(text, schema, call_site)
+        if cache_key is not None:
+            await astore_cached_text(cache_key, self._model, text)
+        return parsed
+
+    @overload
+    def generate_json_sync(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: None = None,
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def generate_json_sync[T: BaseModel](
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[T],
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> T: ...
+
+    def generate_json_sync(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel] | None = None,
+        call_site: str = "default",
+        cache: bool = False,
+    ) -> Any:
+        cache_key = None
+        if cache:
+            cache_key = build_cache_key(
+                self._model, system_prompt, user_prompt, _cache_mode(schema)
+            )
+            cached = get_cached_text(cache_key)
+            if cached is not None:
+                return _parse_json(cached, schema, call_site)[0]
+
+        text = generate_text_sync(
+            _compose(system_prompt, user_prompt),
+            model=self._model,
+            api_key=self._api_key,
+            json_mode=True,
+            response_schema=response_schema(schema) if schema is not None else None,
+        )
+        parsed, text = _parse_json(text, schema, call_site)
+        if cache_key is not None:
+            store_cached_text(cache_key, self._model, text)
+        return parsed
@@ -1,5 +1,10 @@
-from app.schemas.health import HealthResponse
+from app.core import metrics
+from app.schemas.health import HealthResponse, MetricsResponse
 
 
 def get_health() -> HealthResponse:
     return HealthResponse(ok=True)
+
+
+def get_metrics() -> MetricsResponse:
+    return MetricsResponse(**metrics.snapshot())
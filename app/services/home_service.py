@@ -1,10 +1,14 @@
+import hashlib
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.repositories.project_repository import list_projects_by_user
-from app.db.repositories.routine_repository import list_routine_items_by_user_date
-from app.db.repositories.user_repository import get_user_by_pk
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db.repositories.project_repository import alist_projects_by_user
+from app.db.repositories.routine_repository import alist_routine_items_by_user_date
+from app.db.repositories.user_repository import aget_user_by_pk
 from app.schemas.home import (
     CoachStatus,
     HomeProjectItem,
@@ -15,6 +19,31 @@ from app.schemas.home import (
 )
 
 
+@dataclass(frozen=True)
+class HomeSnapshot:
+    response: HomeResponse
+    etag: str
+    built_on: date
+
+
+_snapshots: TTLCache[int, HomeSnapshot] | None = None
+
+
+def _get_snapshots() -> TTLCache[int, HomeSnapshot]:
+    global _snapshots
+    if _snapshots is None:
+        settings = get_settings()
+        _snapshots = TTLCache(
+            max_entries=settings.home_snapshot_max_entries,
+            ttl_sec=settings.home_snapshot_ttl_sec,
+        )
+    return _snapshots
+
+
+def invalidate_home_snapshot(user_id: int) -> None:
+    _get_snapshots().pop(user_id)
+
+
 def _compute_dday(deadline_at: date | None) -> int | None:
     if deadline_at is None:
         return None
@@ -38,13 +67,15 @@ def _relative_time_label(value: datetime | None) -> str | None:
     return f"{delta_seconds // 604800}주 전"
 
 
-def get_home_data(db: Session, user_id: int) -> HomeResponse:
-    user = get_user_by_pk(db=db, user_pk=user_id)
+async def get_home_data(db: AsyncSession, user_id: int) -> HomeResponse:
+    user = await aget_user_by_pk(db=db, user_pk=user_id)
     if user is None:
         raise ValueError("User not found")
 
-    projects = list_projects_by_user(db=db, user_id=user_id, limit=50, offset=0)
-    routines = list_routine_items_by_user_date(db=db, user_id=user_id, routine_date=date.today())
+    projects = await alist_projects_by_user(db=db, user_id=user_id, limit=50, offset=0)
+    routines = await alist_routine_items_by_user_date(
+        db=db, user_id=user_id, routine_date=date.today()
+    )
 
     return HomeResponse(
         userCard=HomeUserCard(
@@ -82,3 +113,16 @@ def get_home_data(db: Session, user_id: int) -> HomeResponse:
         ),
     )
 
+
+async def get_home_snapshot(db: AsyncSession, user_id: int) -> HomeSnapshot:
+    snapshots = _get_snapshots()
+    today = date.today()
+    snapshot = snapshots.get(user_id)
+    if snapshot is not None and snapshot.built_on == today:
+        return snapshot
+
+    response = await get_home_data(db=db, user_id=user_id)
+    digest = hashlib.sha256(response.model_dump_json().encode("utf-8")).hexdigest()
+    snapshot = HomeSnapshot(response=response, etag=f'"{digest[:32]}"', built_on=today)
+    snapshots.set(user_id, snapshot)
+    return snapshot
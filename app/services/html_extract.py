@@ -0,0 +1,240 @@
+import re
+from collections.abc import Callable
+from html.parser import HTMLParser
+
+from app.core.config import get_settings
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ModuleNotFoundError:  # pragma: no cover - optional dependency in local env.
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+except ModuleNotFoundError:  # pragma: no cover - optional dependency in local env.
+    lxml_html = None
+    lxml_etree = None
+
+HtmlExtractor = Callable[[str, int], str]
+
+_SKIP_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "template",
+        "svg",
+        "iframe",
+        "nav",
+        "header",
+        "footer",
+        "aside",
+        "form",
+        "button",
+    }
+)
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "li",
+        "ul",
+        "ol",
+        "pre",
+        "blockquote",
+        "table",
+        "tr",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "br",
+        "hr",
+    }
+)
+# Post bodies on the blog platforms our users link (Tistory, Velog, Naver, WordPress, GitHub).
+_MAIN_CLASS_HINTS = (
+    "tt_article_useless_p_margin",
+    "contents_style",
+    "article_view",
+    "atc-content",
+    "se-main-container",
+    "post-view",
+    "entry-content",
+    "post-content",
+    "article-content",
+    "markdown-body",
+)
+_MAIN_SELECTORS = ("article", "main", "[role=main]") + tuple(
+    f'[class*="{hint}"]' for hint in _MAIN_CLASS_HINTS
+)
+_MAIN_XPATH = " | ".join(
+    ["//article", "//main", "//*[@role='main']"]
+    + [f"//*[contains(@class, '{hint}')]" for hint in _MAIN_CLASS_HINTS]
+)
+# Below this many characters a detected main node is treated as a false positive.
+_MIN_MAIN_CHARS = 200
+_INLINE_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+
+
+def normalize_text(text: str, max_chars: int) -> str:
+    lines: list[str] = []
+    size = 0
+    for raw in text.split("\n"):
+        line = _INLINE_SPACES.sub(" ", raw).strip()
+        if not line and (not lines or not lines[-1]):
+            continue
+        lines.append(line)
+        size += len(line) + 1
+        if size > max_chars:
+            break
+    return "\n".join(lines).strip()[:max_chars]
+
+
+def _is_main_start(tag: str, attrs: list[tuple[str, str | None]]) -> bool:
+    if tag in {"article", "main"}:
+        return True
+    values = dict(attrs)
+    if values.get("role") == "main":
+        return True
+    classes = values.get("class") or ""
+    return any(hint in classes for hint in _MAIN_CLASS_HINTS)
+
+
+class _TextCollector(HTMLParser):
+    def __init__(self, max_chars: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self._max_chars = max_chars
+        self._stack: list[tuple[str, bool]] = []
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._main_done = False
+        self.body: list[str] = []
+        self.main: list[str] = []
+        self._body_chars = 0
+        self._main_chars = 0
+
+    @property
+    def main_full(self) -> bool:
+        return self._main_chars >= self._max_chars
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+        if tag in _VOID_TAGS:
+            return
+        is_main = not self._main_done and _is_main_start(tag, attrs)
+        self._stack.append((tag, is_main))
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        if is_main:
+            self._main_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, is_main = self._stack.pop()
+            if open_tag in _SKIP_TAGS:
+                self._skip_depth -= 1
+            if is_main:
+                self._main_depth -= 1
+                if self._main_depth == 0 and self._main_chars >= _MIN_MAIN_CHARS:
+                    self._main_done = True
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._append(data)
+
+    def _append(self, data: str) -> None:
+        if self._body_chars < self._max_chars:
+            self.body.append(data)
+            self._body_chars += len(data)
+        if self._main_depth and not self.main_full:
+            self.main.append(data)
+            self._main_chars += len(data)
+
+
+def _extract_stdlib(html: str, max_chars: int) -> str:
+    collector = _TextCollector(max_chars)
+    # Feeding in slices lets us stop as soon as the main content is full.
+    for start in range(0, len(html), 65536):
+        collector.feed(html[start : start + 65536])
+        if collector.main_full:
+            break
+    collector.close()
+    main = normalize_text("".join(collector.main), max_chars)
+    if len(main) >= _MIN_MAIN_CHARS:
+        return main
+    return normalize_text("".join(collector.body), max_chars)
+
+
+def _extract_selectolax(html: str, max_chars: int) -> str:
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(_SKIP_TAGS))
+    for selector in _MAIN_SELECTORS:
+        node = tree.css_first(selector)
+        if node is None:
+            continue
+        text = normalize_text(node.text(separator="\n"), max_chars)
+        if len(text) >= _MIN_MAIN_CHARS:
+            return text
+    root = tree.body or tree.root
+    return normalize_text(root.text(separator="\n") if root is not None else "", max_chars)
+
+
+def _lxml_text(node) -> str:
+    return "\n".join(node.itertext())
+
+
+def _extract_lxml(html: str, max_chars: int) -> str:
+    # lxml rejects str input that carries an <?xml encoding=...?> prolog, and the text is
+    # already decoded, so it is parsed as UTF-8 bytes whatever the page declares.
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    doc = lxml_html.document_fromstring(html.encode("utf-8"), parser=parser)
+    lxml_etree.strip_elements(doc, *_SKIP_TAGS, with_tail=False)
+    for node in doc.xpath(_MAIN_XPATH):
+        text = normalize_text(_lxml_text(node), max_chars)
+        if len(text) >= _MIN_MAIN_CHARS:
+            return text
+    body = doc.find("body")
+    return normalize_text(_lxml_text(body if body is not None else doc), max_chars)
+
+
+def available_backends() -> dict[str, HtmlExtractor]:
+    backends: dict[str, HtmlExtractor] = {}
+    if LexborHTMLParser is not None:
+        backends["selectolax"] = _extract_selectolax
+    if lxml_html is not None:
+        backends["lxml"] = _extract_lxml
+    backends["stdlib"] = _extract_stdlib
+    return backends
+
+
+def get_extractor(name: str | None = None) -> HtmlExtractor:
+    backends = available_backends()
+    name = name or get_settings().html_extract_backend
+    if name == "auto":
+        return next(iter(backends.values()))
+    if name not in backends:
+        raise ValueError(f"HTML extract backend is not available: {name}")
+    return backends[name]
+
+
+def extract_text(html: str, max_chars: int, backend: str | None = None) -> str:
+    if not html:
+        return ""
+    return get_extractor(backend)(html, max_chars)
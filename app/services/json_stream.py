@@ -0,0 +1,115 @@
+import json
+from typing import Any
+
+
+class PartialArrayParser:
+    """Yields each object of ``"<key>": [...]`` as soon as it is complete in streamed JSON."""
+
+    def __init__(self, key: str) -> None:
+        self._marker = f'"{key}"'
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._closed = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = -1
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        self._buffer += chunk
+        if self._closed:
+            return []
+        if not self._in_array and not self._find_array_start():
+            return []
+
+        items: list[dict[str, Any]] = []
+        buffer = self._buffer
+        index = self._pos
+        while index < len(buffer):
+            char = buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._object_start = index
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._object_start >= 0:
+                    item = self._load(buffer[self._object_start : index + 1])
+                    if item is not None:
+                        items.append(item)
+                    self._object_start = -1
+            elif char == "]" and self._depth == 0:
+                self._closed = True
+                index += 1
+                break
+            index += 1
+        self._pos = index
+        return items
+
+    def _find_array_start(self) -> bool:
+        key_at = self._buffer.find(self._marker)
+        if key_at == -1:
+            return False
+        bracket_at = self._buffer.find("[", key_at + len(self._marker))
+        if bracket_at == -1:
+            return False
+        self._in_array = True
+        self._pos = bracket_at + 1
+        return True
+
+    @staticmethod
+    def _load(raw: str) -> dict[str, Any] | None:
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+
+def repair_truncated_json(text: str) -> str:
+    """Closes strings, arrays and objects left open by a truncated JSON response."""
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            closers.append("}")
+        elif char == "[":
+            closers.append("]")
+        elif char in "}]" and closers:
+            closers.pop()
+
+    repaired = text
+    if in_string:
+        if escaped:
+            repaired = repaired[:-1]
+        repaired += '"'
+    repaired = repaired.rstrip()
+    if repaired.endswith(","):
+        repaired = repaired[:-1]
+    elif repaired.endswith(":"):
+        repaired += "null"
+    return repaired + "".join(reversed(closers))
@@ -0,0 +1,101 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db.repositories.llm_cache_repository import get_cached_response, upsert_cached_response
+from app.db.session import get_session_local
+
+logger = logging.getLogger(__name__)
+
+_memory_cache: TTLCache[str, str] | None = None
+
+
+def _get_memory_cache() -> TTLCache[str, str]:
+    global _memory_cache
+    if _memory_cache is None:
+        settings = get_settings()
+        _memory_cache = TTLCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_sec=settings.llm_cache_ttl_sec,
+        )
+    return _memory_cache
+
+
+def build_cache_key(model: str, system_prompt: str, user_prompt: str, mode: str) -> str:
+    raw = json.dumps([mode, model, system_prompt, user_prompt], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read_db_tier(cache_key: str) -> str | None:
+    db = get_session_local()()
+    try:
+        return get_cached_response(db=db, cache_key=cache_key, now=datetime.now(tz=UTC))
+    except Exception:
+        logger.warning("LLM cache lookup failed", exc_info=True)
+        return None
+    finally:
+        db.close()
+
+
+def _write_db_tier(cache_key: str, model: str, response_text: str) -> None:
+    db = get_session_local()()
+    try:
+        upsert_cached_response(
+            db=db,
+            cache_key=cache_key,
+            model=model,
+            response_text=response_text,
+            expires_at=datetime.now(tz=UTC) + timedelta(seconds=get_settings().llm_cache_ttl_sec),
+        )
+    except Exception:
+        logger.warning("LLM cache write failed", exc_info=True)
+    finally:
+        db.close()
+
+
+def get_cached_text(cache_key: str) -> str | None:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    memory = _get_memory_cache()
+    cached = memory.get(cache_key)
+    if cached is None and settings.llm_cache_db_enabled:
+        cached = _read_db_tier(cache_key)
+        if cached is not None:
+            memory.set(cache_key, cached)
+    return cached
+
+
+def store_cached_text(cache_key: str, model: str, response_text: str) -> None:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return
+    _get_memory_cache().set(cache_key, response_text)
+    if settings.llm_cache_db_enabled:
+        _write_db_tier(cache_key, model, response_text)
+
+
+async def aget_cached_text(cache_key: str) -> str | None:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    memory = _get_memory_cache()
+    cached = memory.get(cache_key)
+    if cached is None and settings.llm_cache_db_enabled:
+        cached = await asyncio.to_thread(_read_db_tier, cache_key)
+        if cached is not None:
+            memory.set(cache_key, cached)
+    return cached
+
+
+async def astore_cached_text(cache_key: str, model: str, response_text: str) -> None:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return
+    _get_memory_cache().set(cache_key, response_text)
+    if settings.llm_cache_db_enabled:
+        await asyncio.to_thread(_write_db_tier, cache_key, model, response_text)
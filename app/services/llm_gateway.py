@@ -0,0 +1,180 @@
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from app.core.config import get_settings
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_ENABLED = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency in local env.
+    _HTTP2_ENABLED = False
+
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com"
+DEFAULT_GEMINI_MODEL = "models/gemini-2.5-flash"
+
+_async_client: httpx.AsyncClient | None = None
+_sync_client: httpx.Client | None = None
+
+
+def _client_options() -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "base_url": GEMINI_BASE_URL,
+        "http2": _HTTP2_ENABLED,
+        "timeout": httpx.Timeout(
+            settings.gemini_timeout_sec,
+            connect=settings.gemini_connect_timeout_sec,
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.gemini_max_connections,
+            max_keepalive_connections=settings.gemini_max_keepalive_connections,
+            keepalive_expiry=settings.gemini_keepalive_expiry_sec,
+        ),
+    }
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(**_client_options())
+    return _async_client
+
+
+def get_sync_http_client() -> httpx.Client:
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(**_client_options())
+    return _sync_client
+
+
+async def start_llm_gateway() -> None:
+    get_async_http_client()
+
+
+async def close_llm_gateway() -> None:
+    global _async_client, _sync_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+def _resolve_model(model: str | None) -> str:
+    name = (model or get_settings().gemini_model or DEFAULT_GEMINI_MODEL).strip()
+    return name if name.startswith("models/") else f"models/{name}"
+
+
+def _resolve_api_key(api_key: str | None) -> str:
+    key = api_key or get_settings().gemini_api_key
+    if not key:
+        raise RuntimeError("GEMINI_API_KEY is missing")
+    return key
+
+
+def _build_request(
+    prompt: str,
+    model: str | None,
+    api_key: str | None,
+    json_mode: bool,
+    method: str = "generateContent",
+    response_schema: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    url = f"/v1beta/{_resolve_model(model)}:{method}"
+    headers = {"x-goog-api-key": _resolve_api_key(api_key)}
+    payload: dict[str, Any] = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+    if json_mode:
+        payload["generationConfig"] = {"responseMimeType": "application/json"}
+        if response_schema is not None:
+            payload["generationConfig"]["responseSchema"] = response_schema
+    return url, headers, payload
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise RuntimeError(f"Gemini API 오류: {response.status_code} {response.text}") from exc
+
+
+def _extract_parts_text(data: Any) -> str:
+    try:
+        parts = data["candidates"][0]["content"]["parts"]
+        return "".join(str(part.get("text", "")) for part in parts)
+    except (KeyError, IndexError, TypeError, AttributeError) as exc:
+        raise RuntimeError("Gemini 응답을 파싱할 수 없습니다.") from exc
+
+
+def _extract_text(data: Any) -> str:
+    text = _extract_parts_text(data)
+    if not text:
+        raise RuntimeError("Gemini 응답에 텍스트가 없습니다.")
+    return text
+
+
+async def generate_text(
+    prompt: str,
+    model: str | None = None,
+    api_key: str | None = None,
+    json_mode: bool = False,
+    response_schema: dict[str, Any] | None = None,
+) -> str:
+    url, headers, payload = _build_request(
+        prompt, model, api_key, json_mode, response_schema=response_schema
+    )
+    response = await get_async_http_client().post(url, headers=headers, json=payload)
+    _raise_for_status(response)
+    return _extract_text(response.json())
+
+
+def generate_text_sync(
+    prompt: str,
+    model: str | None = None,
+    api_key: str | None = None,
+    json_mode: bool = False,
+    response_schema: dict[str, Any] | None = None,
+) -> str:
+    url, headers, payload = _build_request(
+        prompt, model, api_key, json_mode, response_schema=response_schema
+    )
+    response = get_sync_http_client().post(url, headers=headers, json=payload)
+    _raise_for_status(response)
+    return _extract_text(response.json())
+
+
+async def stream_text(
+    prompt: str,
+    model: str | None = None,
+    api_key: str | None = None,
+    json_mode: bool = False,
+) -> AsyncIterator[str]:
+    url, headers, payload = _build_request(
+        prompt, model, api_key, json_mode, method="streamGenerateContent"
+    )
+    client = get_async_http_client()
+    async with client.stream(
+        "POST", url, params={"alt": "sse"}, headers=headers, json=payload
+    ) as response:
+        if response.is_error:
+            await response.aread()
+            _raise_for_status(response)
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            raw = line[len("data:") :].strip()
+            if not raw:
+                continue
+            try:
+                chunk = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                raise RuntimeError("Gemini 응답을 파싱할 수 없습니다.") from exc
+            if not chunk.get("candidates"):
+                continue
+            text = _extract_parts_text(chunk)
+            if text:
+                yield text
@@ -9,9 +9,9 @@ from app.db.repositories.project_repository import get_project_by_id
 from app.db.repositories.session_repository import (
     create_session,
     create_turn,
-    get_next_turn_index,
     get_session_by_id,
     list_turns_by_session,
+    reserve_turn_indexes,
     update_session,
 )
 from app.schemas.mock_interview import (
@@ -189,7 +189,7 @@ def start_mock_interview(
         score=None,
         score_delta=None,
         meta={"questionId": first["questionId"], "modelAnswer": first["modelAnswer"]},
-        turn_index=1,
+        turn_index=reserve_turn_indexes(db=db, session=session),
     )
     session.current_index = 1
     update_session(db=db, session=session)
@@ -223,7 +223,6 @@ def answer_mock_interview(
         raise ValueError(f"Expected questionId={expected['questionId']}")
 
     score, feedback = _score_answer(answer)
-    turn_index = get_next_turn_index(db=db, session_id=session.id)
     create_turn(
         db=db,
         session=session,
@@ -237,7 +236,7 @@ def answer_mock_interview(
         score=score,
         score_delta=None,
         meta={"questionId": question_id, "modelAnswer": expected["modelAnswer"]},
-        turn_index=turn_index,
+        turn_index=reserve_turn_indexes(db=db, session=session),
     )
 
     result_json = dict(session.result_json or {})
@@ -277,7 +276,7 @@ def answer_mock_interview(
                 "questionId": next_question["questionId"],
                 "modelAnswer": next_question["modelAnswer"],
             },
-            turn_index=turn_index + 1,
+            turn_index=reserve_turn_indexes(db=db, session=session),
         )
         session.current_index = next_index
         update_session(db=db, session=session)
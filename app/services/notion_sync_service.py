@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from notion_client import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.db.repositories.portfolio_repository import (
+    aget_portfolios_by_ids,
+    amark_portfolio_crawl_failed,
+    aupdate_portfolio_extracted_text,
+)
+from app.services.html_extract import normalize_text
+from app.services.project_context_service import invalidate_project_context
+from app.services.user_settings_service import aget_notion_key
+
+_MAX_TEXT_LENGTH = 20000
+_MAX_BLOCK_DEPTH = 8
+_PAGE_ID_SUFFIX = re.compile(r"([0-9a-fA-F]{32})$")
+# Child pages are synced as their own unit, so the parent walk does not descend into them.
+_PAGE_BLOCK_TYPES = frozenset({"child_page", "child_database"})
+
+
+@dataclass
+class NotionSyncResult:
+    text: str = ""
+    pages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    fetched_pages: int = 0
+    reused_pages: int = 0
+    truncated: bool = False
+
+
+def parse_notion_page_id(url: str | None) -> str | None:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    candidates = parse_qs(parsed.query).get("p", [])
+    candidates.append(parsed.path.rstrip("/").rsplit("/", 1)[-1])
+    for candidate in candidates:
+        match = _PAGE_ID_SUFFIX.search(candidate.replace("-", ""))
+        if match:
+            return str(uuid.UUID(match.group(1)))
+    return None
+
+
+def _rich_text(items: list[dict[str, Any]] | None) -> str:
+    return "".join(item.get("plain_text", "") for item in items or [])
+
+
+def block_text(block: dict[str, Any]) -> str:
+    block_type = block.get("type", "")
+    body = block.get(block_type) or {}
+    if block_type == "table_row":
+        return " | ".join(_rich_text(cell) for cell in body.get("cells", []))
+    if block_type == "child_database":
+        return str(body.get("title") or "")
+    return _rich_text(body.get("rich_text"))
+
+
+def _page_title(page: dict[str, Any]) -> str:
+    for prop in (page.get("properties") or {}).values():
+        if prop.get("type") == "title":
+            return _rich_text(prop.get("title"))
+    return ""
+
+
+async def _list_children(
+    client: AsyncClient, slots: asyncio.Semaphore, block_id: str
+) -> list[dict[str, Any]]:
+    blocks: list[dict[str, Any]] = []
+    params: dict[str, Any] = {"page_size": 100}
+    while True:
+        async with slots:
+            response = await client.blocks.children.list(block_id=block_id, **params)
+        blocks.extend(response.get("results", []))
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            return blocks
+        params["start_cursor"] = cursor
+
+
+def _descends(block: dict[str, Any], depth: int) -> bool:
+    return (
+        bool(block.get("has_children"))
+        and block.get("type") not in _PAGE_BLOCK_TYPES
+        and depth < _MAX_BLOCK_DEPTH
+    )
+
+
+async def _walk_blocks(
+    client: AsyncClient, slots: asyncio.Semaphore, block_id: str, depth: int = 0
+) -> tuple[list[str], list[str]]:
+    blocks = await _list_children(client, slots, block_id)
+    nested = await asyncio.gather(
+        *(
+            _walk_blocks(client, slots, block["id"], depth + 1)
+            for block in blocks
+            if _descends(block, depth)
+        )
+    )
+    lines: list[str] = []
+    child_pages: list[str] = []
+    nested_iter = iter(nested)
+    for block in blocks:
+        if block.get("type") == "child_page":
+            child_pages.append(block["id"])
+            continue
+        lines.append(block_text(block))
+        if _descends(block, depth):
+            nested_lines, nested_pages = next(nested_iter)
+            lines.extend(nested_lines)
+            child_pages.extend(nested_pages)
+    return lines, child_pages
+
+
+def _cached_segment(
+    cached: dict[str, Any] | None, last_edited_time: str | None, previous_text: str
+) -> str | None:
+    if not cached or not last_edited_time or cached.get("lastEditedTime") != last_edited_time:
+        return None
+    start, end = cached.get("start"), cached.get("end")
+    if not isinstance(start, int) or not isinstance(end, int) or not 0 <= start <= end:
+        return None
+    if end > len(previous_text):
+        return None
+    return previous_text[start:end]
+
+
+async def fetch_notion_text(
+    client: AsyncClient,
+    root_page_id: str,
+    previous_pages: dict[str, dict[str, Any]] | None = None,
+    previous_text: str = "",
+    max_chars: int = _MAX_TEXT_LENGTH,
+    max_pages: int = 50,
+    concurrency: int = 3,
+) -> NotionSyncResult:
+    previous_pages = previous_pages or {}
+    slots = asyncio.Semaphore(max(1, concurrency))
+    result = NotionSyncResult()
+    segments: list[str] = []
+    size = 0
+    pending = [root_page_id]
+    while pending:
+        if size >= max_chars or len(result.pages) >= max_pages:
+            result.truncated = True
+            break
+        page_id = pending.pop(0)
+        if page_id in result.pages:
+            continue
+        async with slots:
+            page = await client.pages.retrieve(page_id=page_id)
+        if page.get("archived") or page.get("in_trash"):
+            continue
+        last_edited_time = page.get("last_edited_time")
+        cached = previous_pages.get(page_id)
+        segment = _cached_segment(cached, last_edited_time, previous_text)
+        if segment is not None and cached is not None:
+            child_pages = list(cached.get("children") or [])
+            result.reused_pages += 1
+        else:
+            lines, child_pages = await _walk_blocks(client, slots, page_id)
+            segment = normalize_text("\n".join([_page_title(page), *lines]), max_chars)
+            result.fetched_pages += 1
+
+        start = size + 2 if segments else 0
+        segments.append(segment)
+        size = start + len(segment)
+        result.pages[page_id] = {
+            "lastEditedTime": last_edited_time,
+            "start": start,
+            "end": size,
+            "children": child_pages,
+        }
+        # Depth-first, so a child page's text follows its parent like in the Notion outline.
+        pending[0:0] = child_pages
+
+    result.truncated = result.truncated or size > max_chars
+    result.text = "\n\n".join(segments)[:max_chars]
+    return result
+
+
+def _new_client(token: str) -> AsyncClient:
+    settings = get_settings()
+    return AsyncClient(
+        auth=token,
+        base_url=settings.notion_api_base_url.rstrip("/"),
+        timeout_ms=int(settings.notion_timeout_sec * 1000),
+    )
+
+
+async def sync_notion_portfolios(
+    db: AsyncSession, user_id: int, portfolio_ids: list[int]
+) -> dict[int, str]:
+    settings = get_settings()
+    failures: dict[int, str] = {}
+    rows = await aget_portfolios_by_ids(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
+    targets = []
+    for row in rows:
+        if row.source_type != "notion":
+            continue
+        page_id = parse_notion_page_id(row.source_url)
+        if page_id is None:
+            await amark_portfolio_crawl_failed(db=db, portfolio=row, reason="invalid notion url")
+            continue
+        targets.append((row, page_id))
+    if not targets:
+        return failures
+
+    token = await aget_notion_key(db=db, user_id=user_id) or settings.notion_api_key
+    if not token:
+        for row, _ in targets:
+            failures[row.id] = "notion api key is not configured"
+            await amark_portfolio_crawl_failed(db=db, portfolio=row, reason=failures[row.id])
+        return failures
+
+    client = _new_client(token)
+    try:
+        for row, page_id in targets:
+            meta = row.meta or {}
+            try:
+                result = await fetch_notion_text(
+                    client,
+                    page_id,
+                    previous_pages=meta.get("notionPages"),
+                    previous_text=row.extracted_text or "",
+                    max_chars=_MAX_TEXT_LENGTH,
+                    max_pages=settings.notion_max_pages,
+                    concurrency=settings.notion_max_concurrency,
+                )
+            except Exception as exc:
+                failures[row.id] = str(exc) or exc.__class__.__name__
+                await amark_portfolio_crawl_failed(db=db, portfolio=row, reason=failures[row.id])
+                continue
+            metrics.increment("notion_pages", result.fetched_pages, result="fetched")
+            metrics.increment("notion_pages", result.reused_pages, result="reused")
+            await aupdate_portfolio_extracted_text(
+                db=db,
+                portfolio=row,
+                extracted_text=result.text,
+                meta_patch={
+                    "crawlStatus": "SUCCESS",
+                    "crawlUpdatedAt": datetime.now(tz=UTC).isoformat(),
+                    "crawlSource": "notion",
+                    "crawlTextLength": len(result.text),
+                    "crawlTruncated": result.truncated,
+                    "notionPages": result.pages,
+                    "notionPagesFetched": result.fetched_pages,
+                    "notionPagesReused": result.reused_pages,
+                },
+            )
+    finally:
+        await client.aclose()
+    invalidate_project_context(user_id)
+    return failures
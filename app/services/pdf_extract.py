@@ -0,0 +1,185 @@
+import asyncio
+import mmap
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, cast
+
+from fastapi import UploadFile
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.services.html_extract import normalize_text
+
+try:
+    from pypdf import PdfReader
+except ModuleNotFoundError:  # pragma: no cover - optional dependency in local env.
+    PdfReader = None  # type: ignore[assignment,misc]
+
+_SPOOL_CHUNK_BYTES = 1 << 20
+_active_executors: set[ProcessPoolExecutor] = set()
+_idle_executors: list[ProcessPoolExecutor] = []
+_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+@dataclass
+class PdfExtractResult:
+    text: str = ""
+    page_count: int = 0
+    pages_read: int = 0
+    timed_out_pages: list[int] = field(default_factory=list)
+    failed_pages: list[int] = field(default_factory=list)
+    truncated: bool = False
+
+
+async def spool_upload(upload: UploadFile, max_bytes: int) -> Path:
+    fd, name = tempfile.mkstemp(prefix="portfolio-", suffix=".pdf")
+    path = Path(name)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await upload.read(_SPOOL_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError("PDF file is too large")
+                out.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+# Runs inside pool workers: each worker keeps the mmap-backed reader of the file it is
+# working on, so pages are decoded lazily from the page cache instead of the heap.
+@lru_cache(maxsize=2)
+def _open_reader(path: str, stamp: tuple[int, int]) -> Any:
+    if PdfReader is None:
+        raise RuntimeError("pypdf is not installed")
+    with open(path, "rb") as handle:
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return PdfReader(cast(IO[bytes], buffer))
+
+
+def _page_count(path: str, stamp: tuple[int, int]) -> int:
+    return len(_open_reader(path, stamp).pages)
+
+
+def _extract_page(path: str, stamp: tuple[int, int], index: int) -> str:
+    return _open_reader(path, stamp).pages[index].extract_text() or ""
+
+
+def _mp_context() -> Any:
+    # Workers fork from a server that has already imported this module, so replacing a
+    # killed pool is cheap; spawn is the fallback where forkserver is unavailable.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _new_executor() -> ProcessPoolExecutor:
+    executor = ProcessPoolExecutor(
+        max_workers=max(1, get_settings().pdf_extract_workers), mp_context=_mp_context()
+    )
+    _active_executors.add(executor)
+    return executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    _active_executors.discard(executor)
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _pool_slots() -> asyncio.Semaphore:
+    global _slots
+    loop = asyncio.get_running_loop()
+    if _slots is None or _slots[0] is not loop:
+        _slots = (loop, asyncio.Semaphore(max(1, get_settings().pdf_extract_max_pools)))
+    return _slots[1]
+
+
+# At most PDF_EXTRACT_MAX_POOLS pools exist, and an extraction has one to itself while it
+# runs: a page stuck in the parser can only be stopped by killing its worker, and that must
+# only hit the pool serving that upload.
+async def _checkout_executor() -> ProcessPoolExecutor:
+    await _pool_slots().acquire()
+    return _idle_executors.pop() if _idle_executors else _new_executor()
+
+
+def _checkin_executor(executor: ProcessPoolExecutor) -> None:
+    if executor in _active_executors:
+        _idle_executors.append(executor)
+    _pool_slots().release()
+
+
+async def _run_with_timeout(
+    executor: ProcessPoolExecutor, timeout: float, func: Any, *args: Any
+) -> Any:
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(loop.run_in_executor(executor, func, *args), timeout)
+
+
+async def extract_pdf_text(path: Path, max_chars: int) -> PdfExtractResult:
+    settings = get_settings()
+    timeout = settings.pdf_page_timeout_sec
+    stat = path.stat()
+    stamp = (stat.st_ino, stat.st_mtime_ns)
+    result = PdfExtractResult()
+    parts: list[str] = []
+    size = 0
+    batch_size = max(1, settings.pdf_extract_workers)
+    executor = await _checkout_executor()
+    try:
+        page_count = await _run_with_timeout(executor, timeout, _page_count, str(path), stamp)
+        limit = min(page_count, max(0, settings.pdf_max_pages))
+        result.page_count = page_count
+        result.truncated = page_count > limit
+        for start in range(0, limit, batch_size):
+            indexes = range(start, min(start + batch_size, limit))
+            outcomes = await asyncio.gather(
+                *(
+                    _run_with_timeout(executor, timeout, _extract_page, str(path), stamp, index)
+                    for index in indexes
+                ),
+                return_exceptions=True,
+            )
+            timed_out = 0
+            for index, outcome in zip(indexes, outcomes, strict=True):
+                if isinstance(outcome, TimeoutError):
+                    result.timed_out_pages.append(index + 1)
+                    timed_out += 1
+                elif isinstance(outcome, BaseException):
+                    result.failed_pages.append(index + 1)
+                elif outcome:
+                    parts.append(outcome)
+                    size += len(outcome)
+            result.pages_read = indexes[-1] + 1
+            if timed_out:
+                metrics.increment("pdf_page_timeouts", timed_out)
+                _discard_executor(executor)
+                executor = _new_executor()
+            if size >= max_chars:
+                result.truncated = result.truncated or result.pages_read < limit
+                break
+    except BaseException:
+        _discard_executor(executor)
+        raise
+    finally:
+        _checkin_executor(executor)
+
+    result.text = normalize_text("\n\n".join(parts), max_chars)
+    metrics.increment("pdf_pages_extracted", result.pages_read)
+    return result
+
+
+def close_pdf_extractor() -> None:
+    _idle_executors.clear()
+    for executor in list(_active_executors):
+        _discard_executor(executor)
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
-import re
+import asyncio
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
-import httpx
-from bs4 import BeautifulSoup
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.entities.portfolio import Portfolio
 from app.db.repositories.portfolio_repository import (
-    get_portfolios_by_ids,
-    mark_portfolio_crawl_failed,
-    update_portfolio_extracted_text,
+    aget_portfolios_by_ids,
+    amark_portfolio_crawl_failed,
+    aupdate_portfolio_extracted_text,
 )
-from app.db.session import get_session_local
+from app.services.crawler import FetchResult, fetch_page
+from app.services.html_extract import extract_text
+from app.services.project_context_service import invalidate_project_context
 
 _MAX_TEXT_LENGTH = 20000
 
 
+@dataclass
+class _CrawlOutcome:
+    portfolio: Portfolio
+    result: FetchResult | None = None
+    text: str | None = None
+    error: str | None = None
+
+
 def _is_http_url(value: str | None) -> bool:
     if not value:
         return False
@@ -24,57 +35,58 @@ def _is_http_url(value: str | None) -> bool:
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
 
-def _normalize_text(text: str) -> str:
-    compact = re.sub(r"[ \t]+", " ", text)
-    compact = re.sub(r"\n{3,}", "\n\n", compact)
-    return compact.strip()
-
-
-def _extract_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    text = soup.get_text(separator="\n")
-    normalized = _normalize_text(text)
-    return normalized[:_MAX_TEXT_LENGTH]
-
+async def _crawl_portfolio(portfolio: Portfolio) -> _CrawlOutcome:
+    meta = portfolio.meta or {}
+    has_text = bool(portfolio.extracted_text)
+    try:
+        result = await fetch_page(
+            portfolio.source_url or "",
+            etag=meta.get("crawlEtag") if has_text else None,
+            last_modified=meta.get("crawlLastModified") if has_text else None,
+        )
+        if result.not_modified:
+            return _CrawlOutcome(portfolio, result=result)
+        text = await asyncio.to_thread(extract_text, result.text or "", _MAX_TEXT_LENGTH)
+        return _CrawlOutcome(portfolio, result=result, text=text)
+    except Exception as exc:
+        return _CrawlOutcome(portfolio, error=str(exc))
 
-def _crawl_blog_text(url: str) -> str:
-    with httpx.Client(
-        timeout=20,
-        follow_redirects=True,
-        headers={"User-Agent": "Mozilla/5.0 (compatible; GDGHackertonBot/1.0)"},
-    ) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return _extract_text_from_html(response.text)
 
+async def crawl_blog_portfolios(
+    db: AsyncSession, user_id: int, portfolio_ids: list[int]
+) -> dict[int, str]:
+    failures: dict[int, str] = {}
+    rows = await aget_portfolios_by_ids(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
+    targets: list[Portfolio] = []
+    for row in rows:
+        if row.source_type != "blog":
+            continue
+        if not _is_http_url(row.source_url):
+            await amark_portfolio_crawl_failed(db=db, portfolio=row, reason="invalid blog url")
+            continue
+        targets.append(row)
 
-def crawl_blog_portfolios_background(user_id: int, portfolio_ids: list[int]) -> None:
-    session_local = get_session_local()
-    db = session_local()
-    try:
-        rows = get_portfolios_by_ids(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
-        for row in rows:
-            if row.source_type != "blog":
-                continue
-            if not _is_http_url(row.source_url):
-                mark_portfolio_crawl_failed(db=db, portfolio=row, reason="invalid blog url")
-                continue
-            try:
-                text = _crawl_blog_text(row.source_url)
-                update_portfolio_extracted_text(
-                    db=db,
-                    portfolio=row,
-                    extracted_text=text,
-                    meta_patch={
-                        "crawlStatus": "SUCCESS",
-                        "crawlUpdatedAt": datetime.now(tz=UTC).isoformat(),
-                        "crawlSource": "blog",
-                        "crawlTextLength": len(text),
-                    },
-                )
-            except Exception as exc:
-                mark_portfolio_crawl_failed(db=db, portfolio=row, reason=str(exc))
-    finally:
-        db.close()
+    for pending in asyncio.as_completed([_crawl_portfolio(row) for row in targets]):
+        outcome = await pending
+        if outcome.result is None:
+            reason = outcome.error or "crawl failed"
+            failures[outcome.portfolio.id] = reason
+            await amark_portfolio_crawl_failed(db=db, portfolio=outcome.portfolio, reason=reason)
+            continue
+        text = outcome.portfolio.extracted_text if outcome.text is None else outcome.text
+        await aupdate_portfolio_extracted_text(
+            db=db,
+            portfolio=outcome.portfolio,
+            extracted_text=text,
+            meta_patch={
+                "crawlStatus": "SUCCESS",
+                "crawlUpdatedAt": datetime.now(tz=UTC).isoformat(),
+                "crawlSource": "blog",
+                "crawlTextLength": len(text),
+                "crawlNotModified": outcome.result.not_modified,
+                "crawlEtag": outcome.result.etag,
+                "crawlLastModified": outcome.result.last_modified,
+            },
+        )
+    invalidate_project_context(user_id)
+    return failures
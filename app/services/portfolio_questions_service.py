@@ -1,6 +1,3 @@
-import json
-import re
-
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -9,9 +6,13 @@ from app.db.repositories.portfolio_repository import get_portfolio_by_id
 from app.schemas.portfolio import (
     PortfolioConversationTurn,
     PortfolioQAItem,
+    PortfolioQuestionDraft,
     PortfolioQuestionsResponse,
 )
-from app.services.portfolio_llm_service import call_gemini
+from app.services.gemini_client import GeminiClient
+from app.services.prompt_builder import PromptBuilder
+
+PORTFOLIO_QUESTIONS_BUDGET_TOKENS = 4000
 
 
 def build_portfolio_questions_prompt(
@@ -27,36 +28,31 @@ def build_portfolio_questions_prompt(
         "사용자가 '그만하기' 버튼을 누르면 즉시 질문 생성을 중단하고 종료 안내만 한다.\n"
     )
 
-    conversation_text = (
-        "\n".join(
-            f"{'AI' if turn.role == 'assistant' else '사용자'}: {turn.content}"
-            for turn in conversation
-        )
-        if conversation
-        else "대화 없음"
-    )
+    conversation_lines = [
+        f"{'AI' if turn.role == 'assistant' else '사용자'}: {turn.content}" for turn in conversation
+    ]
 
-    base_prompt = (
-        "[포트폴리오 요약]\n"
-        f"{portfolio_summary}\n\n"
-        "[대화 내용]\n"
-        f"{conversation_text}\n\n"
+    builder = PromptBuilder("portfolio_questions", PORTFOLIO_QUESTIONS_BUDGET_TOKENS)
+    builder.add(role_prompt + f"stop_requested={str(stop_requested).lower()}")
+    builder.add(portfolio_summary, priority=2, title="[포트폴리오 요약]")
+    builder.add_turns(conversation_lines or ["대화 없음"], priority=1, title="[대화 내용]")
+    builder.add(
         "[요청]\n"
         "위 포트폴리오 요약과 기존 대화를 참고해서, 사용자가 포트폴리오를 더 깊게 이해하도록\n"
         "유도 질문을 1개만 작성하라. 질문은 반드시 구체적이어야 하며, 포트폴리오의 맥락을\n"
         "되짚게 만드는 질문이어야 한다.\n"
         "사용자의 직전 답변을 고려해 꼬리질문을 해도 되고, 새로운 내용에 대한 질문도 가능하다.\n"
-        "단, 사용자가 '그만하기' 버튼을 눌렀다면 질문을 만들지 말고 종료 문구만 출력하라.\n\n"
+        "단, 사용자가 '그만하기' 버튼을 눌렀다면 질문을 만들지 말고 종료 문구만 출력하라."
+    )
+    builder.add(
         "[출력형식]\n"
         "{\n"
         '  "question": "질문 한 개 또는 null",\n'
         '  "message": "종료 문구 또는 null"\n'
         "}\n"
-        "반드시 JSON만 출력하고, 코드펜스(```)나 추가 텍스트는 금지한다.\n"
+        "반드시 JSON만 출력하고, 코드펜스(```)나 추가 텍스트는 금지한다."
     )
-
-    stop_line = f"stop_requested={str(stop_requested).lower()}\n"
-    return role_prompt + stop_line + base_prompt
+    return builder.build()
 
 
 def generate_portfolio_questions(
@@ -97,24 +93,20 @@ def generate_portfolio_questions(
         conversation=conversation,
         stop_requested=stop_requested,
     )
-    model_output = call_gemini(prompt, settings.gemini_model, settings.gemini_api_key).strip()
-
-    fenced_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", model_output, re.DOTALL)
-    if fenced_match:
-        model_output = fenced_match.group(1).strip()
-
     try:
-        data = json.loads(model_output)
-        question = data.get("question")
-        message = data.get("message")
-    except json.JSONDecodeError:
-        question = model_output
-        message = None
+        draft = GeminiClient().generate_json_sync(
+            system_prompt="",
+            user_prompt=prompt,
+            schema=PortfolioQuestionDraft,
+            call_site="portfolio_questions",
+        )
+    except ValueError as exc:
+        raise RuntimeError("포트폴리오 질문 응답을 해석할 수 없습니다.") from exc
 
-    if not question and message:
+    if not draft.question and draft.message:
         return PortfolioQuestionsResponse(
-            portfolio_id=portfolio_id, message=str(message), qa_item=None
+            portfolio_id=portfolio_id, message=draft.message, qa_item=None
         )
 
-    qa_item = PortfolioQAItem(question=str(question) if question else None)
+    qa_item = PortfolioQAItem(question=draft.question)
     return PortfolioQuestionsResponse(portfolio_id=portfolio_id, message=None, qa_item=qa_item)
@@ -1,18 +1,29 @@
+import asyncio
 import uuid
+from datetime import UTC, datetime
+from pathlib import Path
 
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
+from app.db.entities.portfolio import Portfolio
 from app.db.repositories.portfolio_repository import (
-    count_portfolios_by_user,
     create_portfolio,
     get_portfolio_by_id,
-    get_portfolios_by_user,
+    page_portfolios_by_user,
+    update_portfolio_extracted_text,
 )
 from app.db.repositories.portfolio_repository import (
     delete_portfolio as delete_portfolio_repo,
 )
 from app.schemas.portfolio import PortfolioListResponse, PortfolioResponse, PortfolioSourceType
+from app.services.crawl_job_service import enqueue_portfolio_crawl
+from app.services.pdf_extract import extract_pdf_text, spool_upload
+from app.services.project_context_service import invalidate_project_context
+
+_MAX_TEXT_LENGTH = 20000
+_CRAWLED_SOURCE_TYPES = frozenset({"blog", "notion"})
 
 
 def _to_portfolio_response(portfolio) -> PortfolioResponse:
@@ -29,6 +40,40 @@ def _to_portfolio_response(portfolio) -> PortfolioResponse:
     )
 
 
+async def _store_pdf_text(db: Session, portfolio: Portfolio, path: Path) -> Portfolio:
+    try:
+        result = await extract_pdf_text(path, _MAX_TEXT_LENGTH)
+    except Exception as exc:
+        return await asyncio.to_thread(
+            update_portfolio_extracted_text,
+            db=db,
+            portfolio=portfolio,
+            extracted_text="",
+            meta_patch={
+                "extractStatus": "FAILED",
+                "extractError": (str(exc) or type(exc).__name__)[:500],
+                "extractUpdatedAt": datetime.now(tz=UTC).isoformat(),
+            },
+        )
+    return await asyncio.to_thread(
+        update_portfolio_extracted_text,
+        db=db,
+        portfolio=portfolio,
+        extracted_text=result.text,
+        meta_patch={
+            "extractStatus": "SUCCESS",
+            "extractUpdatedAt": datetime.now(tz=UTC).isoformat(),
+            "extractSource": "pdf",
+            "extractTextLength": len(result.text),
+            "extractPageCount": result.page_count,
+            "extractPagesRead": result.pages_read,
+            "extractTimedOutPages": result.timed_out_pages,
+            "extractFailedPages": result.failed_pages,
+            "extractTruncated": result.truncated,
+        },
+    )
+
+
 async def upload_portfolio(
     db: Session,
     user_id: int,
@@ -40,18 +85,34 @@ async def upload_portfolio(
     meta: dict | None = None,
 ) -> PortfolioResponse:
     extracted_text = ""
+    pdf_path = None
+    if pdf_file is not None and source_type == PortfolioSourceType.PDF:
+        pdf_path = await spool_upload(pdf_file, get_settings().pdf_max_bytes)
 
-    portfolio = create_portfolio(
-        db=db,
-        user_id=user_id,
-        source_type=source_type.value,
-        source_url=source_url,
-        original_filename=pdf_file.filename if pdf_file else None,
-        extracted_text=extracted_text,
-        project_id=project_id,
-        is_representative=is_representative,
-        meta=meta,
-    )
+    try:
+        portfolio = await asyncio.to_thread(
+            create_portfolio,
+            db=db,
+            user_id=user_id,
+            source_type=source_type.value,
+            source_url=source_url,
+            original_filename=pdf_file.filename if pdf_file else None,
+            extracted_text=extracted_text,
+            project_id=project_id,
+            is_representative=is_representative,
+            meta=meta,
+        )
+        if pdf_path is not None:
+            portfolio = await _store_pdf_text(db=db, portfolio=portfolio, path=pdf_path)
+    finally:
+        if pdf_path is not None:
+            pdf_path.unlink(missing_ok=True)
+    if source_type.value in _CRAWLED_SOURCE_TYPES and source_url:
+        await asyncio.to_thread(
+            enqueue_portfolio_crawl, db=db, user_id=user_id, portfolio_ids=[portfolio.id]
+        )
+    if project_id is not None:
+        invalidate_project_context(user_id)
     return _to_portfolio_response(portfolio)
 
 
@@ -66,21 +127,37 @@ async def list_portfolios(
     db: Session,
     user_id: int,
     limit: int,
-    offset: int,
-    project_id: uuid.UUID | None,
+    offset: int = 0,
+    project_id: uuid.UUID | None = None,
+    cursor: str | None = None,
+    with_total: bool = True,
 ) -> PortfolioListResponse:
-    portfolios = get_portfolios_by_user(
+    page = page_portfolios_by_user(
         db=db,
         user_id=user_id,
         limit=limit,
+        cursor=cursor,
         offset=offset,
+        with_total=with_total,
         project_id=project_id,
     )
-    total = count_portfolios_by_user(db=db, user_id=user_id, project_id=project_id)
 
-    items = [_to_portfolio_response(p) for p in portfolios]
-    return PortfolioListResponse(items=items, total=total)
+    items = [_to_portfolio_response(p) for p in page.items]
+    return PortfolioListResponse(items=items, total=page.total, next_cursor=page.next_cursor)
+
+
+async def request_portfolio_sync(db: Session, portfolio_id: int, user_id: int) -> bool:
+    portfolio = get_portfolio_by_id(db=db, portfolio_id=portfolio_id, user_id=user_id)
+    if not portfolio:
+        return False
+    if portfolio.source_type not in _CRAWLED_SOURCE_TYPES or not portfolio.source_url:
+        raise ValueError("Only notion/blog portfolios with source_url can be synced")
+    enqueue_portfolio_crawl(db=db, user_id=user_id, portfolio_ids=[portfolio.id])
+    return True
 
 
 async def delete_portfolio(db: Session, portfolio_id: int, user_id: int) -> bool:
-    return delete_portfolio_repo(db=db, portfolio_id=portfolio_id, user_id=user_id)
+    deleted = delete_portfolio_repo(db=db, portfolio_id=portfolio_id, user_id=user_id)
+    if deleted:
+        invalidate_project_context(user_id)
+    return deleted
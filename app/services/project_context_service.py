@@ -0,0 +1,86 @@
+import threading
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db.repositories.job_posting_repository import get_latest_job_posting_by_project
+from app.db.repositories.portfolio_repository import get_portfolios_by_user
+from app.db.repositories.project_portfolio_repository import list_project_portfolios
+from app.db.repositories.project_repository import get_project_by_id
+from app.services.prompt_builder import truncate_to_tokens
+
+_POSTING_TOKENS = 300
+_PORTFOLIO_TOKENS = 600
+
+_cache: TTLCache[tuple[int, uuid.UUID, int], str] | None = None
+_versions: dict[int, int] = {}
+_versions_lock = threading.Lock()
+
+
+def _get_cache() -> TTLCache[tuple[int, uuid.UUID, int], str]:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = TTLCache(
+            max_entries=settings.project_context_cache_max_entries,
+            ttl_sec=settings.project_context_cache_ttl_sec,
+        )
+    return _cache
+
+
+def invalidate_project_context(user_id: int) -> None:
+    with _versions_lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def _build_project_context_header(db: Session, user_id: int, project_id: uuid.UUID) -> str:
+    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
+    posting = get_latest_job_posting_by_project(db=db, project_id=project_id, user_id=user_id)
+    links = list_project_portfolios(db=db, project_id=project_id, user_id=user_id)
+    portfolios = get_portfolios_by_user(
+        db=db,
+        user_id=user_id,
+        limit=20,
+        offset=0,
+        project_id=project_id,
+    )
+
+    posting_text = truncate_to_tokens(posting.text or "", _POSTING_TOKENS) if posting else ""
+    lines = [
+        f"지원 회사: {project.company_name if project else '미지정'}",
+        f"지원 직무: {project.role_title if project else '미지정'}",
+        f"공고 텍스트 일부: {posting_text or '없음'}",
+        "연결된 포트폴리오 이력:",
+    ]
+    for link, portfolio_item in links[:5]:
+        lines.append(
+            f"- {portfolio_item.title} / role={link.role_type} / rep={link.is_representative}"
+        )
+    lines.append("프로젝트 귀속 포트폴리오:")
+    for portfolio in portfolios:
+        text = (portfolio.extracted_text or "").strip()
+        text_preview = (
+            truncate_to_tokens(text, _PORTFOLIO_TOKENS) if text else "(크롤링 텍스트 없음)"
+        )
+        lines.append(
+            "- "
+            f"type={portfolio.source_type}, rep={portfolio.is_representative}, "
+            f"url={portfolio.source_url or ''}, "
+            f"description={((portfolio.meta or {}).get('representativeDescription') or '')}, "
+            f"text={text_preview}"
+        )
+    return "\n".join(lines)
+
+
+def get_project_context_header(db: Session, user_id: int, project_id: uuid.UUID) -> str:
+    with _versions_lock:
+        version = _versions.get(user_id, 0)
+    key = (user_id, project_id, version)
+    cache = _get_cache()
+    header = cache.get(key)
+    if header is None:
+        header = _build_project_context_header(db=db, user_id=user_id, project_id=project_id)
+        cache.set(key, header)
+    return header
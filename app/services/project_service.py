@@ -1,15 +1,14 @@
 import uuid
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError
 from app.db.entities.project import Project
 from app.db.repositories.project_repository import (
-    count_projects_by_user,
-    create_project,
-    get_project_by_id,
-    list_projects_by_user,
-    update_project,
+    acreate_project,
+    aget_project_by_id,
+    apage_projects_by_user,
+    aupdate_project,
 )
 from app.schemas.project import (
     ProjectCreateRequest,
@@ -18,6 +17,8 @@ from app.schemas.project import (
     ProjectStatus,
     ProjectUpdateRequest,
 )
+from app.services.home_service import invalidate_home_snapshot
+from app.services.project_context_service import invalidate_project_context
 
 
 def _to_response(project: Project) -> ProjectResponse:
@@ -36,10 +37,10 @@ def _to_response(project: Project) -> ProjectResponse:
     )
 
 
-def create_user_project(
-    db: Session, user_id: int, payload: ProjectCreateRequest
+async def create_user_project(
+    db: AsyncSession, user_id: int, payload: ProjectCreateRequest
 ) -> ProjectResponse:
-    project = create_project(
+    project = await acreate_project(
         db=db,
         user_id=user_id,
         company_name=payload.company_name,
@@ -47,29 +48,49 @@ def create_user_project(
         started_at=payload.started_at,
         deadline_at=payload.deadline_at,
     )
+    invalidate_home_snapshot(user_id)
     return _to_response(project)
 
 
-def list_user_projects(db: Session, user_id: int, limit: int, offset: int) -> ProjectListResponse:
-    projects = list_projects_by_user(db=db, user_id=user_id, limit=limit, offset=offset)
-    total = count_projects_by_user(db=db, user_id=user_id)
-    return ProjectListResponse(items=[_to_response(project) for project in projects], total=total)
+async def list_user_projects(
+    db: AsyncSession,
+    user_id: int,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    with_total: bool = True,
+) -> ProjectListResponse:
+    page = await apage_projects_by_user(
+        db=db,
+        user_id=user_id,
+        limit=limit,
+        cursor=cursor,
+        offset=offset,
+        with_total=with_total,
+    )
+    return ProjectListResponse(
+        items=[_to_response(project) for project in page.items],
+        total=page.total,
+        next_cursor=page.next_cursor,
+    )
 
 
-def get_user_project(db: Session, user_id: int, project_id: uuid.UUID) -> ProjectResponse:
-    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
+async def get_user_project(
+    db: AsyncSession, user_id: int, project_id: uuid.UUID
+) -> ProjectResponse:
+    project = await aget_project_by_id(db=db, project_id=project_id, user_id=user_id)
     if not project:
         raise NotFoundError("Project not found")
     return _to_response(project)
 
 
-def patch_user_project(
-    db: Session,
+async def patch_user_project(
+    db: AsyncSession,
     user_id: int,
     project_id: uuid.UUID,
     payload: ProjectUpdateRequest,
 ) -> ProjectResponse:
-    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
+    project = await aget_project_by_id(db=db, project_id=project_id, user_id=user_id)
     if not project:
         raise NotFoundError("Project not found")
 
@@ -86,5 +107,7 @@ def patch_user_project(
     if payload.progress_percent is not None:
         project.progress_percent = payload.progress_percent
 
-    updated = update_project(db=db, project=project)
+    updated = await aupdate_project(db=db, project=project)
+    invalidate_project_context(user_id)
+    invalidate_home_snapshot(user_id)
     return _to_response(updated)
@@ -3,25 +3,21 @@ import uuid
 from datetime import date
 from urllib.parse import urlparse
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.errors import NotFoundError
 from app.db.repositories.job_posting_repository import create_job_posting
 from app.db.repositories.portfolio_repository import create_portfolio, get_portfolios_by_ids
+from app.db.repositories.project_dashboard_repository import aget_project_dashboard_snapshot
 from app.db.repositories.project_portfolio_repository import (
     create_portfolio_item,
     create_project_portfolio_link,
     get_portfolio_item_by_id,
-    list_project_portfolios,
     set_representative_portfolio,
 )
 from app.db.repositories.project_repository import create_project, get_project_by_id
-from app.db.repositories.resume_repository import get_latest_resume_by_project
 from app.db.repositories.routine_repository import get_routine_item, update_routine_checked
-from app.db.repositories.session_repository import (
-    count_sessions_by_project_type,
-    get_latest_session_by_project_type,
-)
 from app.schemas.projects_v1 import (
     DashboardMockInterview,
     DashboardPortfolioItem,
@@ -38,6 +34,8 @@ from app.schemas.projects_v1 import (
     ProjectPortfolioPatchResponse,
     RoutineToggleResponse,
 )
+from app.services.home_service import invalidate_home_snapshot
+from app.services.project_context_service import invalidate_project_context
 
 _YYYY_MM_PATTERN = re.compile(r"^\d{4}-\d{2}$")
 
@@ -151,6 +149,7 @@ def create_project_v1(
             if idx == 0:
                 representative_portfolio_id = row.id
 
+    invalidate_home_snapshot(user_id)
     return ProjectCreateV1Response(
         projectId=project.id,
         status=project.status,
@@ -159,13 +158,13 @@ def create_project_v1(
     )
 
 
-def pick_blog_portfolio_ids(
+def pick_crawlable_portfolio_ids(
     db: Session,
     user_id: int,
     portfolio_ids: list[int],
 ) -> list[int]:
     rows = get_portfolios_by_ids(db=db, user_id=user_id, portfolio_ids=portfolio_ids)
-    return [row.id for row in rows if row.source_type == "blog" and row.source_url]
+    return [row.id for row in rows if row.source_type in {"blog", "notion"} and row.source_url]
 
 
 def toggle_routine_item(
@@ -178,6 +177,7 @@ def toggle_routine_item(
     if item is None:
         raise NotFoundError("Routine item not found")
     item = update_routine_checked(db=db, routine=item, checked=checked)
+    invalidate_home_snapshot(user_id)
     return RoutineToggleResponse(
         routineItemId=item.id,
         checked=item.checked,
@@ -205,6 +205,7 @@ def create_portfolio_item_v1(
             project_id=payload.projectId,
             portfolio_item_id=row.id,
         )
+        invalidate_project_context(user_id)
     return PortfolioCreateResponse(portfolioId=row.id, linkedProjectId=payload.projectId)
 
 
@@ -232,6 +233,7 @@ def patch_project_portfolio(
         portfolio_item_id=portfolio_id,
         is_representative=is_representative,
     )
+    invalidate_project_context(user_id)
     return ProjectPortfolioPatchResponse(
         projectId=project_id,
         portfolioId=portfolio_id,
@@ -240,39 +242,21 @@ def patch_project_portfolio(
     )
 
 
-def get_project_dashboard(
-    db: Session,
+async def get_project_dashboard(
+    db: AsyncSession,
     user_id: int,
     project_id: uuid.UUID,
 ) -> ProjectDashboardResponse:
-    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
-    if project is None:
+    snapshot = await aget_project_dashboard_snapshot(db=db, project_id=project_id, user_id=user_id)
+    if snapshot is None:
         raise NotFoundError("Project not found")
+    project = snapshot.project
+    has_resume = snapshot.resume_id is not None
+    has_mock = snapshot.mock_session_id is not None
 
-    resume = get_latest_resume_by_project(db=db, project_id=project.id, user_id=user_id)
-    latest_mock = get_latest_session_by_project_type(
-        db=db,
-        user_id=user_id,
-        project_id=project.id,
-        session_type="MOCK_INTERVIEW",
-    )
-    mock_count = count_sessions_by_project_type(
-        db=db,
-        user_id=user_id,
-        project_id=project.id,
-        session_type="MOCK_INTERVIEW",
-    )
-    latest_sim = get_latest_session_by_project_type(
-        db=db,
-        user_id=user_id,
-        project_id=project.id,
-        session_type="JOB_SIMULATION",
-    )
-    project_rows = list_project_portfolios(db=db, project_id=project.id, user_id=user_id)
-
-    resume_completed = bool(resume and resume.status == "COMPLETED")
-    mock_completed = bool(latest_mock and latest_mock.status == "COMPLETED")
-    sim_completed = bool(latest_sim and latest_sim.status == "COMPLETED")
+    resume_completed = snapshot.resume_status == "COMPLETED"
+    mock_completed = snapshot.mock_status == "COMPLETED"
+    sim_completed = snapshot.sim_status == "COMPLETED"
     final_feedback_completed = mock_completed and sim_completed
 
     steps = [
@@ -299,16 +283,16 @@ def get_project_dashboard(
         ),
         prepStage=DashboardPrepStage(status=stage_status, steps=steps),
         resume=DashboardResume(
-            resumeId=resume.id if resume else None,
-            title=resume.title if resume else None,
-            exists=resume is not None,
-            lastEditedAt=resume.updated_at if resume else None,
+            resumeId=snapshot.resume_id,
+            title=snapshot.resume_title,
+            exists=has_resume,
+            lastEditedAt=snapshot.resume_updated_at,
         ),
         mockInterview=DashboardMockInterview(
-            latestSessionId=latest_mock.id if latest_mock else None,
-            latestTitle="모의면접 결과" if latest_mock else None,
-            latestScore=_extract_mock_score(latest_mock.result_json if latest_mock else None),
-            sessionCount=mock_count,
+            latestSessionId=snapshot.mock_session_id,
+            latestTitle="모의면접 결과" if has_mock else None,
+            latestScore=_extract_mock_score(snapshot.mock_result_json),
+            sessionCount=snapshot.mock_count,
         ),
         portfolios=[
             DashboardPortfolioItem(
@@ -319,7 +303,7 @@ def get_project_dashboard(
                 roleType=link.role_type,
                 isRepresentative=link.is_representative,
             )
-            for link, portfolio_item in project_rows
+            for link, portfolio_item in snapshot.portfolios
         ],
         simulation=DashboardSimpleState(
             available=True,
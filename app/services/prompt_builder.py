@@ -0,0 +1,123 @@
+import math
+from dataclasses import dataclass
+from typing import Literal
+
+from app.core import metrics
+
+# Gemini tokenizes ASCII at roughly four characters per token; Hangul and other
+# non-ASCII text lands close to one token per character.
+_ASCII_CHARS_PER_TOKEN = 4
+_NON_ASCII_TOKENS_PER_CHAR = 0.8
+_MIN_SECTION_TOKENS = 32
+_COMPRESSED_TURN_CHARS = 120
+_ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(
+        ascii_chars / _ASCII_CHARS_PER_TOKEN + non_ascii_chars * _NON_ASCII_TOKENS_PER_CHAR
+    )
+
+
+def truncate_to_tokens(text: str, max_tokens: int, keep: Literal["head", "tail"] = "head") -> str:
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    low, high = 0, len(text)
+    while low < high:
+        size = (low + high + 1) // 2
+        part = text[:size] if keep == "head" else text[len(text) - size :]
+        if estimate_tokens(part) + 1 <= max_tokens:
+            low = size
+        else:
+            high = size - 1
+    if keep == "head":
+        return text[:low].rstrip() + _ELLIPSIS
+    return _ELLIPSIS + text[len(text) - low :].lstrip()
+
+
+def compress_turns(lines: list[str], keep_recent: int) -> list[str]:
+    split_at = max(0, len(lines) - keep_recent)
+    older = [
+        line if len(line) <= _COMPRESSED_TURN_CHARS else line[:_COMPRESSED_TURN_CHARS] + _ELLIPSIS
+        for line in lines[:split_at]
+    ]
+    return older + lines[split_at:]
+
+
+@dataclass
+class _Section:
+    text: str
+    priority: int
+    keep: Literal["head", "tail"]
+    order: int
+
+
+class PromptBuilder:
+    """Assembles prompt sections within a token budget for one call site.
+
+    Lower ``priority`` values are kept first; a section that does not fit is
+    truncated to the remaining budget or dropped. Output keeps insertion order.
+    """
+
+    def __init__(self, call_site: str, budget_tokens: int) -> None:
+        self._call_site = call_site
+        self._budget_tokens = budget_tokens
+        self._sections: list[_Section] = []
+        self.tokens = 0
+
+    def add(
+        self,
+        text: str,
+        priority: int = 0,
+        title: str | None = None,
+        keep: Literal["head", "tail"] = "head",
+    ) -> "PromptBuilder":
+        text = text.strip()
+        if title:
+            text = f"{title}\n{text}" if text else title
+        if text:
+            self._sections.append(_Section(text, priority, keep, len(self._sections)))
+        return self
+
+    def add_turns(
+        self,
+        lines: list[str],
+        priority: int = 0,
+        title: str | None = None,
+        summary: str | None = None,
+        keep_recent: int = 6,
+    ) -> "PromptBuilder":
+        body = compress_turns(lines, keep_recent)
+        if summary:
+            body.insert(0, f"(이전 대화 요약)\n{summary}")
+        return self.add("\n".join(body), priority=priority, title=title, keep="tail")
+
+    def build(self) -> str:
+        remaining = self._budget_tokens
+        kept: dict[int, str] = {}
+        truncated = 0
+        for section in sorted(self._sections, key=lambda s: (s.priority, s.order)):
+            cost = estimate_tokens(section.text)
+            if cost <= remaining:
+                kept[section.order] = section.text
+                remaining -= cost
+                continue
+            truncated += 1
+            if remaining < _MIN_SECTION_TOKENS:
+                continue
+            kept[section.order] = truncate_to_tokens(section.text, remaining, keep=section.keep)
+            remaining = 0
+
+        prompt = "\n\n".join(kept[order] for order in sorted(kept))
+        self.tokens = estimate_tokens(prompt)
+        metrics.observe("prompt_tokens", self.tokens, call_site=self._call_site)
+        if truncated:
+            metrics.increment("prompt_truncated_sections", truncated, call_site=self._call_site)
+        return prompt
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.errors import NotFoundError
+from app.db.entities.report_job import ReportJob
+from app.db.repositories.report_job_repository import (
+    claim_next_report_job,
+    complete_report_job,
+    create_report_job,
+    fail_expired_report_jobs,
+    fail_report_job,
+    get_report_job_by_id,
+    renew_report_job_lease,
+)
+from app.db.repositories.session_repository import get_session_by_id
+from app.db.session import get_session_local
+from app.schemas.report_job import ReportJobResponse, ReportJobStatus, ReportJobType
+from app.services.deep_interview_service import (
+    generate_deep_interview_guide,
+    get_deep_interview_insight_doc,
+)
+from app.services.session_service import analyze_unified_session
+from app.services.simulation_v1_service import get_simulation_result_v1
+
+logger = logging.getLogger(__name__)
+
+_ReportHandler = Callable[..., Awaitable[BaseModel]]
+
+_HANDLERS: dict[ReportJobType, tuple[str | None, _ReportHandler]] = {
+    ReportJobType.SIMULATION_RESULT: ("JOB_SIMULATION", get_simulation_result_v1),
+    ReportJobType.DEEP_INTERVIEW_GUIDE: ("DEEP_INTERVIEW", generate_deep_interview_guide),
+    ReportJobType.DEEP_INTERVIEW_INSIGHT: ("DEEP_INTERVIEW", get_deep_interview_insight_doc),
+    ReportJobType.SESSION_ANALYSIS: (None, analyze_unified_session),
+}
+
+_TERMINAL_STATUSES = {ReportJobStatus.SUCCEEDED.value, ReportJobStatus.FAILED.value}
+
+_worker_tasks: list[asyncio.Task[None]] = []
+_wakeup: asyncio.Event | None = None
+
+
+def _to_response(job: ReportJob) -> ReportJobResponse:
+    return ReportJobResponse(
+        jobId=job.id,
+        jobType=ReportJobType(job.job_type),
+        sessionId=job.session_id,
+        status=ReportJobStatus(job.status),
+        attempts=job.attempts,
+        result=job.result_json,
+        error=job.error,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        finishedAt=job.finished_at,
+        statusUrl=f"/v1/report-jobs/{job.id}",
+        eventsUrl=f"/v1/report-jobs/{job.id}/events",
+    )
+
+
+def enqueue_report_job(
+    db: Session,
+    user_id: int,
+    job_type: ReportJobType,
+    session_id: uuid.UUID,
+) -> ReportJobResponse:
+    required_type, _ = _HANDLERS[job_type]
+    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
+    if session is None or (required_type and session.session_type != required_type):
+        raise NotFoundError("Session not found")
+
+    job = create_report_job(db=db, user_id=user_id, session_id=session_id, job_type=job_type)
+    if _wakeup is not None:
+        _wakeup.set()
+    return _to_response(job)
+
+
+def get_report_job(db: Session, user_id: int, job_id: uuid.UUID) -> ReportJobResponse:
+    job = get_report_job_by_id(db=db, job_id=job_id, user_id=user_id)
+    if job is None:
+        raise NotFoundError("Report job not found")
+    return _to_response(job)
+
+
+def _load_job_snapshot(user_id: int, job_id: uuid.UUID) -> ReportJobResponse | None:
+    db = get_session_local()()
+    try:
+        job = get_report_job_by_id(db=db, job_id=job_id, user_id=user_id)
+        return _to_response(job) if job else None
+    finally:
+        db.close()
+
+
+async def stream_report_job_events(user_id: int, job_id: uuid.UUID) -> AsyncIterator[str]:
+    poll_interval = get_settings().report_job_poll_interval_sec
+    last_status: str | None = None
+    while True:
+        snapshot = await asyncio.to_thread(_load_job_snapshot, user_id, job_id)
+        if snapshot is None:
+            yield 'event: error\ndata: {"detail": "Report job not found"}\n\n'
+            return
+        if snapshot.status.value != last_status:
+            last_status = snapshot.status.value
+            data = json.dumps(snapshot.model_dump(mode="json"), ensure_ascii=False)
+            yield f"event: status\ndata: {data}\n\n"
+        if last_status in _TERMINAL_STATUSES:
+            return
+        await asyncio.sleep(poll_interval)
+
+
+def _claim_job(worker_id: str) -> tuple[uuid.UUID, int, uuid.UUID, str] | None:
+    settings = get_settings()
+    db = get_session_local()()
+    try:
+        failed = fail_expired_report_jobs(db=db, max_attempts=settings.report_job_max_attempts)
+        if failed:
+            logger.warning("Failed %s report jobs whose last lease expired", failed)
+        job = claim_next_report_job(
+            db=db,
+            worker_id=worker_id,
+            lease_sec=settings.report_job_lease_sec,
+            max_attempts=settings.report_job_max_attempts,
+        )
+        if job is None:
+            return None
+        return job.id, job.user_id, job.session_id, job.job_type
+    finally:
+        db.close()
+
+
+def _finish_job(
+    worker_id: str,
+    job_id: uuid.UUID,
+    user_id: int,
+    result: dict[str, Any] | None,
+    error: str,
+) -> None:
+    db = get_session_local()()
+    try:
+        job = get_report_job_by_id(db=db, job_id=job_id, user_id=user_id)
+        # A job whose lease lapsed may already be running elsewhere; that worker records it.
+        if job is None or job.status != "RUNNING" or job.locked_by != worker_id:
+            return
+        if result is not None:
+            complete_report_job(db=db, job=job, result_json=result)
+            return
+        retry = job.attempts < get_settings().report_job_max_attempts
+        fail_report_job(db=db, job=job, reason=error, retry=retry)
+    finally:
+        db.close()
+
+
+def _renew_lease(job_id: uuid.UUID, worker_id: str) -> bool:
+    db = get_session_local()()
+    try:
+        return renew_report_job_lease(
+            db=db, job_id=job_id, worker_id=worker_id, lease_sec=get_settings().report_job_lease_sec
+        )
+    finally:
+        db.close()
+
+
+async def _heartbeat(job_id: uuid.UUID, worker_id: str) -> None:
+    interval = max(1.0, get_settings().report_job_lease_sec / 3)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_renew_lease, job_id, worker_id)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to renew lease of report job %s", job_id)
+
+
+async def _run_job(
+    worker_id: str,
+    job_id: uuid.UUID,
+    user_id: int,
+    session_id: uuid.UUID,
+    job_type: str,
+) -> None:
+    _, handler = _HANDLERS[ReportJobType(job_type)]
+    heartbeat = asyncio.create_task(_heartbeat(job_id, worker_id))
+    # Handlers push their sync Session work to worker threads themselves; the cleanup here
+    # does the same so a slow rollback never stalls the loop the other workers share.
+    db = get_session_local()()
+    try:
+        response = await handler(db=db, user_id=user_id, session_id=session_id)
+        result: dict[str, Any] | None = response.model_dump(mode="json")
+        error = ""
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Report job %s failed", job_id)
+        await asyncio.to_thread(db.rollback)
+        result = None
+        error = str(exc) or exc.__class__.__name__
+    finally:
+        heartbeat.cancel()
+        await asyncio.to_thread(db.close)
+    await asyncio.to_thread(_finish_job, worker_id, job_id, user_id, result, error)
+
+
+async def _worker_loop(wakeup: asyncio.Event, worker_id: str) -> None:
+    poll_interval = get_settings().report_job_poll_interval_sec
+    while True:
+        try:
+            claimed = await asyncio.to_thread(_claim_job, worker_id)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to claim report job")
+            claimed = None
+
+        if claimed is None:
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=poll_interval)
+            except TimeoutError:
+                pass
+            continue
+
+        # The lease brings the job back if recording its outcome fails; the worker keeps going.
+        try:
+            await _run_job(worker_id, *claimed)
+        except Exception:  # noqa: BLE001
+            logger.exception("Report job %s could not be finished", claimed[0])
+
+
+def _fail_expired_jobs() -> int:
+    db = get_session_local()()
+    try:
+        return fail_expired_report_jobs(db=db, max_attempts=get_settings().report_job_max_attempts)
+    finally:
+        db.close()
+
+
+async def start_report_workers() -> None:
+    global _wakeup
+    settings = get_settings()
+    if _worker_tasks or settings.report_job_workers <= 0:
+        return
+    try:
+        failed = await asyncio.to_thread(_fail_expired_jobs)
+        if failed:
+            logger.info("Failed %s report jobs whose last lease expired", failed)
+    except Exception:  # noqa: BLE001
+        logger.warning("Report job workers disabled: database unavailable", exc_info=True)
+        return
+
+    _wakeup = asyncio.Event()
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    for index in range(settings.report_job_workers):
+        task = asyncio.create_task(
+            _worker_loop(_wakeup, f"{host}:{index}"), name=f"report-worker-{index}"
+        )
+        _worker_tasks.append(task)
+
+
+async def stop_report_workers() -> None:
+    global _wakeup
+    for task in _worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_worker_tasks, return_exceptions=True)
+    _worker_tasks.clear()
+    _wakeup = None
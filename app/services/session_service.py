@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -12,13 +14,20 @@ from app.core.errors import NotFoundError
 from app.db.entities.session_v2 import SessionTurn, UnifiedSession
 from app.db.repositories.project_repository import get_project_by_id
 from app.db.repositories.session_repository import (
+    acreate_turn,
+    aget_session_by_id,
+    alist_turns_by_session,
+    areserve_turn_indexes,
+    aupdate_session,
     create_session,
     create_turn,
-    get_next_turn_index,
     get_session_by_id,
+    get_session_transcript,
     list_turns_by_session,
+    reserve_turn_indexes,
     update_session,
 )
+from app.db.session import async_unit_of_work, unit_of_work
 from app.schemas.session import (
     SessionAnalyzeResponse,
     SessionAppendTurnResponse,
@@ -33,6 +42,10 @@ from app.schemas.session import (
     SessionType,
 )
 from app.services.gemini_client import GeminiClient
+from app.services.prompt_builder import PromptBuilder
+
+JOB_SIM_TURN_BUDGET_TOKENS = 2000
+JOB_SIM_REPORT_BUDGET_TOKENS = 6000
 
 SIM_SYSTEM_PROMPT = """당신은 지원자에게 어려운 직무 상황을 제시하는 시뮬레이터다.
 한국어로 답하고 반드시 JSON으로만 응답한다.
@@ -108,15 +121,18 @@ def _to_turn_response(turn: SessionTurn) -> SessionTurnResponse:
     )
 
 
-def _build_job_sim_context(session: UnifiedSession, turns: list[SessionTurn]) -> str:
+def _build_job_sim_context(session: UnifiedSession, budget_tokens: int) -> str:
     role = (session.meta or {}).get("role") or "미지정"
     scenario = (session.meta or {}).get("scenario") or "미지정"
-    lines = [f"지원 직무: {role}", f"시나리오: {scenario}", "대화 로그:"]
-    for turn in turns:
-        speaker = turn.speaker or turn.role
-        content = turn.message or turn.user_answer or turn.prompt or ""
-        lines.append(f"[{speaker}] {content}")
-    return "\n".join(lines)
+    transcript = session.transcript or {}
+    builder = PromptBuilder("job_simulation", budget_tokens)
+    builder.add(f"지원 직무: {role}\n시나리오: {scenario}")
+    builder.add_turns(
+        [f"[{entry['speaker']}] {entry['text']}" for entry in transcript.get("window") or []],
+        title="대화 로그:",
+        summary=transcript.get("summary"),
+    )
+    return builder.build()
 
 
 def _extract_score_delta(payload: dict[str, Any]) -> dict[str, int] | None:
@@ -136,20 +152,18 @@ def _default_start_message(session: UnifiedSession) -> str:
     return f"{role} 상황 면접을 시작합니다. 가장 까다로운 이슈를 먼저 설명해보세요."
 
 
-def _generate_job_sim_message(context: str, user_message: str | None) -> dict[str, Any]:
+async def _generate_job_sim_message(context: str, user_message: str | None) -> dict[str, Any]:
     prompt = context
     if user_message:
         prompt = f"{context}\n\n사용자 최신 답변:\n{user_message}"
 
     gemini = GeminiClient()
-    return gemini.generate_json(SIM_SYSTEM_PROMPT, prompt)
+    return await gemini.generate_json(SIM_SYSTEM_PROMPT, prompt, call_site="job_simulation.turn")
 
 
-def start_unified_session(
-    db: Session,
-    user_id: int,
-    payload: SessionStartRequest,
-) -> SessionStartResponse:
+def _open_session(
+    db: Session, user_id: int, payload: SessionStartRequest
+) -> tuple[UnifiedSession, str | None]:
     project = get_project_by_id(db=db, project_id=payload.project_id, user_id=user_id)
     if not project:
         raise NotFoundError("Project not found")
@@ -162,18 +176,15 @@ def start_unified_session(
         total_items=payload.total_items,
         meta=payload.meta,
     )
+    if payload.session_type != SessionType.JOB_SIMULATION:
+        return session, None
+    return session, _build_job_sim_context(session, JOB_SIM_TURN_BUDGET_TOKENS)
 
-    initial_turn: SessionTurn | None = None
-    if payload.session_type == SessionType.JOB_SIMULATION:
-        generated: dict[str, Any] = {}
-        try:
-            generated = _generate_job_sim_message(
-                context=_build_job_sim_context(session, turns=[]),
-                user_message=None,
-            )
-        except Exception:
-            generated = {}
 
+def _record_opening_turn(
+    db: Session, session: UnifiedSession, generated: dict[str, Any]
+) -> SessionStartResponse:
+    with unit_of_work(db):
         initial_turn = create_turn(
             db=db,
             session=session,
@@ -187,81 +198,98 @@ def start_unified_session(
             score=None,
             score_delta=_extract_score_delta(generated),
             meta=None,
-            turn_index=1,
+            turn_index=reserve_turn_indexes(db=db, session=session),
         )
         session.current_index = 2
         update_session(db=db, session=session)
-
     return SessionStartResponse(
         session=_to_session_response(session),
-        initial_turn=_to_turn_response(initial_turn) if initial_turn else None,
+        initial_turn=_to_turn_response(initial_turn),
     )
 
 
-def append_unified_turn(
+# Sync SQLAlchemy work runs in worker threads via asyncio.to_thread so that only the
+# Gemini await stays on the event loop.
+async def start_unified_session(
     db: Session,
     user_id: int,
+    payload: SessionStartRequest,
+) -> SessionStartResponse:
+    session, context = await asyncio.to_thread(_open_session, db, user_id, payload)
+    if context is None:
+        return SessionStartResponse(session=_to_session_response(session), initial_turn=None)
+
+    generated: dict[str, Any] = {}
+    try:
+        generated = await _generate_job_sim_message(context=context, user_message=None)
+    except Exception:
+        generated = {}
+    return await asyncio.to_thread(_record_opening_turn, db, session, generated)
+
+
+async def append_unified_turn(
+    db: AsyncSession,
+    user_id: int,
     session_id: uuid.UUID,
     payload: SessionTurnCreateRequest,
 ) -> SessionAppendTurnResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
+    session = await aget_session_by_id(db=db, session_id=session_id, user_id=user_id)
     if not session:
         raise NotFoundError("Session not found")
 
-    turn_index = get_next_turn_index(db=db, session_id=session.id)
-    created_turn = create_turn(
-        db=db,
-        session=session,
-        role=payload.role.value,
-        speaker=payload.speaker,
-        prompt=payload.prompt,
-        user_answer=payload.user_answer,
-        message=payload.message,
-        intent=payload.intent,
-        feedback=payload.feedback,
-        score=payload.score,
-        score_delta=payload.score_delta,
-        meta=payload.meta,
-        turn_index=turn_index,
-    )
+    async with async_unit_of_work(db):
+        created_turn = await acreate_turn(
+            db=db,
+            session=session,
+            role=payload.role.value,
+            speaker=payload.speaker,
+            prompt=payload.prompt,
+            user_answer=payload.user_answer,
+            message=payload.message,
+            intent=payload.intent,
+            feedback=payload.feedback,
+            score=payload.score,
+            score_delta=payload.score_delta,
+            meta=payload.meta,
+            turn_index=await areserve_turn_indexes(db=db, session=session),
+        )
 
     generated_turn: SessionTurn | None = None
+    generated: dict[str, Any] | None = None
     auto_reply = payload.auto_reply and payload.role == SessionRole.USER
     is_job_simulation = session.session_type == SessionType.JOB_SIMULATION.value
 
     if auto_reply and is_job_simulation and payload.message:
-        recent_turns_desc = list_turns_by_session(db=db, session_id=session.id, limit=10, desc=True)
-        recent_turns = list(reversed(recent_turns_desc))
-
-        generated: dict[str, Any] = {}
         try:
-            generated = _generate_job_sim_message(
-                context=_build_job_sim_context(session, turns=recent_turns),
+            generated = await _generate_job_sim_message(
+                context=_build_job_sim_context(session, JOB_SIM_TURN_BUDGET_TOKENS),
                 user_message=payload.message,
             )
         except Exception:
             generated = {}
 
-        generated_turn = create_turn(
-            db=db,
-            session=session,
-            role=SessionRole.AI.value,
-            speaker=str(generated.get("persona") or "AI 시뮬레이터"),
-            prompt=str(generated.get("intent") or "압박 꼬리 질문"),
-            user_answer=None,
-            message=str(generated.get("response") or "답변을 더 구체적으로 설명해 주세요."),
-            intent=str(generated.get("intent") or "의사결정 근거 확인"),
-            feedback=str(generated.get("feedback") or ""),
-            score=None,
-            score_delta=_extract_score_delta(generated),
-            meta=None,
-            turn_index=created_turn.turn_index + 1,
-        )
+    async with async_unit_of_work(db):
+        if generated is not None:
+            generated_turn = await acreate_turn(
+                db=db,
+                session=session,
+                role=SessionRole.AI.value,
+                speaker=str(generated.get("persona") or "AI 시뮬레이터"),
+                prompt=str(generated.get("intent") or "압박 꼬리 질문"),
+                user_answer=None,
+                message=str(generated.get("response") or "답변을 더 구체적으로 설명해 주세요."),
+                intent=str(generated.get("intent") or "의사결정 근거 확인"),
+                feedback=str(generated.get("feedback") or ""),
+                score=None,
+                score_delta=_extract_score_delta(generated),
+                meta=None,
+                turn_index=await areserve_turn_indexes(db=db, session=session),
+            )
 
-    latest_turn_index = generated_turn.turn_index if generated_turn else created_turn.turn_index
-    session.current_index = latest_turn_index + 1
-    session.status = SessionStatus.IN_PROGRESS.value
-    session = update_session(db=db, session=session)
+        latest_turn_index = generated_turn.turn_index if generated_turn else created_turn.turn_index
+        session.current_index = latest_turn_index + 1
+        session.status = SessionStatus.IN_PROGRESS.value
+        session = await aupdate_session(db=db, session=session)
 
     return SessionAppendTurnResponse(
         session=_to_session_response(session),
@@ -270,16 +298,42 @@ def append_unified_turn(
     )
 
 
-def analyze_unified_session(
-    db: Session,
-    user_id: int,
-    session_id: uuid.UUID,
-) -> SessionAnalyzeResponse:
+def _load_analysis_inputs(
+    db: Session, user_id: int, session_id: uuid.UUID
+) -> tuple[UnifiedSession, list[SessionTurn], str | None]:
     session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
     if not session:
         raise NotFoundError("Session not found")
 
     turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
+    context = None
+    if session.session_type == SessionType.JOB_SIMULATION.value and get_settings().gemini_api_key:
+        get_session_transcript(db=db, session=session)
+        context = _build_job_sim_context(session, JOB_SIM_REPORT_BUDGET_TOKENS)
+    return session, turns, context
+
+
+def _store_analysis(
+    db: Session, session: UnifiedSession, result_json: dict[str, Any]
+) -> SessionAnalyzeResponse:
+    now = datetime.now(tz=UTC)
+    session.result_json = result_json
+    session.status = SessionStatus.COMPLETED.value
+    session.ended_at = now
+    if session.started_at:
+        session.duration_sec = int((now - session.started_at).total_seconds())
+    session = update_session(db=db, session=session)
+    return SessionAnalyzeResponse(session=_to_session_response(session), result_json=result_json)
+
+
+async def analyze_unified_session(
+    db: Session,
+    user_id: int,
+    session_id: uuid.UUID,
+) -> SessionAnalyzeResponse:
+    session, turns, context = await asyncio.to_thread(
+        _load_analysis_inputs, db, user_id, session_id
+    )
 
     result_json: dict[str, Any]
     if session.session_type == SessionType.JOB_SIMULATION.value:
@@ -299,14 +353,14 @@ def analyze_unified_session(
             "resume_snippet": "압박 상황에서도 우선순위를 재정의하며 문제를 해결했습니다.",
         }
 
-        settings = get_settings()
-        if settings.gemini_api_key:
+        if context is not None:
             try:
-                context = _build_job_sim_context(session, turns)
                 gemini = GeminiClient()
-                payload = gemini.generate_json(
+                payload = await gemini.generate_json(
                     SIM_REPORT_PROMPT,
                     f"{context}\n\n점수 요약: {score_summary}",
+                    call_site="job_simulation.report",
+                    cache=True,
                 )
                 report = {
                     "archetype": str(payload.get("archetype") or report["archetype"]),
@@ -338,28 +392,24 @@ def analyze_unified_session(
             "turn_count": len(turns),
         }
 
-    now = datetime.now(tz=UTC)
-    session.result_json = result_json
-    session.status = SessionStatus.COMPLETED.value
-    session.ended_at = now
-    if session.started_at:
-        session.duration_sec = int((now - session.started_at).total_seconds())
-    session = update_session(db=db, session=session)
-
-    return SessionAnalyzeResponse(session=_to_session_response(session), result_json=result_json)
+    return await asyncio.to_thread(_store_analysis, db, session, result_json)
 
 
-def get_unified_session_detail(
-    db: Session,
+async def get_unified_session_detail(
+    db: AsyncSession,
     user_id: int,
     session_id: uuid.UUID,
     include_turns: bool,
 ) -> SessionDetailResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
+    session = await aget_session_by_id(db=db, session_id=session_id, user_id=user_id)
     if not session:
         raise NotFoundError("Session not found")
 
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False) if include_turns else []
+    turns = (
+        await alist_turns_by_session(db=db, session_id=session.id, desc=False)
+        if include_turns
+        else []
+    )
     return SessionDetailResponse(
         session=_to_session_response(session),
         turns=[_to_turn_response(turn) for turn in turns],
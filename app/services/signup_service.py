@@ -1,24 +1,24 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.password import hash_password
+from app.core.password import ahash_password
 from app.db.entities.user import User
 from app.db.repositories.auth_repository import SignupRepository
 from app.schemas.auth import SignupRequest, SignupResponse
 
 
 class SignupService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.repo = SignupRepository(db)
 
-    def signup(self, req: SignupRequest) -> SignupResponse:
-        if self.repo.find_by_user_id(req.id):
+    async def signup(self, req: SignupRequest) -> SignupResponse:
+        if await self.repo.find_by_user_id(req.id):
             return SignupResponse(
                 success=False,
                 message="이미 존재하는 아이디입니다.",
                 user_id=None,
             )
 
-        user = User(user_id=req.id, password=hash_password(req.pw))
-        self.repo.create_user(user)
+        user = User(user_id=req.id, password=await ahash_password(req.pw))
+        await self.repo.create_user(user)
 
         return SignupResponse(success=True, message="회원가입 성공", user_id=user.user_id)
@@ -11,9 +11,9 @@ from app.db.repositories.project_repository import get_latest_project_by_user, g
 from app.db.repositories.session_repository import (
     create_session,
     create_turn,
-    get_next_turn_index,
     get_session_by_id,
     list_turns_by_session,
+    reserve_turn_indexes,
 )
 from app.schemas.session import SessionRole
 from app.schemas.simulation import (
@@ -61,13 +61,17 @@ LEGACY_ANALYZE_SYSTEM_PROMPT = """너는 시뮬레이션 코치다.
 """
 
 
-def _call_gemini_json(system_prompt: str, user_prompt: str) -> dict[str, Any] | None:
+def _call_gemini_json(
+    system_prompt: str, user_prompt: str, call_site: str
+) -> dict[str, Any] | None:
     settings = get_settings()
     if not settings.gemini_api_key:
         return None
     try:
         gemini = GeminiClient()
-        return gemini.generate_json(system_prompt=system_prompt, user_prompt=user_prompt)
+        return gemini.generate_json_sync(
+            system_prompt=system_prompt, user_prompt=user_prompt, call_site=call_site
+        )
     except Exception:
         return None
 
@@ -149,6 +153,7 @@ def start_simulation(
             f"회사상황={payload.company_context or '미지정'}\n"
             f"공고={payload.job_description or '미지정'}"
         ),
+        call_site="legacy_simulation.start",
     )
     if isinstance(ai, dict):
         first_message = str(ai.get("response") or first_message)
@@ -168,7 +173,7 @@ def start_simulation(
         score=None,
         score_delta=delta,
         meta=None,
-        turn_index=1,
+        turn_index=reserve_turn_indexes(db=db, session=session),
     )
     return SimulationStartResponse(
         session_id=session.id,
@@ -187,7 +192,6 @@ def chat_simulation(
     if session is None or session.session_type != "JOB_SIMULATION":
         raise NotFoundError("Simulation session not found")
 
-    user_turn_index = get_next_turn_index(db=db, session_id=session.id)
     create_turn(
         db=db,
         session=session,
@@ -201,7 +205,7 @@ def chat_simulation(
         score=None,
         score_delta=None,
         meta=None,
-        turn_index=user_turn_index,
+        turn_index=reserve_turn_indexes(db=db, session=session),
     )
     logs = list_turns_by_session(db=db, session_id=session.id, desc=False)
     context = _build_context(session, logs)
@@ -212,6 +216,7 @@ def chat_simulation(
     ai = _call_gemini_json(
         system_prompt=LEGACY_TURN_SYSTEM_PROMPT,
         user_prompt=f"{context}\n\n사용자 최신 답변: {payload.message}",
+        call_site="legacy_simulation.turn",
     )
     if isinstance(ai, dict):
         persona = str(ai.get("persona") or persona)
@@ -231,7 +236,7 @@ def chat_simulation(
         score=None,
         score_delta=score_change,
         meta=None,
-        turn_index=user_turn_index + 1,
+        turn_index=reserve_turn_indexes(db=db, session=session),
     )
 
     all_logs = list_turns_by_session(db=db, session_id=session.id, desc=False)
@@ -284,6 +289,7 @@ def analyze_simulation(
     ai = _call_gemini_json(
         system_prompt=LEGACY_ANALYZE_SYSTEM_PROMPT,
         user_prompt=f"{_build_context(session, logs)}\n\n누적점수: {total_score}",
+        call_site="legacy_simulation.analyze",
     )
     if isinstance(ai, dict):
         report = SimulationReport(
@@ -1,20 +1,36 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core import metrics
 from app.core.config import get_settings
 from app.core.errors import NotFoundError
+from app.db.entities.session_v2 import UnifiedSession
 from app.db.repositories.project_repository import get_project_by_id
 from app.db.repositories.session_repository import (
+    acreate_turn,
+    acreate_turns,
+    aget_session_by_id,
+    aget_session_transcript,
+    alist_turns_by_session,
+    areserve_turn_indexes,
+    aupdate_session,
     create_session,
-    create_turn,
-    get_next_turn_index,
+    create_turns,
     get_session_by_id,
     list_turns_by_session,
     update_session,
 )
+from app.db.session import async_unit_of_work, get_async_session_local, unit_of_work
 from app.schemas.session import SessionRole
 from app.schemas.simulation_v1 import (
     SimulationMessage,
@@ -26,6 +42,14 @@ from app.schemas.simulation_v1 import (
     SimulationV1StartResponse,
 )
 from app.services.gemini_client import GeminiClient
+from app.services.json_stream import PartialArrayParser, repair_truncated_json
+from app.services.llm_gateway import stream_text
+from app.services.prompt_builder import PromptBuilder
+
+logger = logging.getLogger(__name__)
+
+TURN_CONTEXT_BUDGET_TOKENS = 3000
+RESULT_CONTEXT_BUDGET_TOKENS = 6000
 
 SCENARIO_SYSTEM_PROMPT = """너는 직무 시뮬레이션 시나리오 생성기다.
 사용자가 직무 적합성을 검증할 수 있도록 긴장감 있는 업무 상황을 만든다.
@@ -95,13 +119,17 @@ def _user_turn_count(turns: list[Any]) -> int:
     )
 
 
-def _call_gemini_json(system_prompt: str, user_prompt: str) -> dict[str, Any] | None:
+async def _call_gemini_json(
+    system_prompt: str, user_prompt: str, call_site: str, cache: bool = False
+) -> dict[str, Any] | None:
     settings = get_settings()
     if not settings.gemini_api_key:
         return None
     try:
         gemini = GeminiClient()
-        return gemini.generate_json(system_prompt=system_prompt, user_prompt=user_prompt)
+        return await gemini.generate_json(
+            system_prompt=system_prompt, user_prompt=user_prompt, call_site=call_site, cache=cache
+        )
     except Exception:
         return None
 
@@ -257,109 +285,139 @@ def _build_result_fallback(session, turns: list[Any]) -> dict[str, Any]:
                 "tags": ["커뮤니케이션", "우선순위"],
             }
         ],
-        "cta": {"label": "메타인지 리포트 상세 보기", "deepLink": f"app://simulation-report/{session.id}"},
+        "cta": {
+            "label": "메타인지 리포트 상세 보기",
+            "deepLink": f"app://simulation-report/{session.id}",
+        },
     }
 
 
-def _build_transcript(turns: list[Any]) -> str:
+def _transcript_lines(turns: list[Any]) -> list[str]:
     lines: list[str] = []
     for turn in turns:
         speaker = turn.speaker or turn.role
         content = turn.message or turn.user_answer or turn.prompt or ""
         lines.append(f"[{speaker}] {content}")
-    return "\n".join(lines)
+    return lines
+
+
+_REFINEMENT_KEYS = ("refinedAt", "transcriptDigest")
+
+
+def _transcript_digest(transcript: str) -> str:
+    return hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+
+
+def _is_refined(result_json: dict[str, Any] | None, digest: str) -> bool:
+    if not result_json or not result_json.get("refinedAt"):
+        return False
+    return result_json.get("transcriptDigest") == digest
 
 
 def get_simulation_preview(project_id: uuid.UUID) -> SimulationPreviewResponse:
     return _build_preview(project_id)
 
 
-def start_simulation_v1(
+def _load_project_fields(
+    db: Session, user_id: int, project_id: uuid.UUID
+) -> tuple[str | None, str | None]:
+    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
+    if project is None:
+        raise NotFoundError("Project not found")
+    return project.company_name, project.role_title
+
+
+def _create_simulation(
     db: Session,
     user_id: int,
     project_id: uuid.UUID,
     payload: SimulationV1StartRequest,
+    opening: dict[str, Any],
+    turn_rows: list[dict[str, Any]],
 ) -> SimulationV1StartResponse:
-    project = get_project_by_id(db=db, project_id=project_id, user_id=user_id)
-    if project is None:
-        raise NotFoundError("Project not found")
+    with unit_of_work(db):
+        session = create_session(
+            db=db,
+            project_id=project_id,
+            user_id=user_id,
+            session_type="JOB_SIMULATION",
+            total_items=payload.maxTurns,
+            meta={
+                "role": payload.role,
+                "scenarioId": payload.scenarioId,
+                "maxTurns": payload.maxTurns,
+                "scenario": opening.get("scenario", {}),
+                "headline": opening.get("headline"),
+            },
+        )
+        created_turns = create_turns(db=db, session=session, turns=turn_rows)
+        session.current_index = 1
+        update_session(db=db, session=session)
+
+    created_messages = [_message_from_turn(turn) for turn in created_turns]
+    return SimulationV1StartResponse(
+        sessionId=session.id,
+        projectId=session.project_id,
+        status=session.status,
+        maxTurns=payload.maxTurns,
+        turn=1,
+        messages=created_messages,
+    )
+
+
+# Sync SQLAlchemy work runs in worker threads via asyncio.to_thread so that only the
+# Gemini await stays on the event loop.
+async def start_simulation_v1(
+    db: Session,
+    user_id: int,
+    project_id: uuid.UUID,
+    payload: SimulationV1StartRequest,
+) -> SimulationV1StartResponse:
+    company_name, role_title = await asyncio.to_thread(
+        _load_project_fields, db, user_id, project_id
+    )
 
     opening = _fallback_opening(payload.role)
-    ai_payload = _call_gemini_json(
+    # The prompt is fully determined by role, company, position and scenarioId, so the same
+    # scenario is reused for identical starts instead of generating it again.
+    ai_payload = await _call_gemini_json(
         system_prompt=SCENARIO_SYSTEM_PROMPT,
         user_prompt=(
             f"직무: {payload.role}\n"
-            f"회사: {project.company_name}\n"
-            f"지원 포지션: {project.role_title}\n"
+            f"회사: {company_name}\n"
+            f"지원 포지션: {role_title}\n"
             f"scenarioId: {payload.scenarioId}\n"
             "서로 충돌하는 요구가 나타나는 상황을 만들어라."
         ),
+        call_site="simulation.scenario",
+        cache=True,
     )
     if isinstance(ai_payload, dict) and "openingMessages" in ai_payload:
         opening = ai_payload
 
-    session = create_session(
-        db=db,
-        project_id=project_id,
-        user_id=user_id,
-        session_type="JOB_SIMULATION",
-        total_items=payload.maxTurns,
-        meta={
-            "role": payload.role,
-            "scenarioId": payload.scenarioId,
-            "maxTurns": payload.maxTurns,
-            "scenario": opening.get("scenario", {}),
-            "headline": opening.get("headline"),
-        },
-    )
-
-    system_turn = create_turn(
-        db=db,
-        session=session,
-        role=SessionRole.SYSTEM.value,
-        speaker="시스템",
-        prompt=None,
-        user_answer=None,
-        message=str(opening.get("headline") or "직무 시뮬레이션을 시작합니다."),
-        intent="시뮬레이션 시작 안내",
-        feedback=None,
-        score=None,
-        score_delta=None,
-        meta={"scenario": opening.get("scenario", {})},
-        turn_index=1,
-    )
-
     opening_messages = opening.get("openingMessages") or []
-    created_messages = [_message_from_turn(system_turn)]
-    next_index = 2
+    turn_rows: list[dict[str, Any]] = [
+        {
+            "role": SessionRole.SYSTEM.value,
+            "speaker": "시스템",
+            "message": str(opening.get("headline") or "직무 시뮬레이션을 시작합니다."),
+            "intent": "시뮬레이션 시작 안내",
+            "meta": {"scenario": opening.get("scenario", {})},
+        }
+    ]
     for row in opening_messages[:3]:
-        npc_turn = create_turn(
-            db=db,
-            session=session,
-            role=SessionRole.NPC.value,
-            speaker=str(row.get("speaker", "기획자")),
-            prompt=None,
-            user_answer=None,
-            message=str(row.get("text", "")),
-            intent=str(row.get("intent", "압박 상황 제시")),
-            feedback=None,
-            score=None,
-            score_delta={"communication": 0, "stress": 0, "problemSolving": 0},
-            meta=None,
-            turn_index=next_index,
+        turn_rows.append(
+            {
+                "role": SessionRole.NPC.value,
+                "speaker": str(row.get("speaker", "기획자")),
+                "message": str(row.get("text", "")),
+                "intent": str(row.get("intent", "압박 상황 제시")),
+                "score_delta": {"communication": 0, "stress": 0, "problemSolving": 0},
+            }
         )
-        created_messages.append(_message_from_turn(npc_turn))
-        next_index += 1
 
-    session.current_index = 1
-    update_session(db=db, session=session)
-    return SimulationV1StartResponse(
-        sessionId=session.id,
-        projectId=session.project_id,
-        status=session.status,
-        maxTurns=payload.maxTurns,
-        turn=1,
-        messages=created_messages,
+    return await asyncio.to_thread(
+        _create_simulation, db, user_id, project_id, payload, opening, turn_rows
     )
 
 
@@ -382,96 +440,86 @@ def get_simulation_session_v1(
     )
 
 
-def append_simulation_turn_v1(
-    db: Session,
+async def _record_user_turn(
+    db: AsyncSession,
     user_id: int,
     session_id: uuid.UUID,
     text: str,
-) -> SimulationTurnResponse:
-    session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
+) -> tuple[Any, int, str]:
+    session = await aget_session_by_id(db=db, session_id=session_id, user_id=user_id)
     if session is None or session.session_type != "JOB_SIMULATION":
         raise NotFoundError("Simulation session not found")
     if session.status == "COMPLETED":
         raise ValueError("Simulation already completed")
 
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-    current_user_turn = _user_turn_count(turns) + 1
-    turn_index = get_next_turn_index(db=db, session_id=session.id)
-    create_turn(
-        db=db,
-        session=session,
-        role=SessionRole.USER.value,
-        speaker="나",
-        prompt=None,
-        user_answer=text,
-        message=text,
-        intent=None,
-        feedback=None,
-        score=None,
-        score_delta=None,
-        meta=None,
-        turn_index=turn_index,
-    )
-
-    pseudo_turn = {
-        "speaker": "나",
-        "role": "user",
-        "message": text,
-        "user_answer": text,
-        "prompt": None,
-    }
-    transcript_turns: list[Any] = list(turns) + [type("PseudoTurn", (), pseudo_turn)]
-    transcript = _build_transcript(transcript_turns)
-    ai_payload = _call_gemini_json(
-        system_prompt=TURN_SYSTEM_PROMPT,
-        user_prompt=(
-            f"시나리오: {(session.meta or {}).get('scenario', {})}\n"
-            f"현재 사용자 턴: {current_user_turn}\n"
-            f"대화 로그:\n{transcript}\n"
-            "사용자에게 스트레스를 주되 현실적인 업무 상황으로 메시지를 생성해라."
-        ),
-    )
-    response_payload = (
-        ai_payload
-        if isinstance(ai_payload, dict) and isinstance(ai_payload.get("messages"), list)
-        else _fallback_turn_reply(text=text, turn=current_user_turn)
-    )
-
-    tags = [str(item) for item in response_payload.get("tags", [])]
-    delta = _extract_score_delta(response_payload)
-    created_messages: list[SimulationMessage] = []
-    next_turn_index = turn_index + 1
-    for row in response_payload.get("messages", [])[:2]:
-        npc_turn = create_turn(
+    transcript = await aget_session_transcript(db=db, session=session)
+    current_user_turn = int(transcript.get("userTurns") or 0) + 1
+    async with async_unit_of_work(db):
+        await acreate_turn(
             db=db,
             session=session,
-            role=SessionRole.NPC.value,
-            speaker=str(row.get("speaker", "기획자")),
+            role=SessionRole.USER.value,
+            speaker="나",
             prompt=None,
-            user_answer=None,
-            message=str(row.get("text", "")),
-            intent=str(row.get("intent", "압박 질의")),
-            feedback=", ".join(tags),
+            user_answer=text,
+            message=text,
+            intent=None,
+            feedback=None,
             score=None,
-            score_delta=delta,
+            score_delta=None,
             meta=None,
-            turn_index=next_turn_index,
+            turn_index=await areserve_turn_indexes(db=db, session=session),
         )
-        created_messages.append(_message_from_turn(npc_turn))
-        next_turn_index += 1
+
+    transcript = session.transcript or {}
+    builder = PromptBuilder("simulation_turn", TURN_CONTEXT_BUDGET_TOKENS)
+    builder.add(
+        f"시나리오: {(session.meta or {}).get('scenario', {})}\n현재 사용자 턴: {current_user_turn}"
+    )
+    builder.add_turns(
+        [f"[{entry['speaker']}] {entry['text']}" for entry in transcript.get("window") or []],
+        title="대화 로그:",
+        summary=transcript.get("summary"),
+    )
+    builder.add("사용자에게 스트레스를 주되 현실적인 업무 상황으로 메시지를 생성해라.")
+    return session, current_user_turn, builder.build()
+
+
+async def _persist_npc_reply(
+    db: AsyncSession,
+    session,
+    response_payload: dict[str, Any],
+    current_user_turn: int,
+) -> SimulationTurnResponse:
+    tags = [str(item) for item in response_payload.get("tags", [])]
+    delta = _extract_score_delta(response_payload)
+    turn_rows = [
+        {
+            "role": SessionRole.NPC.value,
+            "speaker": str(row.get("speaker", "기획자")),
+            "message": str(row.get("text", "")),
+            "intent": str(row.get("intent", "압박 질의")),
+            "feedback": ", ".join(tags),
+            "score_delta": delta,
+        }
+        for row in response_payload.get("messages", [])[:2]
+    ]
 
     max_turns = session.total_items or 10
     done = current_user_turn >= max_turns or bool(response_payload.get("shouldFinish"))
-    session.current_index = current_user_turn + 1
-    if done:
-        session.status = "COMPLETED"
-        session.ended_at = datetime.now(tz=UTC)
-        if session.started_at:
-            session.duration_sec = int((session.ended_at - session.started_at).total_seconds())
-        final_turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-        session.result_json = _build_result_fallback(session=session, turns=final_turns)
-    update_session(db=db, session=session)
-
+    async with async_unit_of_work(db):
+        created_turns = await acreate_turns(db=db, session=session, turns=turn_rows)
+        session.current_index = current_user_turn + 1
+        if done:
+            session.status = "COMPLETED"
+            session.ended_at = datetime.now(tz=UTC)
+            if session.started_at:
+                session.duration_sec = int((session.ended_at - session.started_at).total_seconds())
+            final_turns = await alist_turns_by_session(db=db, session_id=session.id, desc=False)
+            session.result_json = _build_result_fallback(session=session, turns=final_turns)
+        await aupdate_session(db=db, session=session)
+
+    created_messages = [_message_from_turn(turn) for turn in created_turns]
     return SimulationTurnResponse(
         turn=current_user_turn,
         messagesAppended=created_messages,
@@ -485,32 +533,178 @@ def append_simulation_turn_v1(
     )
 
 
-def get_simulation_result_v1(
-    db: Session,
+async def append_simulation_turn_v1(
+    db: AsyncSession,
     user_id: int,
     session_id: uuid.UUID,
-) -> SimulationResultResponse:
+    text: str,
+) -> SimulationTurnResponse:
+    session, current_user_turn, user_prompt = await _record_user_turn(
+        db=db, user_id=user_id, session_id=session_id, text=text
+    )
+    ai_payload = await _call_gemini_json(
+        system_prompt=TURN_SYSTEM_PROMPT, user_prompt=user_prompt, call_site="simulation.turn"
+    )
+    response_payload = (
+        ai_payload
+        if isinstance(ai_payload, dict) and isinstance(ai_payload.get("messages"), list)
+        else _fallback_turn_reply(text=text, turn=current_user_turn)
+    )
+    return await _persist_npc_reply(
+        db=db,
+        session=session,
+        response_payload=response_payload,
+        current_user_turn=current_user_turn,
+    )
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _streamed_message(index: int, row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "index": index,
+        "role": SessionRole.NPC.value,
+        "speaker": str(row.get("speaker", "기획자")),
+        "text": str(row.get("text", "")),
+    }
+
+
+def _complete_stream_payload(raw_text: str, streamed: list[dict[str, Any]]) -> dict[str, Any]:
+    try:
+        parsed = json.loads(raw_text)
+    except json.JSONDecodeError:
+        metrics.increment("llm_json_parse_failures", call_site="simulation.turn_stream")
+        try:
+            parsed = json.loads(repair_truncated_json(raw_text))
+        except json.JSONDecodeError:
+            parsed = {}
+    payload = parsed if isinstance(parsed, dict) else {}
+    payload["messages"] = streamed
+    return payload
+
+
+async def _stream_turn_events(
+    user_id: int,
+    session_id: uuid.UUID,
+    text: str,
+    current_user_turn: int,
+    user_prompt: str,
+) -> AsyncIterator[str]:
+    settings = get_settings()
+    parser = PartialArrayParser("messages")
+    streamed: list[dict[str, Any]] = []
+    if settings.gemini_api_key:
+        try:
+            async for chunk in stream_text(
+                f"{TURN_SYSTEM_PROMPT}\n\n{user_prompt}",
+                model=settings.gemini_model,
+                api_key=settings.gemini_api_key,
+                json_mode=True,
+            ):
+                for row in parser.feed(chunk):
+                    if len(streamed) >= 2:
+                        continue
+                    streamed.append(row)
+                    yield _sse_event("message", _streamed_message(len(streamed) - 1, row))
+        except Exception:
+            # The turn still completes: the streamed prefix or the rule-based reply is saved.
+            logger.exception("Simulation turn stream failed for session %s", session_id)
+            yield _sse_event("error", {"detail": "AI response stream failed"})
+
+    if streamed:
+        response_payload = _complete_stream_payload(parser.text, streamed)
+    else:
+        response_payload = _fallback_turn_reply(text=text, turn=current_user_turn)
+        for index, row in enumerate(response_payload["messages"]):
+            yield _sse_event("message", _streamed_message(index, row))
+
+    async with get_async_session_local()() as db:
+        session = await aget_session_by_id(db=db, session_id=session_id, user_id=user_id)
+        if session is None:
+            yield _sse_event("error", {"detail": "Simulation session not found"})
+            return
+        result = await _persist_npc_reply(
+            db=db,
+            session=session,
+            response_payload=response_payload,
+            current_user_turn=current_user_turn,
+        )
+    yield _sse_event("done", result.model_dump(mode="json"))
+
+
+async def open_simulation_turn_stream(
+    db: AsyncSession,
+    user_id: int,
+    session_id: uuid.UUID,
+    text: str,
+) -> AsyncIterator[str]:
+    session, current_user_turn, user_prompt = await _record_user_turn(
+        db=db, user_id=user_id, session_id=session_id, text=text
+    )
+    return _stream_turn_events(
+        user_id=user_id,
+        session_id=session.id,
+        text=text,
+        current_user_turn=current_user_turn,
+        user_prompt=user_prompt,
+    )
+
+
+def _set_text(section: Any, text: str) -> None:
+    if isinstance(section, dict):
+        section["text"] = text
+
+
+def _load_result_inputs(
+    db: Session, user_id: int, session_id: uuid.UUID
+) -> tuple[UnifiedSession, list[str], str, dict[str, Any]]:
     session = get_session_by_id(db=db, session_id=session_id, user_id=user_id)
     if session is None or session.session_type != "JOB_SIMULATION":
         raise NotFoundError("Simulation session not found")
+    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
+    lines = _transcript_lines(turns)
+    fallback = _build_result_fallback(session=session, turns=turns)
     if not session.result_json:
-        turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-        session.result_json = _build_result_fallback(session=session, turns=turns)
+        session.result_json = fallback
         update_session(db=db, session=session)
+    return session, lines, _transcript_digest("\n".join(lines)), fallback
 
-    turns = list_turns_by_session(db=db, session_id=session.id, desc=False)
-    transcript = _build_transcript(turns)
-    ai_payload = _call_gemini_json(
+
+async def get_simulation_result_v1(
+    db: Session,
+    user_id: int,
+    session_id: uuid.UUID,
+) -> SimulationResultResponse:
+    session, lines, digest, fallback = await asyncio.to_thread(
+        _load_result_inputs, db, user_id, session_id
+    )
+    if _is_refined(session.result_json, digest):
+        return SimulationResultResponse(**(session.result_json or {}))
+
+    # Deep copy so refining never writes into the nested dicts of the persisted result, and
+    # fill sections an older stored result lacks from the rule-based fallback.
+    base_result = {
+        **fallback,
+        **{
+            key: copy.deepcopy(value)
+            for key, value in (session.result_json or {}).items()
+            if key not in _REFINEMENT_KEYS
+        },
+    }
+    builder = PromptBuilder("simulation_result", RESULT_CONTEXT_BUDGET_TOKENS)
+    builder.add(f"시나리오: {(session.meta or {}).get('scenario', {})}")
+    builder.add_turns(lines, priority=1, title="대화 로그:")
+    builder.add(f"기본결과: {base_result}\n기본결과를 참고해 더 정확한 리포트 값으로 보정해라.")
+    ai_payload = await _call_gemini_json(
         system_prompt=RESULT_SYSTEM_PROMPT,
-        user_prompt=(
-            f"시나리오: {(session.meta or {}).get('scenario', {})}\n"
-            f"대화 로그:\n{transcript}\n"
-            f"기본결과: {session.result_json}\n"
-            "기본결과를 참고해 더 정확한 리포트 값으로 보정해라."
-        ),
+        user_prompt=builder.build(),
+        call_site="simulation.result",
+        cache=True,
     )
     if isinstance(ai_payload, dict):
-        base = dict(session.result_json)
+        base = base_result
         fit = ai_payload.get("fitScorePercent")
         if isinstance(fit, (int, float)):
             base["fitScorePercent"] = max(1, min(100, int(fit)))
@@ -519,13 +713,14 @@ def get_simulation_result_v1(
             base["rankLabel"] = rank
         best = ai_payload.get("bestMomentText")
         if isinstance(best, str):
-            base["bestMoment"]["text"] = best
+            _set_text(base.get("bestMoment"), best)
         worst = ai_payload.get("worstMomentText")
         if isinstance(worst, str):
-            base["worstMoment"]["text"] = worst
+            _set_text(base.get("worstMoment"), worst)
         recommend = ai_payload.get("recommendText")
-        if isinstance(recommend, str):
-            base["recommendations"][0]["text"] = recommend
+        recommendations = base.get("recommendations")
+        if isinstance(recommend, str) and isinstance(recommendations, list) and recommendations:
+            _set_text(recommendations[0], recommend)
         durability = ai_payload.get("durability")
         if isinstance(durability, dict):
             base["durability"] = [
@@ -545,7 +740,9 @@ def get_simulation_result_v1(
                     "level": float(durability.get("feedback", 0.7)),
                 },
             ]
+        base["refinedAt"] = datetime.now(tz=UTC).isoformat()
+        base["transcriptDigest"] = digest
         session.result_json = base
-        update_session(db=db, session=session)
+        await asyncio.to_thread(update_session, db=db, session=session)
 
-    return SimulationResultResponse(**session.result_json)
+    return SimulationResultResponse(**(session.result_json or {}))
@@ -1,11 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.db.repositories.user_repository import aget_user_notion_key, update_user_notion_key
 from app.schemas.user_settings import UserSettingsResponse
 
-_USER_SETTINGS: dict[int, str] = {}
+
+def _mask_secret(value: str, visible: int = 4) -> str:
+    if len(value) <= visible * 2:
+        return "*" * len(value)
+    return "*" * (len(value) - visible) + value[-visible:]
 
 
 def save_notion_key(db: Session, user_id: int, notion_api_key: str) -> UserSettingsResponse:
-    del db  # TODO: replace in-memory store with DB-backed settings repository.
-    _USER_SETTINGS[user_id] = notion_api_key
-    return UserSettingsResponse(success=True, user_id=user_id, notion_api_key=notion_api_key)
+    update_user_notion_key(db=db, user_pk=user_id, notion_api_key=notion_api_key)
+    # The key is a live credential; only enough of it to recognise it is sent back.
+    return UserSettingsResponse(
+        success=True, user_id=user_id, notion_api_key=_mask_secret(notion_api_key)
+    )
+
+
+async def aget_notion_key(db: AsyncSession, user_id: int) -> str | None:
+    return await aget_user_notion_key(db=db, user_pk=user_id)
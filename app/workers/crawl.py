@@ -0,0 +1,37 @@
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+import app.db.entities as _entities  # noqa: F401
+from app.db.session import close_async_engine
+from app.services.crawl_job_service import run_crawl_worker
+from app.services.crawler import close_crawler
+
+logger = logging.getLogger(__name__)
+
+
+async def _serve() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    logger.info("Crawl worker %s started", worker_id)
+    try:
+        await run_crawl_worker(worker_id, stop)
+    finally:
+        await close_crawler()
+        await close_async_engine()
+        logger.info("Crawl worker %s stopped", worker_id)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+-- Optional Postgres tier for the content-addressed LLM response cache (LLM_CACHE_DB_ENABLED).
+-- Safe to run multiple times.
+
+create table if not exists public.llm_response_cache (
+  cache_key varchar(64) not null,
+  model varchar(100) not null,
+  response_text text not null,
+  expires_at timestamptz not null,
+  created_at timestamptz not null default now(),
+  constraint llm_response_cache_pkey primary key (cache_key)
+);
+
+create index if not exists ix_llm_response_cache_expires_at
+  on public.llm_response_cache (expires_at);
@@ -0,0 +1,23 @@
+-- Background report generation jobs (simulation result, deep interview guide/insight, analysis).
+-- Safe to run multiple times.
+
+create table if not exists public.report_jobs (
+  id uuid not null default uuid_generate_v4(),
+  user_id bigint not null,
+  session_id uuid not null,
+  job_type varchar(40) not null,
+  status varchar(20) not null default 'QUEUED',
+  attempts integer not null default 0,
+  result_json jsonb null,
+  error text null,
+  started_at timestamptz null,
+  finished_at timestamptz null,
+  created_at timestamptz not null default now(),
+  updated_at timestamptz not null default now(),
+  constraint report_jobs_pkey primary key (id)
+);
+
+create index if not exists ix_report_jobs_user_id on public.report_jobs (user_id);
+create index if not exists ix_report_jobs_session_id on public.report_jobs (session_id);
+create index if not exists ix_report_jobs_status_created
+  on public.report_jobs (status, created_at);
@@ -0,0 +1,15 @@
+-- Per-session turn counter, bumped with UPDATE ... RETURNING when turns are appended.
+-- Safe to run multiple times.
+
+alter table public.sessions
+  add column if not exists last_turn_index integer not null default 0;
+
+update public.sessions s
+set last_turn_index = t.max_turn_index
+from (
+  select session_id, max(turn_index) as max_turn_index
+  from public.session_turns
+  group by session_id
+) t
+where t.session_id = s.id
+  and s.last_turn_index < t.max_turn_index;
@@ -0,0 +1,38 @@
+-- Unique (session_id, turn_index) index; every turn read is "where session_id = ? order by turn_index".
+-- Duplicate indexes left by concurrent appends are renumbered first, keeping the original order.
+-- Safe to run multiple times.
+
+with ranked as (
+  select
+    id,
+    row_number() over (partition by session_id order by turn_index, created_at, id) as rn
+  from public.session_turns
+)
+update public.session_turns t
+set turn_index = ranked.rn
+from ranked
+where ranked.id = t.id
+  and t.turn_index <> ranked.rn
+  and exists (
+    select 1
+    from public.session_turns d
+    where d.session_id = t.session_id
+    group by d.session_id, d.turn_index
+    having count(*) > 1
+  );
+
+update public.sessions s
+set last_turn_index = t.max_turn_index
+from (
+  select session_id, max(turn_index) as max_turn_index
+  from public.session_turns
+  group by session_id
+) t
+where t.session_id = s.id
+  and s.last_turn_index < t.max_turn_index;
+
+create unique index if not exists ux_turns_session_turn_index
+  on public.session_turns (session_id, turn_index);
+
+drop index if exists public.ix_turns_session_order;
+drop index if exists public.ix_session_turns_session_id;
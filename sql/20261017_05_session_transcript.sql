@@ -0,0 +1,6 @@
+-- Rolling transcript (recent turn window + clipped summary of older turns) kept on each session.
+-- Sessions created before this column are seeded from session_turns on their next turn.
+-- Safe to run multiple times.
+
+alter table public.sessions
+  add column if not exists transcript jsonb null;
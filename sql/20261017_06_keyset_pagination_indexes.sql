@@ -0,0 +1,13 @@
+-- Keyset pagination for project and portfolio listings orders by (created_at desc, id desc)
+-- per user; these indexes let each page start at the cursor instead of scanning past an offset.
+-- Safe to run multiple times.
+
+create index if not exists ix_projects_user_created_id
+  on public.projects (user_id, created_at desc, id desc);
+
+create index if not exists ix_portfolios_user_created_id
+  on public.portfolios (user_id, created_at desc, id desc);
+
+create index if not exists ix_portfolios_project_created_id
+  on public.portfolios (project_id, created_at desc, id desc)
+  where project_id is not null;
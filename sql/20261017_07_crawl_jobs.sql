@@ -0,0 +1,28 @@
+-- Durable blog crawl queue, one row per portfolio; claimed by `python -m app.workers.crawl`
+-- with SELECT ... FOR UPDATE SKIP LOCKED and leased until lease_expires_at.
+-- Safe to run multiple times.
+
+create table if not exists public.crawl_jobs (
+  id uuid not null default uuid_generate_v4(),
+  user_id bigint not null,
+  portfolio_id bigint not null,
+  status varchar(20) not null default 'QUEUED',
+  attempts integer not null default 0,
+  next_run_at timestamptz not null default now(),
+  lease_expires_at timestamptz null,
+  locked_by varchar(100) null,
+  error text null,
+  finished_at timestamptz null,
+  created_at timestamptz not null default now(),
+  updated_at timestamptz not null default now(),
+  constraint crawl_jobs_pkey primary key (id)
+);
+
+create index if not exists ix_crawl_jobs_user_id on public.crawl_jobs (user_id);
+create index if not exists ix_crawl_jobs_portfolio_id on public.crawl_jobs (portfolio_id);
+create index if not exists ix_crawl_jobs_queued_next_run
+  on public.crawl_jobs (next_run_at)
+  where status = 'QUEUED';
+create index if not exists ix_crawl_jobs_running_lease
+  on public.crawl_jobs (lease_expires_at)
+  where status = 'RUNNING';
@@ -0,0 +1,18 @@
+-- At most one queued or running crawl job per portfolio; enqueue_crawl_jobs relies on this
+-- index for INSERT ... ON CONFLICT DO NOTHING. Older duplicates are closed out first.
+-- Safe to run multiple times.
+
+update public.crawl_jobs as dup
+set status = 'FAILED',
+    error = 'superseded by an earlier active job',
+    lease_expires_at = null,
+    finished_at = now()
+from public.crawl_jobs as kept
+where dup.portfolio_id = kept.portfolio_id
+  and dup.status in ('QUEUED', 'RUNNING')
+  and kept.status in ('QUEUED', 'RUNNING')
+  and (dup.created_at, dup.id) > (kept.created_at, kept.id);
+
+create unique index if not exists ux_crawl_jobs_active_portfolio
+  on public.crawl_jobs (portfolio_id)
+  where status in ('QUEUED', 'RUNNING');
@@ -0,0 +1,8 @@
+-- Per-user Notion integration token, read by the crawl worker when it syncs Notion
+-- portfolios (previously kept in API process memory only).
+-- The column holds a live credential in plaintext: keep it out of logs, exports and API
+-- responses (the settings endpoint only returns a masked value).
+-- Safe to run multiple times.
+
+alter table public.users
+  add column if not exists notion_api_key text null;
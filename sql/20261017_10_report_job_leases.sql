@@ -0,0 +1,18 @@
+-- Report jobs are leased like crawl jobs: workers extend lease_expires_at while a job runs,
+-- an expired lease lets another worker reclaim it, and the last attempt is failed instead.
+-- Safe to run multiple times.
+
+alter table public.report_jobs
+  add column if not exists lease_expires_at timestamptz null;
+
+alter table public.report_jobs
+  add column if not exists locked_by varchar(100) null;
+
+-- Jobs left RUNNING by the old startup-requeue scheme become reclaimable right away.
+update public.report_jobs
+set lease_expires_at = now()
+where status = 'RUNNING' and lease_expires_at is null;
+
+create index if not exists ix_report_jobs_running_lease
+  on public.report_jobs (lease_expires_at)
+  where status = 'RUNNING';
@@ -0,0 +1,46 @@
+"""Micro-benchmark for HTML-to-text extraction on the saved fixtures.
+
+Run with ``python -m tests.bench_html_extract``. ``baseline`` is the previous
+BeautifulSoup implementation; the other rows are the installed backends.
+"""
+
+import re
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.services.html_extract import available_backends
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+MAX_CHARS = 20000
+
+
+def _baseline(html: str, max_chars: int) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    text = re.sub(r"[ \t]+", " ", soup.get_text(separator="\n"))
+    return re.sub(r"\n{3,}", "\n\n", text).strip()[:max_chars]
+
+
+def _pages() -> dict[str, str]:
+    pages = {path.name: path.read_text(encoding="utf-8") for path in FIXTURES.glob("*.html")}
+    tistory = pages["tistory_post.html"]
+    head, _, rest = tistory.partition("<h3>배경</h3>")
+    body, _, tail = rest.partition("<pre>")
+    pages["long_tistory_post.html"] = f"{head}<h3>배경</h3>{body * 300}<pre>{tail}"
+    return dict(sorted(pages.items()))
+
+
+def main() -> None:
+    extractors = {"baseline": _baseline, **available_backends()}
+    for name, html in _pages().items():
+        print(f"{name} ({len(html.encode('utf-8')) // 1024} KiB)")
+        for label, extractor in extractors.items():
+            runs, total = timeit.Timer(lambda: extractor(html, MAX_CHARS)).autorange()
+            print(f"  {label:<10} {total / runs * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
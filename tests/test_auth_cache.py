@@ -0,0 +1,62 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import auth
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+
+def _token(**claims) -> HTTPAuthorizationCredentials:
+    settings = get_settings()
+    payload = {"sub": "tester", "exp": int(time.time()) + 60, **claims}
+    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_lookup(db, user_id):
+        calls.append(user_id)
+        return SimpleNamespace(id=42)
+
+    monkeypatch.setattr(auth, "_user_pk_cache", TTLCache(max_entries=8, ttl_sec=60))
+    monkeypatch.setattr(auth, "get_async_session_local", lambda: _FakeSession)
+    monkeypatch.setattr(auth, "aget_user_by_user_id", fake_lookup)
+    return calls
+
+
+def test_uid_claim_skips_user_lookup(lookups):
+    assert asyncio.run(auth.get_current_user_id(_token(uid=7))) == 7
+    assert lookups == []
+
+
+def test_legacy_token_lookup_is_cached(lookups):
+    assert asyncio.run(auth.get_current_user_id(_token())) == 42
+    assert asyncio.run(auth.get_current_user_id(_token())) == 42
+    assert lookups == ["tester"]
+
+
+def test_unknown_legacy_subject_is_rejected(lookups, monkeypatch):
+    async def missing_lookup(db, user_id):
+        return None
+
+    monkeypatch.setattr(auth, "aget_user_by_user_id", missing_lookup)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(auth.get_current_user_id(_token()))
+    assert exc_info.value.status_code == 401
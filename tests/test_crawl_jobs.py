@@ -0,0 +1,126 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities.crawl_job import CrawlJob
+from app.db.repositories.crawl_job_repository import (
+    _ENQUEUE_STMT,
+    _claimable_stmt,
+    afail_expired_crawl_jobs,
+)
+from app.services import crawl_job_service
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def rollback(self):
+        return None
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(rowcount=2)
+
+    async def commit(self):
+        self.committed = True
+
+
+def test_claim_skips_locked_rows_and_reclaims_expired_leases():
+    stmt = _claimable_stmt(datetime.now(tz=UTC), 8, 3)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "crawl_jobs.lease_expires_at <" in sql
+    assert "crawl_jobs.attempts <" in sql
+
+
+def test_expired_jobs_on_their_last_attempt_are_failed():
+    db = _RecordingSession()
+
+    assert asyncio.run(afail_expired_crawl_jobs(db, max_attempts=3)) == 2
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE crawl_jobs SET status=" in sql
+    assert "crawl_jobs.attempts >=" in sql
+    assert db.committed
+
+
+def test_enqueue_skips_portfolios_with_an_active_job():
+    sql = str(_ENQUEUE_STMT.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (portfolio_id) WHERE status in ('QUEUED', 'RUNNING') DO NOTHING" in sql
+
+
+def test_running_jobs_keep_their_lease_until_the_batch_ends(monkeypatch):
+    settings = crawl_job_service.get_settings()
+    monkeypatch.setattr(settings, "crawl_job_lease_sec", 3)
+    renewed: list[tuple[list, str, int]] = []
+
+    async def fake_renew(db, job_ids, worker_id, lease_sec):
+        renewed.append((job_ids, worker_id, lease_sec))
+        return len(job_ids)
+
+    async def slow_crawl(db, user_id, portfolio_ids):
+        await asyncio.sleep(2.5)
+        return {}
+
+    async def fake_notion_sync(db, user_id, portfolio_ids):
+        return {}
+
+    async def fake_complete(db, job):
+        return job
+
+    monkeypatch.setattr(crawl_job_service, "get_async_session_local", lambda: _FakeSession)
+    monkeypatch.setattr(crawl_job_service, "arenew_crawl_job_leases", fake_renew)
+    monkeypatch.setattr(crawl_job_service, "crawl_blog_portfolios", slow_crawl)
+    monkeypatch.setattr(crawl_job_service, "sync_notion_portfolios", fake_notion_sync)
+    monkeypatch.setattr(crawl_job_service, "acomplete_crawl_job", fake_complete)
+    job = CrawlJob(id=uuid.uuid4(), user_id=1, portfolio_id=1, attempts=1)
+
+    asyncio.run(crawl_job_service._run_user_jobs(1, [job], "worker-1"))
+
+    assert renewed == [([job.id], "worker-1", 3), ([job.id], "worker-1", 3)]
+
+
+def test_failed_jobs_are_retried_with_backoff_until_max_attempts(monkeypatch):
+    settings = crawl_job_service.get_settings()
+    monkeypatch.setattr(settings, "crawl_job_max_attempts", 3)
+    monkeypatch.setattr(settings, "crawl_job_retry_base_sec", 30)
+    outcomes: dict[int, tuple[str, int | None]] = {}
+
+    async def fake_crawl(db, user_id, portfolio_ids):
+        return {2: "timeout", 3: "404"}
+
+    async def fake_notion_sync(db, user_id, portfolio_ids):
+        return {}
+
+    async def fake_complete(db, job):
+        outcomes[job.portfolio_id] = ("done", None)
+
+    async def fake_fail(db, job, reason, retry_after_sec):
+        outcomes[job.portfolio_id] = (reason, retry_after_sec)
+
+    monkeypatch.setattr(crawl_job_service, "get_async_session_local", lambda: _FakeSession)
+    monkeypatch.setattr(crawl_job_service, "crawl_blog_portfolios", fake_crawl)
+    monkeypatch.setattr(crawl_job_service, "sync_notion_portfolios", fake_notion_sync)
+    monkeypatch.setattr(crawl_job_service, "acomplete_crawl_job", fake_complete)
+    monkeypatch.setattr(crawl_job_service, "afail_crawl_job", fake_fail)
+    jobs = [
+        CrawlJob(user_id=1, portfolio_id=1, attempts=1),
+        CrawlJob(user_id=1, portfolio_id=2, attempts=2),
+        CrawlJob(user_id=1, portfolio_id=3, attempts=3),
+    ]
+
+    asyncio.run(crawl_job_service._run_user_jobs(1, jobs, "worker-1"))
+
+    assert outcomes == {1: ("done", None), 2: ("timeout", 60), 3: ("404", None)}
@@ -0,0 +1,87 @@
+import asyncio
+from collections import Counter
+
+import httpx
+
+from app.services import crawler
+
+
+def _use_transport(monkeypatch, handler, per_host=1, total=8):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(crawler, "_client", client)
+    monkeypatch.setattr(crawler, "_global_slots", asyncio.Semaphore(total))
+    monkeypatch.setattr(crawler, "_host_slots", None)
+    monkeypatch.setattr(crawler.get_settings(), "crawl_per_host_concurrency", per_host)
+    monkeypatch.setattr(crawler.get_settings(), "crawl_max_concurrency", total)
+    return client
+
+
+def test_conditional_get_reports_not_modified(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<p>hi</p>", headers={"ETag": '"v1"'})
+
+    _use_transport(monkeypatch, handler)
+
+    async def run():
+        fresh = await crawler.fetch_page("https://blog.example/a")
+        again = await crawler.fetch_page("https://blog.example/a", etag=fresh.etag)
+        return fresh, again
+
+    fresh, again = asyncio.run(run())
+    assert (fresh.not_modified, fresh.text, fresh.etag) == (False, "<p>hi</p>", '"v1"')
+    assert again.not_modified and again.text is None and again.etag == '"v1"'
+
+
+def test_hosts_are_crawled_concurrently_within_per_host_limit(monkeypatch):
+    in_flight: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        peak["*"] = max(peak["*"], in_flight.total())
+        await asyncio.sleep(0.05)
+        in_flight[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    _use_transport(monkeypatch, handler, per_host=1)
+    urls = [f"https://{host}/{i}" for host in ("a.example", "b.example") for i in range(2)]
+
+    async def run():
+        return await asyncio.gather(*(crawler.fetch_page(url) for url in urls))
+
+    assert len(asyncio.run(run())) == 4
+    assert peak == {"a.example": 1, "b.example": 1, "*": 2}
+
+
+def test_host_slots_are_dropped_once_a_host_is_idle(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down.example":
+            return httpx.Response(500)
+        return httpx.Response(200, text="ok")
+
+    _use_transport(monkeypatch, handler, per_host=1)
+    urls = [f"https://host{i}.example/" for i in range(50)] + ["https://down.example/"]
+
+    async def run():
+        return await asyncio.gather(
+            *(crawler.fetch_page(url) for url in urls), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert isinstance(results[-1], httpx.HTTPStatusError)
+    assert crawler._host_slots == {}
+
+
+def test_response_body_is_capped_while_streaming(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"a" * 50_000)
+
+    _use_transport(monkeypatch, handler)
+    monkeypatch.setattr(crawler.get_settings(), "crawl_max_bytes", 1024)
+
+    result = asyncio.run(crawler.fetch_page("https://blog.example/big"))
+    assert result.text == "a" * 1024
@@ -0,0 +1,35 @@
+from app.core import metrics
+from app.db import session as db_session
+
+
+def test_prepared_statements_disabled_on_transaction_pooler(monkeypatch):
+    monkeypatch.setattr(db_session.settings, "db_transaction_pooling", None)
+    monkeypatch.setattr(db_session.settings, "db_prepare_threshold", 5)
+
+    pooled = db_session._engine_options("postgresql+psycopg://u:p@pooler.supabase.com:6543/db")
+    direct = db_session._engine_options("postgresql+psycopg://u:p@db.supabase.co:5432/db")
+
+    assert pooled["connect_args"] == {"prepare_threshold": None}
+    assert direct["connect_args"] == {"prepare_threshold": 5}
+
+
+def test_metered_pool_reports_checkout_wait_and_in_use():
+    metrics.reset()
+    pool = db_session._MeteredQueuePool(lambda: _FakeDBAPIConnection(), pool_size=2)
+    db_session._register_pool_gauges(pool, "test")
+
+    connection = pool.connect()
+    snapshot = metrics.snapshot()
+    assert snapshot["summaries"]["db_pool_checkout_wait_ms{pool=sync}"]["count"] == 1
+    assert snapshot["gauges"]["db_pool_in_use{pool=test}"] == 1
+
+    connection.close()
+    assert metrics.snapshot()["gauges"]["db_pool_in_use{pool=test}"] == 0
+
+
+class _FakeDBAPIConnection:
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,40 @@
+from fastapi.testclient import TestClient
+
+from app.core.auth import get_current_user_id
+from app.core.cache import TTLCache
+from app.db.session import get_async_db
+from app.main import app
+from app.schemas.home import CoachStatus, HomeResponse, HomeRoutine, HomeUserCard
+from app.services import home_service
+
+
+def test_home_is_served_from_snapshot_with_etag(monkeypatch):
+    builds: list[int] = []
+
+    async def fake_build(db, user_id):
+        builds.append(user_id)
+        return HomeResponse(
+            userCard=HomeUserCard(
+                userId=user_id, name=f"user-{len(builds)}", coachStatus=CoachStatus.COACHING
+            ),
+            projects=[],
+            routine=HomeRoutine(items=[]),
+        )
+
+    monkeypatch.setattr(home_service, "_snapshots", TTLCache(max_entries=8, ttl_sec=60))
+    monkeypatch.setattr(home_service, "get_home_data", fake_build)
+    monkeypatch.setitem(app.dependency_overrides, get_current_user_id, lambda: 7)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, lambda: None)
+    client = TestClient(app)
+
+    first = client.get("/v1/home")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert client.get("/v1/home", headers={"If-None-Match": etag}).status_code == 304
+    assert builds == [7]
+
+    home_service.invalidate_home_snapshot(7)
+    refreshed = client.get("/v1/home", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert refreshed.json()["userCard"]["name"] == "user-2"
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from app.services.html_extract import available_backends, extract_text
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def _assert_main_content(text: str) -> None:
+    assert "read-through 캐시" in text
+    assert "카테고리 3" not in text
+    assert "다른 글" not in text
+    assert "좋은 글 감사합니다" not in text
+    assert "tracking" not in text and "var a=1" not in text
+    assert "\n\n\n" not in text
+
+
+@pytest.mark.parametrize("backend", sorted(available_backends()))
+@pytest.mark.parametrize("fixture", ["tistory_post.html", "velog_post.html"])
+def test_extracts_main_content_without_page_chrome(backend, fixture):
+    text = extract_text((FIXTURES / fixture).read_text(encoding="utf-8"), 20000, backend=backend)
+    _assert_main_content(text)
+
+
+@pytest.mark.parametrize("backend", sorted(available_backends()))
+def test_extracts_pages_with_an_xml_encoding_prolog(backend):
+    html = (FIXTURES / "tistory_post.html").read_text(encoding="utf-8")
+    prolog = '<?xml version="1.0" encoding="euc-kr"?>\n'
+    _assert_main_content(extract_text(prolog + html, 20000, backend=backend))
+
+
+def test_extraction_is_capped():
+    html = "<article>" + "<p>가나다라마바사 아자차카타파하</p>" * 5000 + "</article>"
+    assert len(extract_text(html, 1000)) == 1000
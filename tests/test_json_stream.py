@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+import httpx
+
+from app.services import llm_gateway
+from app.services.json_stream import PartialArrayParser
+
+
+def test_partial_array_parser_emits_objects_as_they_close():
+    parser = PartialArrayParser("messages")
+    payload = json.dumps(
+        {
+            "messages": [
+                {"speaker": "기획자", "text": '중괄호 } 와 " 따옴표', "intent": "압박"},
+                {"speaker": "백엔드", "text": "두 번째", "intent": "질의"},
+            ],
+            "tags": [{"ignored": True}],
+        },
+        ensure_ascii=False,
+    )
+    chunks = [payload[i : i + 7] for i in range(0, len(payload), 7)]
+    emitted = [parser.feed(chunk) for chunk in chunks]
+
+    items = [item for batch in emitted for item in batch]
+    assert [item["speaker"] for item in items] == ["기획자", "백엔드"]
+    first_at = next(i for i, batch in enumerate(emitted) if batch)
+    assert first_at < len(chunks) - 1
+    assert parser.text == payload
+
+
+def test_stream_text_yields_sse_chunks(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith(":streamGenerateContent")
+        assert request.url.params["alt"] == "sse"
+        events = [
+            {"candidates": [{"content": {"parts": [{"text": part}]}}]}
+            for part in ['{"messages": [', '{"speaker": "PM"}]}']
+        ]
+        body = "".join(f"data: {json.dumps(event)}\r\n\r\n" for event in events)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    async def run() -> list[str]:
+        client = httpx.AsyncClient(
+            base_url=llm_gateway.GEMINI_BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(llm_gateway, "_async_client", client)
+        chunks = [chunk async for chunk in llm_gateway.stream_text("p", api_key="k")]
+        await llm_gateway.close_llm_gateway()
+        return chunks
+
+    assert asyncio.run(run()) == ['{"messages": [', '{"speaker": "PM"}]}']
@@ -0,0 +1,27 @@
+import time
+
+from app.core.cache import TTLCache
+from app.services.llm_cache import build_cache_key
+
+
+def test_cache_key_depends_on_every_part():
+    base = build_cache_key("models/gemini-2.5-flash", "system", "user", mode="json")
+    assert base == build_cache_key("models/gemini-2.5-flash", "system", "user", mode="json")
+    assert base != build_cache_key("models/gemini-2.5-pro", "system", "user", mode="json")
+    assert base != build_cache_key("models/gemini-2.5-flash", "system2", "user", mode="json")
+    assert base != build_cache_key("models/gemini-2.5-flash", "system", "user2", mode="json")
+    assert base != build_cache_key("models/gemini-2.5-flash", "system", "user", mode="text")
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    cache: TTLCache[str, str] = TTLCache(max_entries=2, ttl_sec=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    cache.set("short", "x", ttl_sec=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+
+from app.core import metrics
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.schemas.portfolio import PortfolioQuestionDraft
+from app.services import llm_cache, llm_gateway
+from app.services.gemini_client import GeminiClient
+from app.services.portfolio_llm_service import call_gemini
+
+
+def _gemini_response(request: httpx.Request) -> httpx.Response:
+    assert request.url.path == "/v1beta/models/gemini-2.5-flash:generateContent"
+    assert request.headers["x-goog-api-key"] == "test-key"
+    text = '{"question": "왜 SQL을 선택했나요?"}'
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+def test_generate_json_reuses_shared_pool(monkeypatch):
+    monkeypatch.setattr(get_settings(), "gemini_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "gemini_model", "models/gemini-2.5-flash")
+    transport = httpx.MockTransport(_gemini_response)
+
+    async def run() -> None:
+        shared = httpx.AsyncClient(base_url=llm_gateway.GEMINI_BASE_URL, transport=transport)
+        monkeypatch.setattr(llm_gateway, "_async_client", shared)
+        first = await GeminiClient().generate_json("system", "user")
+        second = await GeminiClient().generate_json("system", "user")
+        assert first == second == {"question": "왜 SQL을 선택했나요?"}
+        assert llm_gateway.get_async_http_client() is shared
+        await llm_gateway.close_llm_gateway()
+        assert shared.is_closed
+
+    asyncio.run(run())
+
+
+def test_call_gemini_goes_through_gateway(monkeypatch):
+    shared = httpx.Client(
+        base_url=llm_gateway.GEMINI_BASE_URL,
+        transport=httpx.MockTransport(_gemini_response),
+    )
+    monkeypatch.setattr(llm_gateway, "_sync_client", shared)
+
+    text = call_gemini("prompt", "gemini-2.5-flash", "test-key")
+
+    assert text == '{"question": "왜 SQL을 선택했나요?"}'
+    assert llm_gateway.get_sync_http_client() is shared
+
+
+def test_generate_json_sends_schema_and_repairs_truncated_output(monkeypatch):
+    monkeypatch.setattr(get_settings(), "gemini_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "gemini_model", "models/gemini-2.5-flash")
+    metrics.reset()
+    sent: list[dict] = []
+
+    def truncated_response(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        text = '{"question": "배포 전략을 설명해 주세요", "message": "중간에 끊긴'
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+    shared = httpx.Client(
+        base_url=llm_gateway.GEMINI_BASE_URL,
+        transport=httpx.MockTransport(truncated_response),
+    )
+    monkeypatch.setattr(llm_gateway, "_sync_client", shared)
+
+    draft = GeminiClient().generate_json_sync(
+        "", "repair me", schema=PortfolioQuestionDraft, call_site="test"
+    )
+
+    assert draft.question == "배포 전략을 설명해 주세요"
+    assert draft.message == "중간에 끊긴"
+    schema = sent[0]["generationConfig"]["responseSchema"]
+    assert schema["type"] == "OBJECT"
+    assert schema["properties"]["question"] == {"type": "STRING", "nullable": True}
+    counters = metrics.snapshot()["counters"]
+    assert counters["llm_json_parse_failures{call_site=test}"] == 1
+    assert counters["llm_json_repaired{call_site=test}"] == 1
+
+
+def test_generate_json_caches_only_when_requested(monkeypatch):
+    monkeypatch.setattr(get_settings(), "gemini_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "gemini_model", "models/gemini-2.5-flash")
+    monkeypatch.setattr(llm_cache, "_memory_cache", TTLCache(max_entries=8, ttl_sec=60))
+    calls: list[httpx.Request] = []
+
+    def counting_response(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return _gemini_response(request)
+
+    async def run() -> None:
+        shared = httpx.AsyncClient(
+            base_url=llm_gateway.GEMINI_BASE_URL, transport=httpx.MockTransport(counting_response)
+        )
+        monkeypatch.setattr(llm_gateway, "_async_client", shared)
+        await GeminiClient().generate_json("system", "turn")
+        await GeminiClient().generate_json("system", "turn")
+        assert len(calls) == 2
+        await GeminiClient().generate_json("system", "report", cache=True)
+        await GeminiClient().generate_json("system", "report", cache=True)
+        assert len(calls) == 3
+        await llm_gateway.close_llm_gateway()
+
+    asyncio.run(run())
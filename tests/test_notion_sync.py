@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from notion_client import AsyncClient
+
+from app.services.notion_sync_service import fetch_notion_text, parse_notion_page_id
+
+ROOT = "11111111-1111-1111-1111-111111111111"
+CHILD = "22222222-2222-2222-2222-222222222222"
+
+
+def _text(value: str) -> list[dict]:
+    return [{"type": "text", "plain_text": value}]
+
+
+def _block(block_id: str, block_type: str, value: str = "", has_children: bool = False) -> dict:
+    body = {"title": value} if block_type == "child_page" else {"rich_text": _text(value)}
+    return {
+        "object": "block",
+        "id": block_id,
+        "type": block_type,
+        "has_children": has_children,
+        block_type: body,
+    }
+
+
+class FakeNotion:
+    def __init__(self) -> None:
+        self.pages = {
+            ROOT: {"title": "포트폴리오", "edited": "2026-10-01T00:00:00.000Z"},
+            CHILD: {"title": "프로젝트 A", "edited": "2026-10-01T00:00:00.000Z"},
+        }
+        self.children = {
+            ROOT: [
+                _block("b1", "heading_2", "소개"),
+                _block("b2", "paragraph", "백엔드 개발자입니다."),
+                _block("b3", "toggle", "기술 스택", has_children=True),
+                _block(CHILD, "child_page", "프로젝트 A"),
+                _block("b4", "paragraph", "연락처"),
+            ],
+            "b3": [
+                _block("b3-1", "bulleted_list_item", "FastAPI"),
+                _block("b3-2", "bulleted_list_item", "PostgreSQL", has_children=True),
+            ],
+            "b3-2": [_block("b3-2-1", "paragraph", "keyset pagination")],
+            CHILD: [_block("c1", "paragraph", "동시성 제어 경험")],
+        }
+        self.requests: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def handle(self, path: str, query: dict[str, list[str]]) -> tuple[int, dict]:
+        parts = path.strip("/").split("/")
+        with self.lock:
+            self.requests[path] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.02)
+            if parts[:2] == ["v1", "pages"] and parts[2] in self.pages:
+                page = self.pages[parts[2]]
+                return 200, {
+                    "object": "page",
+                    "id": parts[2],
+                    "last_edited_time": page["edited"],
+                    "properties": {"title": {"type": "title", "title": _text(page["title"])}},
+                }
+            if parts[:2] == ["v1", "blocks"] and parts[3] == "children":
+                blocks = self.children.get(parts[2], [])
+                start = int(query.get("start_cursor", ["0"])[0])
+                end = start + 2
+                return 200, {
+                    "object": "list",
+                    "results": blocks[start:end],
+                    "has_more": end < len(blocks),
+                    "next_cursor": str(end) if end < len(blocks) else None,
+                }
+            return 404, {"object": "error", "status": 404, "code": "object_not_found"}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_notion():
+    fake = FakeNotion()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            status, body = fake.handle(parsed.path, parse_qs(parsed.query))
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.base_url = f"http://127.0.0.1:{server.server_port}"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+def _sync(fake: FakeNotion, **kwargs):
+    async def run():
+        client = AsyncClient(auth="secret", base_url=fake.base_url)
+        try:
+            return await fetch_notion_text(client, ROOT, concurrency=2, **kwargs)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_parse_notion_page_id():
+    page_id = "0123456789abcdef0123456789abcdef"
+    expected = "01234567-89ab-cdef-0123-456789abcdef"
+    assert parse_notion_page_id(f"https://www.notion.so/me/Portfolio-{page_id}") == expected
+    assert parse_notion_page_id(f"https://me.notion.site/{expected}/") == expected
+    assert parse_notion_page_id(f"https://www.notion.so/me/db?v=1&p={page_id}") == expected
+    assert parse_notion_page_id("https://www.notion.so/me/Portfolio") is None
+
+
+def test_fetch_notion_text_walks_block_tree(fake_notion):
+    result = _sync(fake_notion)
+
+    assert result.text.split("\n") == [
+        "포트폴리오",
+        "소개",
+        "백엔드 개발자입니다.",
+        "기술 스택",
+        "FastAPI",
+        "PostgreSQL",
+        "keyset pagination",
+        "연락처",
+        "",
+        "프로젝트 A",
+        "동시성 제어 경험",
+    ]
+    assert result.fetched_pages == 2
+    assert result.pages[ROOT]["children"] == [CHILD]
+    assert fake_notion.max_in_flight <= 2
+
+
+def test_fetch_notion_text_refetches_only_changed_pages(fake_notion):
+    first = _sync(fake_notion)
+    fake_notion.requests.clear()
+    fake_notion.pages[CHILD]["edited"] = "2026-10-02T00:00:00.000Z"
+    fake_notion.children[CHILD] = [_block("c1", "paragraph", "분산 락 설계 경험")]
+
+    second = _sync(fake_notion, previous_pages=first.pages, previous_text=first.text)
+
+    assert second.reused_pages == 1
+    assert second.fetched_pages == 1
+    assert f"/v1/blocks/{ROOT}/children" not in fake_notion.requests
+    assert fake_notion.requests[f"/v1/blocks/{CHILD}/children"] == 1
+    assert second.text.endswith("프로젝트 A\n분산 락 설계 경험")
+    assert second.text.startswith(first.text.split("\n\n")[0])
+
+
+def test_fetch_notion_text_caps_pages(fake_notion):
+    result = _sync(fake_notion, max_pages=1)
+
+    assert result.truncated is True
+    assert list(result.pages) == [ROOT]
+    assert "프로젝트 A" not in result.text
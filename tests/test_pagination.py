@@ -0,0 +1,43 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities.project import Project
+from app.db.pagination import Keyset, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    created_at = datetime(2026, 10, 17, 9, 30, tzinfo=UTC)
+    project_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, project_id)
+    assert decode_cursor(cursor, uuid.UUID) == (created_at, project_id)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", uuid.UUID)
+
+
+def test_keyset_page_counts_first_page_and_seeks_after_cursor():
+    first = Keyset(Project.created_at, Project.id, limit=2)
+    sql = str(first.apply(select(Project)).compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER ()" in sql
+    assert "OFFSET" not in sql
+
+    rows = [
+        (SimpleNamespace(created_at=datetime(2026, 10, day, tzinfo=UTC), id=uuid.uuid4()), 5)
+        for day in (3, 2, 1)
+    ]
+    page = first.page(rows)
+    assert page.total == 5
+    assert len(page.items) == 2
+
+    after = Keyset.from_cursor(
+        Project.created_at, Project.id, uuid.UUID, limit=2, cursor=page.next_cursor
+    )
+    assert after.after == (rows[1][0].created_at, rows[1][0].id)
+    sql = str(after.apply(select(Project)).compile(dialect=postgresql.dialect()))
+    assert "(projects.created_at, projects.id) <" in sql
+    assert "OVER" not in sql
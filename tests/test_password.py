@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from app.core import password
+from app.core.config import get_settings
+from app.core.errors import OverloadedError
+
+
+def test_offloaded_hash_round_trips(monkeypatch):
+    monkeypatch.setattr(get_settings(), "password_hash_workers", 1)
+
+    async def run() -> tuple[bool, bool]:
+        hashed = await password.ahash_password("s3cret!")
+        return (
+            await password.averify_password("s3cret!", hashed),
+            await password.averify_password("wrong", hashed),
+        )
+
+    try:
+        assert asyncio.run(run()) == (True, False)
+    finally:
+        password.close_password_hasher()
+
+
+def test_full_queue_sheds_load(monkeypatch):
+    monkeypatch.setattr(get_settings(), "password_hash_max_pending", 1)
+    monkeypatch.setattr(password, "_pending", 1)
+
+    with pytest.raises(OverloadedError):
+        asyncio.run(password.ahash_password("s3cret!"))
@@ -0,0 +1,149 @@
+import asyncio
+import io
+import time
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from app.services import pdf_extract
+
+
+def _build_pdf(pages: list[str]) -> bytes:
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    out += f"startxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def _slow_page(path: str, stamp: tuple[int, int], index: int) -> str:
+    if index == 1:
+        time.sleep(30)
+    return f"fast {index}"
+
+
+def _stuck_or_slow_page(path: str, stamp: tuple[int, int], index: int) -> str:
+    time.sleep(30 if "stuck" in path else 1.5)
+    return f"page {index}"
+
+
+@pytest.fixture
+def pdf_settings(monkeypatch):
+    settings = pdf_extract.get_settings()
+    monkeypatch.setattr(settings, "pdf_extract_workers", 2)
+    monkeypatch.setattr(settings, "pdf_extract_max_pools", 2)
+    monkeypatch.setattr(settings, "pdf_page_timeout_sec", 10.0)
+    monkeypatch.setattr(settings, "pdf_max_pages", 50)
+    yield settings
+    pdf_extract.close_pdf_extractor()
+
+
+def test_spool_upload_rejects_oversized_files(tmp_path):
+    upload = UploadFile(io.BytesIO(b"x" * 2048), filename="big.pdf")
+    with pytest.raises(ValueError):
+        asyncio.run(pdf_extract.spool_upload(upload, max_bytes=1024))
+
+    upload = UploadFile(io.BytesIO(b"%PDF-1.4"), filename="small.pdf")
+    path = asyncio.run(pdf_extract.spool_upload(upload, max_bytes=1024))
+    try:
+        assert path.read_bytes() == b"%PDF-1.4"
+    finally:
+        path.unlink()
+
+
+def test_extract_pdf_text_caps_pages(tmp_path, pdf_settings):
+    pdf_settings.pdf_max_pages = 3
+    path = tmp_path / "portfolio.pdf"
+    path.write_bytes(_build_pdf([f"page {index}" for index in range(5)]))
+
+    result = asyncio.run(pdf_extract.extract_pdf_text(path, max_chars=1000))
+
+    assert result.page_count == 5
+    assert result.pages_read == 3
+    assert result.truncated is True
+    assert result.text.split() == ["page", "0", "page", "1", "page", "2"]
+
+
+def test_extract_pdf_text_skips_pages_that_time_out(tmp_path, monkeypatch, pdf_settings):
+    pdf_settings.pdf_page_timeout_sec = 1.0
+    monkeypatch.setattr(pdf_extract, "_extract_page", _slow_page)
+    path = tmp_path / "portfolio.pdf"
+    path.write_bytes(_build_pdf(["a", "b", "c"]))
+
+    result = asyncio.run(pdf_extract.extract_pdf_text(path, max_chars=1000))
+
+    assert result.timed_out_pages == [2]
+    assert result.failed_pages == []
+    assert result.text.split() == ["fast", "0", "fast", "2"]
+
+
+def test_page_timeout_does_not_break_other_extractions(tmp_path, monkeypatch, pdf_settings):
+    pdf_settings.pdf_page_timeout_sec = 2.0
+    monkeypatch.setattr(pdf_extract, "_extract_page", _stuck_or_slow_page)
+    stuck = tmp_path / "stuck.pdf"
+    stuck.write_bytes(_build_pdf(["a"]))
+    healthy = tmp_path / "healthy.pdf"
+    healthy.write_bytes(_build_pdf(["a", "b", "c"]))
+
+    async def run():
+        return await asyncio.gather(
+            pdf_extract.extract_pdf_text(stuck, max_chars=1000),
+            pdf_extract.extract_pdf_text(healthy, max_chars=1000),
+        )
+
+    stuck_result, healthy_result = asyncio.run(run())
+
+    assert stuck_result.timed_out_pages == [1]
+    assert healthy_result.timed_out_pages == []
+    assert healthy_result.failed_pages == []
+    assert healthy_result.text.split() == ["page", "0", "page", "1", "page", "2"]
+
+
+def test_concurrent_extractions_share_a_bounded_set_of_pools(tmp_path, monkeypatch, pdf_settings):
+    pdf_settings.pdf_extract_max_pools = 1
+    created = []
+    new_executor = pdf_extract._new_executor
+
+    def counting_new_executor():
+        created.append(new_executor())
+        return created[-1]
+
+    monkeypatch.setattr(pdf_extract, "_new_executor", counting_new_executor)
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"portfolio-{index}.pdf"
+        path.write_bytes(_build_pdf([f"doc {index}"]))
+        paths.append(path)
+
+    async def run():
+        return await asyncio.gather(
+            *(pdf_extract.extract_pdf_text(path, max_chars=1000) for path in paths)
+        )
+
+    results = asyncio.run(run())
+
+    assert [result.text for result in results] == ["doc 0", "doc 1", "doc 2"]
+    assert len(created) == 1
@@ -0,0 +1,23 @@
+import uuid
+
+from app.services import project_context_service
+
+
+def test_project_context_header_is_cached_until_invalidated(monkeypatch):
+    calls: list[uuid.UUID] = []
+
+    def fake_build(db, user_id, project_id):
+        calls.append(project_id)
+        return f"header-{len(calls)}"
+
+    monkeypatch.setattr(project_context_service, "_build_project_context_header", fake_build)
+    project_id = uuid.uuid4()
+
+    first = project_context_service.get_project_context_header(None, 7, project_id)
+    second = project_context_service.get_project_context_header(None, 7, project_id)
+    assert first == second == "header-1"
+    assert len(calls) == 1
+
+    project_context_service.invalidate_project_context(7)
+    assert project_context_service.get_project_context_header(None, 7, project_id) == "header-2"
+    assert len(calls) == 2
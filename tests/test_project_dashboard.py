@@ -0,0 +1,54 @@
+import asyncio
+import uuid
+from datetime import UTC, date, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities.project import PortfolioItem, Project, ProjectPortfolio
+from app.db.repositories.project_dashboard_repository import _dashboard_stmt
+from app.services.projects_v1_service import get_project_dashboard
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeDb:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _FakeResult(self.rows)
+
+
+def test_dashboard_statement_uses_lateral_joins():
+    sql = str(_dashboard_stmt(uuid.uuid4(), 1).compile(dialect=postgresql.dialect()))
+    assert sql.count("LEFT OUTER JOIN LATERAL") == 3
+    assert "count(*) OVER ()" in sql
+
+
+def test_dashboard_is_built_from_one_round_trip():
+    now = datetime(2026, 10, 1, tzinfo=UTC)
+    project = Project(
+        id=uuid.uuid4(), user_id=1, company_name="A사", role_title="백엔드", created_at=now
+    )
+    mock_id = uuid.uuid4()
+    head = (project, None, None, None, None, mock_id, "COMPLETED", {"overall": 80}, 3, None)
+    item = PortfolioItem(id=uuid.uuid4(), user_id=1, title="P", period_start=date(2025, 1, 1))
+    link = ProjectPortfolio(role_type="MAIN", is_representative=True)
+    db = _FakeDb([(*head, link, item), (*head, ProjectPortfolio(), None)])
+
+    dashboard = asyncio.run(get_project_dashboard(db=db, user_id=1, project_id=project.id))
+
+    assert len(db.statements) == 1
+    assert dashboard.resume.exists is False
+    assert dashboard.mockInterview.latestSessionId == mock_id
+    assert dashboard.mockInterview.sessionCount == 3
+    assert [p.portfolioId for p in dashboard.portfolios] == [item.id]
+    assert dashboard.simulation.completed is False
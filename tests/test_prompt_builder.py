@@ -0,0 +1,34 @@
+from app.core import metrics
+from app.services.prompt_builder import PromptBuilder, estimate_tokens, truncate_to_tokens
+
+
+def test_estimate_tokens_weights_hangul_heavier_than_ascii():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가" * 10) == 8
+
+
+def test_truncate_keeps_head_or_tail_within_budget():
+    text = "".join(f"line{i}\n" for i in range(200))
+    head = truncate_to_tokens(text, 50)
+    tail = truncate_to_tokens(text, 50, keep="tail")
+    assert estimate_tokens(head) <= 50 and head.startswith("line0")
+    assert estimate_tokens(tail) <= 50 and tail.rstrip().endswith("line199")
+
+
+def test_builder_drops_low_priority_sections_first_and_reports_tokens():
+    metrics.reset()
+    builder = PromptBuilder("test_site", budget_tokens=200)
+    builder.add("지시문", priority=0)
+    builder.add("x" * 4000, priority=2, title="참고 자료")
+    builder.add_turns([f"turn {i} " + "y" * 300 for i in range(10)], priority=1, keep_recent=2)
+
+    prompt = builder.build()
+
+    assert prompt.startswith("지시문")
+    assert "turn 9" in prompt
+    assert "참고 자료" not in prompt
+    assert builder.tokens <= 200
+    snapshot = metrics.snapshot()
+    assert snapshot["summaries"]["prompt_tokens{call_site=test_site}"]["last"] == builder.tokens
+    assert snapshot["counters"]["prompt_truncated_sections{call_site=test_site}"] == 2
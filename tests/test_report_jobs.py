@@ -0,0 +1,85 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.repositories.report_job_repository import _claimable_stmt
+from app.schemas.report_job import ReportJobResponse, ReportJobStatus, ReportJobType
+from app.services import report_job_service
+
+
+def _snapshot(job_id: uuid.UUID, status: ReportJobStatus) -> ReportJobResponse:
+    return ReportJobResponse(
+        jobId=job_id,
+        jobType=ReportJobType.SIMULATION_RESULT,
+        sessionId=uuid.uuid4(),
+        status=status,
+        attempts=1,
+        result={"ok": True} if status == ReportJobStatus.SUCCEEDED else None,
+        createdAt=datetime.now(tz=UTC),
+        statusUrl=f"/v1/report-jobs/{job_id}",
+        eventsUrl=f"/v1/report-jobs/{job_id}/events",
+    )
+
+
+def test_event_stream_emits_status_changes_until_terminal(monkeypatch):
+    job_id = uuid.uuid4()
+    statuses = iter(
+        [
+            ReportJobStatus.QUEUED,
+            ReportJobStatus.RUNNING,
+            ReportJobStatus.RUNNING,
+            ReportJobStatus.SUCCEEDED,
+        ]
+    )
+    monkeypatch.setattr(
+        report_job_service,
+        "_load_job_snapshot",
+        lambda user_id, requested_id: _snapshot(requested_id, next(statuses)),
+    )
+    monkeypatch.setattr(report_job_service.get_settings(), "report_job_poll_interval_sec", 0)
+
+    async def collect() -> list[str]:
+        return [event async for event in report_job_service.stream_report_job_events(1, job_id)]
+
+    events = asyncio.run(collect())
+    assert len(events) == 3
+    assert all(event.startswith("event: status\n") for event in events)
+    assert '"status": "SUCCEEDED"' in events[-1]
+
+
+def test_expired_leases_are_reclaimed_only_while_attempts_remain():
+    sql = str(_claimable_stmt(datetime.now(tz=UTC), 2).compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "report_jobs.lease_expires_at <" in sql
+    assert "report_jobs.attempts <" in sql
+
+
+def test_worker_survives_a_job_that_cannot_be_finished(monkeypatch):
+    claims = iter([(uuid.uuid4(), 1, uuid.uuid4(), "SIMULATION_RESULT"), None])
+    finished: list[uuid.UUID] = []
+
+    def fake_claim(worker_id):
+        claim = next(claims, None)
+        if claim is None:
+            wakeup.set()
+        return claim
+
+    async def broken_run(worker_id, job_id, user_id, session_id, job_type):
+        finished.append(job_id)
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(report_job_service, "_claim_job", fake_claim)
+    monkeypatch.setattr(report_job_service, "_run_job", broken_run)
+    monkeypatch.setattr(report_job_service.get_settings(), "report_job_poll_interval_sec", 0.01)
+    wakeup = asyncio.Event()
+
+    async def run() -> None:
+        task = asyncio.create_task(report_job_service._worker_loop(asyncio.Event(), "w-1"))
+        await asyncio.wait_for(wakeup.wait(), timeout=2)
+        assert not task.done()
+        task.cancel()
+
+    asyncio.run(run())
+    assert len(finished) == 1
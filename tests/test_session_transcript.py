@@ -0,0 +1,42 @@
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities.session_v2 import UnifiedSession
+from app.db.repositories.session_repository import (
+    _TRANSCRIPT_WINDOW,
+    _append_transcript,
+    _transcript_lock_stmt,
+)
+
+
+def _turn(index: int, role: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        role=role,
+        speaker="나" if role == "user" else "기획자",
+        message=f"message {index}",
+        user_answer=None,
+        prompt=None,
+    )
+
+
+def test_rolling_transcript_keeps_bounded_window_and_summary():
+    session = UnifiedSession(transcript={})
+    total = _TRANSCRIPT_WINDOW + 5
+    for index in range(total):
+        _append_transcript(session, [_turn(index, "user" if index % 2 else "npc")])
+
+    transcript = session.transcript
+    assert transcript["turnCount"] == total
+    assert transcript["userTurns"] == total // 2
+    assert len(transcript["window"]) == _TRANSCRIPT_WINDOW
+    assert transcript["window"][-1]["text"] == f"message {total - 1}"
+    assert transcript["summary"].splitlines()[0] == "[기획자] message 0"
+    assert "message 5" not in transcript["summary"]
+
+
+def test_transcript_is_reread_under_row_lock():
+    sql = str(_transcript_lock_stmt(uuid.uuid4()).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT sessions.transcript")
+    assert sql.endswith("FOR UPDATE")
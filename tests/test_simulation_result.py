@@ -0,0 +1,71 @@
+import asyncio
+import copy
+import uuid
+from types import SimpleNamespace
+
+from app.services import simulation_v1_service
+
+
+def _install(monkeypatch, session, payload):
+    saved = []
+
+    async def fake_call(**kwargs):
+        return payload
+
+    monkeypatch.setattr(
+        simulation_v1_service, "get_session_by_id", lambda db, session_id, user_id: session
+    )
+    monkeypatch.setattr(simulation_v1_service, "list_turns_by_session", lambda **kwargs: [])
+    monkeypatch.setattr(
+        simulation_v1_service,
+        "update_session",
+        lambda db, session: saved.append(copy.deepcopy(session.result_json)),
+    )
+    monkeypatch.setattr(simulation_v1_service, "_call_gemini_json", fake_call)
+    return saved
+
+
+def _session(result_json):
+    return SimpleNamespace(
+        id=uuid.uuid4(), session_type="JOB_SIMULATION", meta={}, result_json=result_json
+    )
+
+
+def test_refinement_does_not_mutate_the_stored_result(monkeypatch):
+    session = _session(None)
+    session.result_json = simulation_v1_service._build_result_fallback(session=session, turns=[])
+    stored = session.result_json
+    original_best = stored["bestMoment"]["text"]
+    _install(monkeypatch, session, {"bestMomentText": "refined", "recommendText": "next"})
+
+    result = asyncio.run(
+        simulation_v1_service.get_simulation_result_v1(db=None, user_id=1, session_id=session.id)
+    )
+
+    assert result.bestMoment["text"] == "refined"
+    assert result.recommendations[0]["text"] == "next"
+    assert stored["bestMoment"]["text"] == original_best
+    assert session.result_json is not stored
+
+
+def test_refinement_tolerates_missing_sections(monkeypatch):
+    session = _session(None)
+    session.result_json = {
+        "sessionId": str(session.id),
+        "fitScorePercent": 50,
+        "recommendations": [],
+    }
+    saved = _install(
+        monkeypatch,
+        session,
+        {"bestMomentText": "best", "worstMomentText": "worst", "recommendText": "next"},
+    )
+
+    result = asyncio.run(
+        simulation_v1_service.get_simulation_result_v1(db=None, user_id=1, session_id=session.id)
+    )
+
+    assert result.bestMoment["text"] == "best"
+    assert result.worstMoment["text"] == "worst"
+    assert result.recommendations == []
+    assert saved[-1]["transcriptDigest"]
@@ -0,0 +1,18 @@
+from app.services import user_settings_service
+
+
+def test_saved_notion_key_is_masked_in_the_response(monkeypatch):
+    saved: list[str] = []
+    monkeypatch.setattr(
+        user_settings_service,
+        "update_user_notion_key",
+        lambda db, user_pk, notion_api_key: saved.append(notion_api_key),
+    )
+
+    response = user_settings_service.save_notion_key(
+        db=None, user_id=1, notion_api_key="secret_abcdefghijklmnop"
+    )
+
+    assert saved == ["secret_abcdefghijklmnop"]
+    assert response.notion_api_key == "*******************mnop"
+    assert user_settings_service._mask_secret("short") == "*****"